@@ -0,0 +1,112 @@
+import os
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def subsystem(filename):
+    """Module an allocation site belongs to: the repo path without ``.py``
+    (``core/background_manager``), else ``pygame`` or ``python``."""
+    if filename.startswith("<"):
+        return "python"  # Frozen stdlib modules
+    path = os.path.abspath(filename)
+    if path.startswith(ROOT + os.sep):
+        return os.path.splitext(os.path.relpath(path, ROOT))[0].replace(os.sep, "/")
+    return "pygame" if f"{os.sep}pygame{os.sep}" in path else "python"
+
+
+class AllocationTracker:
+    """Python heap allocations per frame and per subsystem, from tracemalloc.
+
+    Off until ``start``; tracing slows the game down noticeably, so this is a
+    debug mode. Every ``every`` frames ``end_frame`` diffs a tracemalloc
+    snapshot against the previous one, grouped by the file of each
+    allocation site, and keeps the net blocks and bytes per subsystem. The
+    traced peak since the last snapshot is kept alongside it. That peak
+    catches the short-lived churn (particle dicts, list copies) that a net
+    diff nets away. Surface pixels are allocated by SDL outside the Python
+    heap; those are the surface tracker's business (core/memory.py).
+    """
+
+    def __init__(self, history=600):
+        self.enabled = False
+        self.history = history
+        self.every = 1
+        self.frame = 0
+        self.frames = []  # [(state, {subsystem: (blocks, bytes)}, peak bytes)]
+        self._previous = None
+        self._base = 0
+        self._filters = [tracemalloc.Filter(False, tracemalloc.__file__),
+                         tracemalloc.Filter(False, __file__)]
+
+    def start(self, every=1):
+        self.every = max(1, every)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+        self.enabled = True
+        self._previous = self._snapshot()
+        self._reset_peak()
+
+    def stop(self):
+        self.enabled = False
+        self._previous = None
+        tracemalloc.stop()
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def _reset_peak(self):
+        tracemalloc.reset_peak()
+        self._base = tracemalloc.get_traced_memory()[0]
+
+    def end_frame(self, state):
+        if not self.enabled:
+            return
+        self.frame += 1
+        if self.frame % self.every:
+            return
+        peak = tracemalloc.get_traced_memory()[1] - self._base
+        snapshot = self._snapshot()
+        current = {}
+        for stat in snapshot.compare_to(self._previous, "filename"):
+            if stat.count_diff or stat.size_diff:
+                name = subsystem(stat.traceback[0].filename)
+                blocks, size = current.get(name, (0, 0))
+                current[name] = (blocks + stat.count_diff, size + stat.size_diff)
+        self.frames.append((state, current, peak))
+        if len(self.frames) > self.history:
+            del self.frames[0]
+        self._previous = snapshot
+        self._reset_peak()  # After the snapshot, so its own cost stays out of the next peak
+
+    def summary(self):
+        """{subsystem: (blocks per frame, bytes per frame, worst bytes in one diff)}."""
+        totals = {}
+        for _, frame, _ in self.frames:
+            for name, (blocks, size) in frame.items():
+                total = totals.setdefault(name, [0, 0, 0])
+                total[0] += blocks
+                total[1] += size
+                total[2] = max(total[2], size)
+        count = max(1, len(self.frames) * self.every)
+        return {name: (blocks / count, size / count, worst) for name, (blocks, size, worst) in totals.items()}
+
+    def report(self, top=15):
+        if not self.frames:
+            return "allocations: nothing measured"
+        by_state = {}
+        for state, _, peak in self.frames:
+            by_state.setdefault(state, []).append(peak)
+        lines = [f"allocations over {len(self.frames) * self.every} frames (diffed every {self.every}), "
+                 f"traced peak between snapshots by state:"]
+        for state, peaks in by_state.items():
+            lines.append(f"  {state:<12} mean {sum(peaks) / len(peaks) / 1024:8.1f} KB, max {max(peaks) / 1024:8.1f} KB")
+        lines.append(f"{'subsystem':<28} {'blocks/frame':>13} {'KB/frame':>9} {'worst KB':>9}")
+        ranked = sorted(self.summary().items(), key=lambda item: -abs(item[1][1]))
+        for name, (blocks, size, worst) in ranked[:top]:
+            lines.append(f"{name:<28} {blocks:13.1f} {size / 1024:9.2f} {worst / 1024:9.1f}")
+        return "\n".join(lines)
+
+
+# Allocation tracker for the running game
+allocations = AllocationTracker()
@@ -0,0 +1,172 @@
+import numpy as np
+import pygame
+from core.atlas import load_sprite
+from core.ecs import EntityStore
+from core.memory import memory
+from core.rng import streams
+
+rng = streams.stream("animation")
+
+
+# -------------------------------------------------------------
+# 🎞️ Frame Atlas
+# -------------------------------------------------------------
+class AnimationAtlas:
+    """Every frame of one character, with its effect variants baked up front.
+
+    ``frames`` maps frame names to sprite paths. ``base`` frames come
+    straight from the packed sprite atlas (trimmed, with their offsets);
+    a white ``flash`` row and a colour-multiplied ``tint`` row are baked
+    into one extra sheet when asked for. ``glow`` bakes one soft halo sized
+    to the largest frame. Drawing only ever blits existing subsurfaces.
+    """
+
+    def __init__(self, frames, flash=False, tint=None, glow=None, glow_pad=20):
+        sprites = {name: load_sprite(path) for name, path in frames.items()}
+        full_w = max(full[0] for _, _, full in sprites.values())
+        full_h = max(full[1] for _, _, full in sprites.values())
+
+        self.frames = {"base": {}}
+        self.anchors = {}  # name -> blit offset from the character's centre
+        self.sizes = {}    # name -> untrimmed frame size
+        for name, (surface, offset, full) in sprites.items():
+            self.frames["base"][name] = surface
+            self.sizes[name] = full
+            self.anchors[name] = (offset[0] - full[0] // 2, offset[1] - full[1] // 2)
+
+        variants = []
+        if flash:
+            variants.append("flash")
+        if tint:
+            variants.append("tint")
+        if variants:
+            width = sum(s.get_width() for s, _, _ in sprites.values())
+            height = max(s.get_height() for s, _, _ in sprites.values())
+            self.sheet = memory.surface((width, height * len(variants)), pygame.SRCALPHA, owner="animation")
+            for row, variant in enumerate(variants):
+                self.frames[variant] = {}
+                x = 0
+                for name, (surface, _, _) in sprites.items():
+                    rect = pygame.Rect((x, row * height), surface.get_size())
+                    self.sheet.blit(surface, rect)
+                    frame = self.sheet.subsurface(rect)
+                    if variant == "flash":
+                        frame.fill((255, 255, 255, 0), special_flags=pygame.BLEND_RGBA_MAX)
+                    else:
+                        frame.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+                    self.frames[variant][name] = frame
+                    x += rect.width
+
+        self.glow = None
+        if glow:
+            size = (full_w + glow_pad * 2, full_h + glow_pad * 2)
+            self.glow = memory.surface(size, pygame.SRCALPHA, owner="animation")
+            pygame.draw.circle(self.glow, glow, (size[0] // 2, size[1] // 2), size[0] // 2)
+
+    def frame(self, name, variant="base"):
+        """(surface, anchor) for one frame; blit at the character's centre plus anchor."""
+        return self.frames[variant][name], self.anchors[name]
+
+
+# -------------------------------------------------------------
+# 🎬 Clip State Machine
+# -------------------------------------------------------------
+# Clip spec keys:
+#   frames      frame names, cycled every ``frame_time`` seconds
+#   variants    atlas variant per frame (default: all "base")
+#   hold        seconds before moving on to ``next``; a (min, max) pair
+#               picks a random hold each time; None holds until an event
+#   next        clip entered when the hold runs out
+# Transitions map each clip to the events it accepts: {clip: {event: clip}}
+ANIMATION_FIELDS = {
+    "clip": {"index": np.int32, "elapsed": np.float64, "hold": np.float64,
+             "frame_time": np.float64, "count": np.int32, "character": np.int32},
+}
+
+
+class AnimationSystem:
+    """Clip playback for every animated entity, advanced in one pass.
+
+    Each animated entity is a row in an EntityStore; ``update`` ages all of
+    them with array math and only visits the few whose clip ran out that
+    frame. ``frame(eid)`` hands back the atlas subsurface to blit and its
+    anchor relative to the entity's centre.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget every character and animated entity (a new game is starting)."""
+        self.store = EntityStore(16, ANIMATION_FIELDS)
+        self.mask = self.store.mask_of("clip")
+        self.characters = []  # compiled clip tables, indexed by character id
+
+    def compile(self, atlas, clips, transitions):
+        """Turn a declarative clip table into lookup lists; returns a character id."""
+        names = list(clips)
+        character = {"names": names, "frames": [], "frame_time": [], "hold": [],
+                     "next": [], "events": []}
+        for name in names:
+            spec = clips[name]
+            variants = spec.get("variants", ["base"] * len(spec["frames"]))
+            character["frames"].append([atlas.frame(f, v) for f, v in zip(spec["frames"], variants)])
+            character["frame_time"].append(spec.get("frame_time", 1.0))
+            character["hold"].append(spec.get("hold"))
+            character["next"].append(names.index(spec["next"]) if spec.get("next") else -1)
+            character["events"].append({event: names.index(target)
+                                        for event, target in transitions.get(name, {}).items()})
+        self.characters.append(character)
+        return len(self.characters) - 1
+
+    def add(self, character, start):
+        eid = self.store.create(self.mask)
+        self._enter(eid, character, self.characters[character]["names"].index(start))
+        return eid
+
+    def remove(self, eid):
+        self.store.destroy([eid])
+
+    def _enter(self, eid, character, index):
+        table = self.characters[character]
+        clip = self.store.clip
+        hold = table["hold"][index]
+        if isinstance(hold, tuple):
+            hold = rng.uniform(*hold)
+        clip.index[eid] = index
+        clip.elapsed[eid] = 0.0
+        clip.hold[eid] = np.inf if hold is None else hold
+        clip.frame_time[eid] = table["frame_time"][index]
+        clip.count[eid] = len(table["frames"][index])
+        clip.character[eid] = character
+
+    def trigger(self, eid, event):
+        """Fire an event; returns True if the current clip accepted it."""
+        clip = self.store.clip
+        character = int(clip.character[eid])
+        target = self.characters[character]["events"][clip.index[eid]].get(event)
+        if target is None:
+            return False
+        self._enter(eid, character, target)
+        return True
+
+    def state(self, eid):
+        clip = self.store.clip
+        return self.characters[clip.character[eid]]["names"][clip.index[eid]]
+
+    def update(self, dt):
+        ids = self.store.query("clip")
+        clip = self.store.clip
+        clip.elapsed[ids] += dt / 1000
+        for eid in ids[clip.elapsed[ids] >= clip.hold[ids]].tolist():
+            character = int(clip.character[eid])
+            self._enter(eid, character, self.characters[character]["next"][clip.index[eid]])
+
+    def frame(self, eid):
+        clip = self.store.clip
+        frames = self.characters[clip.character[eid]]["frames"][clip.index[eid]]
+        return frames[int(clip.elapsed[eid] / clip.frame_time[eid]) % clip.count[eid]]
+
+
+# Shared animation system for the running game
+animations = AnimationSystem()
@@ -0,0 +1,253 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import pygame
+
+# -------------------------------------------------------------
+# 📦 Raw-pixel asset pack (built by tools/build_pack.py)
+# -------------------------------------------------------------
+# Layout: header, JSON index, then each image's pixels at a 64-byte
+# aligned offset, already in the display's 32-bit layout:
+#
+#   MAGIC (4s) | VERSION (I) | index size (I) | index JSON | pixel blobs
+#
+# index: {path: [offset, width, height, pitch, format, has_alpha]}
+PACK_PATH = "assets/assets.pack"
+BAKED_DIR = "assets/baked"  # one single-image pack per baked load recipe
+MANIFEST = f"{BAKED_DIR}/manifest.json"  # recipe name -> content hash, BAKE_VERSION, source stat
+BAKE_VERSION = 1  # bump when the transforms change, to invalidate old bakes
+MAGIC = b"PXPK"
+VERSION = 1
+HEADER = struct.Struct("<4sII")
+ALIGN = 64
+
+# Byte order of a 32-bit ARGB pixel in memory
+PIXEL_FORMAT = "BGRA" if sys.byteorder == "little" else "ARGB"
+
+
+class AssetPack:
+    """A memory-mapped pack whose images become surfaces without decoding.
+
+    ``surface(path)`` wraps the mapped pixels with ``pygame.image.frombuffer``,
+    so nothing is copied until a page is touched. The mapping is private
+    copy-on-write, so drawing into a pack surface never reaches the file,
+    but every surface for a path shares the same pixels for the rest of the
+    run: copy an image before drawing into it.
+
+    Entries whose source file is newer than the pack are ignored, so a
+    stale pack falls back to normal decoding instead of showing old art.
+    """
+
+    def __init__(self, path=PACK_PATH):
+        self.path = path
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, index_size = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} asset pack")
+        self.entries = json.loads(self.map[HEADER.size:HEADER.size + index_size])
+        self.built = os.path.getmtime(path)
+        self.view = memoryview(self.map)
+
+    def __contains__(self, path):
+        return path in self.entries and self.fresh(path)
+
+    def fresh(self, source):
+        try:
+            return os.path.getmtime(source) <= self.built
+        except OSError:
+            return True  # Source removed; the packed copy is all there is
+
+    def surface(self, path):
+        offset, width, height, pitch, fmt, has_alpha = self.entries[path]
+        surf = pygame.image.frombuffer(self.view[offset:offset + pitch * height], (width, height), fmt)
+        if not has_alpha:
+            surf.set_alpha(None)  # Fully opaque: blit without blending
+        return surf
+
+    def close(self):
+        if getattr(self, "view", None) is not None:
+            self.view.release()
+            self.view = None
+        self.map.close()
+        self.file.close()
+
+
+def write_pack(out_path, images):
+    """Write ``{name: surface}`` as a pack file, replacing ``out_path`` atomically."""
+    encoded = {}
+    alpha_index = PIXEL_FORMAT.index("A")
+    for name, surface in images.items():
+        pixels = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        has_alpha = min(pixels[alpha_index::4], default=255) < 255
+        encoded[name] = (surface.get_width(), surface.get_height(), pixels, has_alpha)
+
+    # The index holds absolute offsets, so size it until it stops changing
+    def index_for(start):
+        index, offset = {}, start
+        for name, (width, height, pixels, has_alpha) in encoded.items():
+            offset = -(-offset // ALIGN) * ALIGN
+            index[name] = [offset, width, height, width * 4, PIXEL_FORMAT, int(has_alpha)]
+            offset += len(pixels)
+        return index
+
+    index = index_for(0)
+    while True:
+        blob = json.dumps(index, separators=(",", ":")).encode()
+        updated = index_for(HEADER.size + len(blob))
+        if updated == index:
+            break
+        index = updated
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(blob)))
+        f.write(blob)
+        for name, (_, _, pixels, _) in encoded.items():
+            f.write(b"\0" * (index[name][0] - f.tell()))
+            f.write(pixels)
+    os.replace(tmp_path, out_path)  # A running game keeps its old mapping
+    return index
+
+
+# -------------------------------------------------------------
+# 🍞 Baked load recipes
+# -------------------------------------------------------------
+def recipe_name(path, scale=None, pixelate=False, smooth=False):
+    return f"{path}|{scale}|{int(bool(pixelate))}|{int(bool(smooth))}"
+
+
+def baked_path(name):
+    return f"{BAKED_DIR}/{hashlib.sha1(name.encode()).hexdigest()[:16]}.pack"
+
+
+def content_hash(paths, options):
+    """What a bake is keyed on: BAKE_VERSION, the options and the source bytes."""
+    digest = hashlib.sha1(f"{BAKE_VERSION}|{options}".encode())
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def load_manifest():
+    """The bake manifest; entries from an older manifest layout are dropped."""
+    try:
+        with open(MANIFEST) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {name: entry for name, entry in manifest.items() if isinstance(entry, dict)}
+
+
+def source_stat(path):
+    """What a bake records about its source so loads can skip rehashing it."""
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def manifest_entry(digest, source=None):
+    entry = {"hash": digest, "version": BAKE_VERSION}
+    if source is not None:
+        entry["source"] = source_stat(source)
+    return entry
+
+
+_manifest = None
+
+
+def load_baked(path, scale=None, pixelate=False, smooth=False):
+    """The baked result of a load recipe, or None if it is missing or stale.
+
+    tools/bake.py keys every bake on its content hash and records the
+    BAKE_VERSION and the source's size and mtime next to it; a load only
+    compares those, so a changed source or a version bump both miss
+    without reading the source again."""
+    global _manifest
+    name = recipe_name(path, scale, pixelate, smooth)
+    file = baked_path(name)
+    if not os.path.exists(file):
+        return None
+    if _manifest is None:
+        _manifest = load_manifest()
+    entry = _manifest.get(name)
+    try:
+        if (entry is None or entry.get("version") != BAKE_VERSION
+                or entry.get("source") != source_stat(path)):
+            return None
+        pack = AssetPack(file)
+    except (OSError, ValueError):
+        return None
+    if name not in pack.entries:
+        pack.close()
+        return None
+    return pack.surface(name)
+
+
+# JPEG start-of-frame markers; C4, C8 and CC share the range but aren't frames
+_JPEG_FRAMES = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg_size(f):
+    """Walk the JPEG segments to the first SOFn frame header."""
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        while marker[1] == 0xFF:  # Fill bytes before a marker
+            marker = marker[1:] + f.read(1)
+        if marker[1] in (0x01, 0xD8) or 0xD0 <= marker[1] <= 0xD7:
+            continue  # Standalone markers carry no length
+        length = f.read(2)
+        if len(length) < 2:
+            return None
+        if marker[1] in _JPEG_FRAMES:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">xHH", frame)
+            return width, height
+        f.seek(struct.unpack(">H", length)[0] - 2, os.SEEK_CUR)
+
+
+def image_size(path):
+    """(width, height) of an image file, read from the PNG or JPEG header
+    without decoding; other formats are loaded to find out."""
+    with open(path, "rb") as f:
+        header = f.read(24)
+        if header[:8] == b"\x89PNG\r\n\x1a\n" and header[12:16] == b"IHDR":
+            return struct.unpack(">II", header[16:24])
+        if header[:2] == b"\xff\xd8":
+            size = _jpeg_size(f)
+            if size is not None:
+                return size
+    return pygame.image.load(path).get_size()
+
+
+_pack = None
+
+
+def default_pack():
+    """The game's asset pack, mapped on first use; None if it hasn't been built."""
+    global _pack
+    if _pack is None:
+        _pack = False
+        if os.path.exists(PACK_PATH):
+            try:
+                _pack = AssetPack(PACK_PATH)
+            except (OSError, ValueError) as e:
+                print(f"[WARN] Ignoring asset pack: {e}")
+    return _pack or None
+
+
+def load_surface(path):
+    """A display-ready image: from the pack when it has it, else decoded from disk."""
+    pack = default_pack()
+    if pack is not None and path in pack:
+        return pack.surface(path)
+    return pygame.image.load(path).convert_alpha()
@@ -0,0 +1,97 @@
+import os
+import pygame
+from core.asset_pack import load_surface, load_baked
+from core.memory import memory
+
+# -------------------------------------------------------------
+# 🗃️ Shared image cache
+# -------------------------------------------------------------
+# Every scene loads its images through here, so an image used by two
+# scenes is decoded and scaled once. Entries are reference counted and
+# dropped as soon as the last scope holding them is released.
+_images = {}  # key -> Surface
+_refs = {}    # key -> live reference count
+
+
+def image_key(path, scale=None, pixelate=False, smooth=False):
+    return (path, scale, pixelate, smooth)
+
+
+def _load(path, scale, pixelate, smooth, fallback_color, fallback_size):
+    if not os.path.exists(path):
+        surf = memory.surface(fallback_size, pygame.SRCALPHA, owner="image_cache")
+        surf.fill(fallback_color)
+        print(f"[WARN] Missing image: {path}")
+        return surf
+
+    if scale is not None or pixelate:
+        # Prefer the offline bake of this exact recipe (tools/bake.py)
+        baked = load_baked(path, scale, pixelate, smooth)
+        if baked is not None:
+            return baked
+    return transform(load_surface(path), scale, pixelate, smooth)
+
+
+def transform(image, scale=None, pixelate=False, smooth=False):
+    """Apply a load recipe's scale and pixelation to a decoded image."""
+    # scale: a factor of the source size or an explicit (w, h)
+    if scale is not None:
+        if isinstance(scale, tuple):
+            size = scale
+        else:
+            size = (int(image.get_width() * scale), int(image.get_height() * scale))
+        resize = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        image = resize(image, size)
+
+    if pixelate:
+        # Slight pixelation for 8-bit style
+        w, h = image.get_size()
+        small = pygame.transform.scale(image, (max(1, w // 2), max(1, h // 2)))
+        image = pygame.transform.scale(small, (w, h))
+
+    return image
+
+
+def load_image(path, scale=None, pixelate=False, smooth=False,
+               fallback_color=(150, 150, 150), fallback_size=(100, 100)):
+    """Return a cached, display-converted image and take a reference to it."""
+    key = image_key(path, scale, pixelate, smooth)
+    surf = _images.get(key)
+    if surf is None:
+        surf = memory.track(_load(path, scale, pixelate, smooth, fallback_color, fallback_size), "image_cache")
+        _images[key] = surf
+    _refs[key] = _refs.get(key, 0) + 1
+    return surf
+
+
+def release_image(key):
+    """Drop one reference; the surface is freed when nothing holds it."""
+    count = _refs.get(key, 0) - 1
+    if count > 0:
+        _refs[key] = count
+    else:
+        _refs.pop(key, None)
+        _images.pop(key, None)
+
+
+def cached_bytes():
+    """Pixel bytes currently held by the image cache."""
+    return sum(s.get_height() * s.get_pitch() for s in _images.values())
+
+
+class AssetScope:
+    """Set of cache references owned by one scene, released together."""
+
+    def __init__(self, name):
+        self.name = name
+        self.keys = []
+
+    def image(self, path, scale=None, pixelate=False, smooth=False, **kwargs):
+        surf = load_image(path, scale, pixelate, smooth, **kwargs)
+        self.keys.append(image_key(path, scale, pixelate, smooth))
+        return surf
+
+    def release(self):
+        for key in self.keys:
+            release_image(key)
+        self.keys = []
@@ -0,0 +1,59 @@
+import json
+import os
+import pygame
+from core import assets
+from core.asset_pack import load_surface
+from core.memory import memory
+
+# -------------------------------------------------------------
+# 🧩 Packed sprite atlases (built by tools/pack_sprites.py)
+# -------------------------------------------------------------
+ATLAS_INDEX = "assets/atlases/sprites.json"
+
+
+class SpriteAtlas:
+    """Atlas pages decoded once, handing out trimmed sprites as subsurfaces.
+
+    Each entry is ``(surface, offset, full_size)``: blitting ``surface`` at
+    ``offset`` inside a ``full_size`` box reproduces the untrimmed image.
+    """
+
+    def __init__(self, index_path):
+        with open(index_path) as f:
+            index = json.load(f)
+        folder = os.path.dirname(index_path)
+        self.pages = [memory.track(load_surface(f"{folder}/{page}"), "sprite_atlas")
+                      for page in index["pages"]]
+        self.sprites = {}
+        for path, (page, x, y, w, h, ox, oy, full_w, full_h) in index["sprites"].items():
+            self.sprites[path] = (self.pages[page].subsurface((x, y, w, h)), (ox, oy), (full_w, full_h))
+
+    def __contains__(self, path):
+        return path in self.sprites
+
+    def get(self, path):
+        return self.sprites[path]
+
+
+_atlas = None
+
+
+def default_atlas():
+    """The game's sprite atlas, loaded on first use; None if it hasn't been built."""
+    global _atlas
+    if _atlas is None:
+        try:
+            _atlas = SpriteAtlas(ATLAS_INDEX)
+        except (OSError, ValueError, pygame.error) as e:
+            print(f"[WARN] No sprite atlas ({e}); loading sprites one by one")
+            _atlas = False
+    return _atlas or None
+
+
+def load_sprite(path):
+    """(surface, offset, full_size) for a sprite, from the atlas when it holds it."""
+    atlas = default_atlas()
+    if atlas is not None and path in atlas:
+        return atlas.get(path)
+    image = assets.load_image(path)
+    return image, (0, 0), image.get_size()
@@ -1,38 +1,67 @@
-import pygame, random, os, math
+import pygame, math, threading
+import numpy as np
+from core.memory import memory
+from core.effects import effects
+from core.rng import streams
 
-# -------------------------------------------------------------
-# 🏔️ Safe Image Loader
-# -------------------------------------------------------------
-def safe_load_image(path, fallback_color=(150, 150, 150), size=(100, 100)):
-    if os.path.exists(path):
-        img = pygame.image.load(path).convert_alpha()
-        # Apply slight pixelation for 8-bit style
-        small = pygame.transform.scale(img, (img.get_width() // 2, img.get_height() // 2))
-        return pygame.transform.scale(small, (img.get_width(), img.get_height()))
-    else:
-        surf = pygame.Surface(size, pygame.SRCALPHA)
-        surf.fill(fallback_color)
-        print(f"[WARN] Missing image: {path}")
-        return surf
+hill_rng = streams.stream("hills")
+island_rng = streams.numpy("islands")
+particle_rng = streams.stream("sky.particles")
 
 
 # -------------------------------------------------------------
-# 🏔️ 8-bit Style Hill/Mountain Range
+# 🏔️ Hill Atlas (pre-generated hill variants)
 # -------------------------------------------------------------
-class MountainRange:
-    def __init__(self, screen_height, num_hills=6):
-        self.screen_height = screen_height
-        self.num_hills = num_hills
-        self.speed = 18
-        self.hill_surfaces = []  # Cache for performance
-        self.reset_positions()
-        self.generate_hills()
-        
-    def reset_positions(self):
-        self.width = 1400
-        self.x1 = 0
-        self.x2 = self.width
-        
+class HillAtlas:
+    """Pool of pre-rendered 8-bit hill variants and their shadows.
+
+    Hill surfaces are expensive to draw (hundreds of stepped lines each), so
+    they are rendered once here and new ranges are assembled by picking from
+    the pool. With ``threaded=True`` only ``min_ready`` variants are built up
+    front and the rest of the pool is filled on a worker thread.
+    The worker draws from the hill stream while the game runs, so threaded
+    pools are not reproduced exactly by a replay.
+    """
+
+    HILL_TYPES = ["gentle", "steep", "rolling"]
+
+    # 8-bit color palette (limited colors)
+    BASE_COLORS = [
+        (60, 100, 80),    # Dark green
+        (80, 120, 100),   # Medium green
+        (100, 140, 120),  # Light green
+        (70, 90, 110),    # Blue-gray
+    ]
+
+    # Detail colors (rocks, trees)
+    DETAIL_COLORS = [
+        (90, 70, 50),     # Brown
+        (110, 90, 70),    # Light brown
+        (80, 100, 80),    # Moss
+        (120, 100, 80),   # Tan
+    ]
+
+    SHADOW_HEIGHT = 15
+
+    def __init__(self, hill_width, pool_size=12, threaded=False, min_ready=4):
+        self.hill_width = hill_width
+        self.pool_size = pool_size
+        self.variants = []
+        self._worker = None
+
+        ready = min(pool_size, min_ready) if threaded else pool_size
+        for _ in range(ready):
+            self.variants.append(self.create_variant())
+
+        if len(self.variants) < pool_size:
+            self._worker = threading.Thread(target=self._fill_pool, daemon=True)
+            self._worker.start()
+
+    def _fill_pool(self):
+        while len(self.variants) < self.pool_size:
+            # list.append is atomic, so readers only ever see finished variants
+            self.variants.append(self.create_variant())
+
     def generate_hill_shape(self, width, height, hill_type):
         """Generate 8-bit style hill shapes with stepped curves"""
         points = []
@@ -75,57 +104,28 @@ class MountainRange:
         points.append((width, height))
         
         return points
-    
-    def generate_hills(self):
-        """Generate 8-bit style hills"""
-        self.hills = []
-        hill_width = self.width // self.num_hills
-        self.hill_surfaces = []
-        
-        for i in range(self.num_hills):
-            # Hill parameters with 8-bit color palette
-            height = random.randint(160, 220)
-            width = random.randint(hill_width - 60, hill_width + 60)
-            x_offset = i * hill_width + random.randint(-30, 30)
-            hill_type = random.choice(["gentle", "steep", "rolling"])
-            
-            # 8-bit color palette (limited colors)
-            base_colors = [
-                (60, 100, 80),    # Dark green
-                (80, 120, 100),   # Medium green
-                (100, 140, 120),  # Light green
-                (70, 90, 110),    # Blue-gray
-            ]
-            
-            # Detail colors (rocks, trees)
-            detail_colors = [
-                (90, 70, 50),     # Brown
-                (110, 90, 70),    # Light brown
-                (80, 100, 80),    # Moss
-                (120, 100, 80),   # Tan
-            ]
-            
-            base_color = random.choice(base_colors)
-            detail_color = random.choice(detail_colors)
-            
-            # Generate hill shape
-            shape_points = self.generate_hill_shape(width, height, hill_type)
-            
-            # Create cached surface
-            hill_surface = self.create_hill_surface(width, height, shape_points, 
-                                                   base_color, detail_color)
-            
-            self.hills.append({
-                'x_offset': x_offset,
-                'height': height,
-                'width': width,
-                'surface': hill_surface,
-                'shape_points': shape_points
-            })
+
+    def create_variant(self):
+        """Render one random hill variant with its shadow"""
+        height = hill_rng.randint(160, 220)
+        width = hill_rng.randint(self.hill_width - 60, self.hill_width + 60)
+        hill_type = hill_rng.choice(self.HILL_TYPES)
+        base_color = hill_rng.choice(self.BASE_COLORS)
+        detail_color = hill_rng.choice(self.DETAIL_COLORS)
+
+        shape_points = self.generate_hill_shape(width, height, hill_type)
+        return {
+            'height': height,
+            'width': width,
+            'surface': self.create_hill_surface(width, height, shape_points,
+                                                base_color, detail_color),
+            'shadow': self.get_shadow(width),
+            'shape_points': shape_points
+        }
     
     def create_hill_surface(self, width, height, shape_points, base_color, detail_color):
         """Create 8-bit style hill surface"""
-        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface = memory.surface((width, height), pygame.SRCALPHA, owner="hills")
         
         # Draw hill with stepped edges (8-bit style)
         for i in range(len(shape_points) - 1):
@@ -149,13 +149,13 @@ class MountainRange:
                 pygame.draw.line(surface, step_color, (sx1, sy1), (sx2, sy2), 3)
         
         # Add 8-bit style details (pixelated trees/rocks)
-        num_details = random.randint(2, 5)
+        num_details = hill_rng.randint(2, 5)
         for _ in range(num_details):
-            detail_x = random.randint(10, width - 10)
-            detail_y = random.randint(height // 3, height - 20)
+            detail_x = hill_rng.randint(10, width - 10)
+            detail_y = hill_rng.randint(height // 3, height - 20)
             
             # Simple pixel tree/rock shapes
-            if random.random() > 0.5:
+            if hill_rng.random() > 0.5:
                 # Tree (simple pixel shape)
                 pygame.draw.rect(surface, detail_color, 
                                (detail_x - 3, detail_y - 8, 6, 8))
@@ -167,398 +167,214 @@ class MountainRange:
                                (detail_x - 4, detail_y - 4, 8, 8))
         
         return surface
+
+    def get_shadow(self, width):
+        """Simple 8-bit shadow strip, shared by every hill of the same width"""
+        return effects.get("fade", (width, self.SHADOW_HEIGHT), (0, 0, 0), 40)
+
+    def assemble_range(self, num_hills):
+        """Build a hill range by picking pre-rendered variants from the pool"""
+        hills = []
+        for i in range(num_hills):
+            variant = hill_rng.choice(self.variants)
+            hills.append({
+                'x_offset': i * self.hill_width + hill_rng.randint(-30, 30),
+                'height': variant['height'],
+                'width': variant['width'],
+                'surface': variant['surface'],
+                'shadow': variant['shadow'],
+            })
+        return hills
+
+
+# -------------------------------------------------------------
+# 🏔️ 8-bit Style Hill/Mountain Range
+# -------------------------------------------------------------
+class MountainRange:
+    def __init__(self, scope, view_size, num_hills=6, atlas=None):
+        self.screen_width, self.screen_height = view_size
+        self.num_hills = num_hills
+        self.speed = 18
+        self.reset_positions()
+        self.atlas = atlas or HillAtlas(self.width // num_hills)
+        # One hill range per strip so a wrap never changes the visible strip
+        self.ranges = [self.atlas.assemble_range(num_hills),
+                       self.atlas.assemble_range(num_hills)]
+        
+    def reset_positions(self):
+        self.width = 1400
+        self.x1 = 0
+        self.x2 = self.width
+
+    def generate_hills(self):
+        """Re-roll both hill ranges from the atlas pool"""
+        self.ranges = [self.atlas.assemble_range(self.num_hills),
+                       self.atlas.assemble_range(self.num_hills)]
     
-    def update_and_draw(self, screen, dt):
+    def update(self, dt):
         dt_sec = dt / 1000.0
-        screen_w, screen_h = screen.get_size()
         
         # Update positions
         self.x1 -= self.speed * dt_sec
         self.x2 -= self.speed * dt_sec
         
-        # Wrap around
+        # Wrap around (assembling from the atlas is cheap, no re-rendering)
         if self.x1 + self.width < 0:
             self.x1 = self.x2 + self.width
-            self.generate_hills()
+            self.ranges[0] = self.atlas.assemble_range(self.num_hills)
         if self.x2 + self.width < 0:
             self.x2 = self.x1 + self.width
-            self.generate_hills()
-        
-        # Draw hills
-        self.draw_hill_range(screen, self.x1, screen_h)
-        self.draw_hill_range(screen, self.x2, screen_h)
+            self.ranges[1] = self.atlas.assemble_range(self.num_hills)
+
+    def draw(self, screen):
+        screen_h = screen.get_height()
+        self.draw_hill_range(screen, self.ranges[0], self.x1, screen_h)
+        self.draw_hill_range(screen, self.ranges[1], self.x2, screen_h)
     
-    def draw_hill_range(self, screen, x_offset, screen_h):
+    def draw_hill_range(self, screen, hills, x_offset, screen_h):
         """Draw hills with 8-bit style shadows"""
-        for hill in self.hills:
+        shadow_y = screen_h - HillAtlas.SHADOW_HEIGHT
+        for hill in hills:
             x = x_offset + hill['x_offset']
-            y = screen_h - hill['height']
             
             # Draw hill
-            screen.blit(hill['surface'], (x, y))
+            screen.blit(hill['surface'], (x, screen_h - hill['height']))
             
-            # Simple 8-bit shadow
-            shadow = pygame.Surface((hill['width'], 15), pygame.SRCALPHA)
-            for i in range(15):
-                alpha = int(40 * (1 - i/15))
-                pygame.draw.line(shadow, (0, 0, 0, alpha),
-                               (0, i), (hill['width'], i))
-            screen.blit(shadow, (x, screen_h - 15))
+            # Pre-rendered 8-bit shadow
+            screen.blit(hill['shadow'], (x, shadow_y))
 
 
 # -------------------------------------------------------------
-# 🏔️ Parallax Layer (8-bit Optimized)
+# 🏝️ 8-bit Floating Island
 # -------------------------------------------------------------
-class ParallaxLayer:
-    def __init__(self, image_path, speed, stretch=False, scale_factor=1.0, align_bottom=False):
-        self.image = safe_load_image(image_path)
-        self.speed = speed
-        self.stretch = stretch
-        self.scale_factor = scale_factor
-        self.align_bottom = align_bottom
-        self.cached_surface = None
-        self.reset_positions()
+class FloatingIslands:
+    """Pixelated islands drifting left across the sky, stored as entities.
 
-    def reset_positions(self):
-        self.width = self.image.get_width()
-        self.height = self.image.get_height()
-        self.x1 = 0
-        self.x2 = self.width
+    A few scale variants (with their shadows) are baked up front; each
+    island is an entity whose sprite image picks a variant, so respawning
+    an island only rewrites a few array slots.
+    """
 
-    def update_and_draw(self, screen, dt):
-        dt_sec = dt / 1000.0
-        self.x1 -= self.speed * dt_sec
-        self.x2 -= self.speed * dt_sec
+    uses_world = True
+    image_options = {"pixelate": True}
 
-        if self.x1 + self.width < 0:
-            self.x1 = self.x2 + self.width
-        if self.x2 + self.width < 0:
-            self.x2 = self.x1 + self.width
+    def __init__(self, scope, view_size, image, world, count=2, speed_range=(0.5, 1.2), variants=4):
+        self.world = world
+        self.speed_range = speed_range
+        base_image = scope.image(image, **self.image_options)
 
-        if self.stretch:
-            screen_w, screen_h = screen.get_size()
-            if (self.cached_surface is None or 
-                self.cached_surface.get_size() != (screen_w, int(self.height * self.scale_factor))):
-                # Apply 8-bit pixelation to stretched image
-                temp = pygame.transform.scale(
-                    self.image, (screen_w // 2, int(self.height * self.scale_factor) // 2)
-                )
-                self.cached_surface = pygame.transform.scale(
-                    temp, (screen_w, int(self.height * self.scale_factor))
-                )
-            
-            y_pos = screen_h - self.cached_surface.get_height() if self.align_bottom else 0
-            screen.blit(self.cached_surface, (self.x1, y_pos))
-            screen.blit(self.cached_surface, (self.x2, y_pos))
-        else:
-            y_pos = screen.get_height() - self.height if self.align_bottom else 0
-            screen.blit(self.image, (self.x1, y_pos))
-            screen.blit(self.image, (self.x2, y_pos))
+        self.images = []
+        self.shadows = []
+        for i in range(variants):
+            scale_factor = 0.8 + 0.2 * i / max(1, variants - 1)  # Smaller for 8-bit
+            w = int(base_image.get_width() * scale_factor)
+            h = int(base_image.get_height() * scale_factor)
 
+            # Apply 8-bit pixelation
+            small = pygame.transform.scale(base_image, (w // 2, h // 2))
+            self.images.append(memory.track(pygame.transform.scale(small, (w, h)), "islands"))
 
-# -------------------------------------------------------------
-# 🏝️ 8-bit Floating Island
-# -------------------------------------------------------------
-class FloatingIsland:
-    def __init__(self, image_path, speed_range=(0.5, 1.2)):
-        self.image_path = image_path
-        self.speed_range = speed_range
-        self.shadow_surface = None
-        self.reset()
-
-    def reset(self):
-        self.image = safe_load_image(self.image_path)
-        scale_factor = random.uniform(0.8, 1.0)  # Smaller for 8-bit
-        w = int(self.image.get_width() * scale_factor)
-        h = int(self.image.get_height() * scale_factor)
-        
-        # Apply 8-bit pixelation
-        small = pygame.transform.scale(self.image, (w // 2, h // 2))
-        self.image = pygame.transform.scale(small, (w, h))
-        
-        self.x = random.randint(900, 1500)
-        self.y = random.randint(100, 220)  # Higher up
-        self.speed = random.uniform(*self.speed_range)
-        self.vertical_float_time = random.uniform(0, 6.28)
-        
-        # Create 8-bit style shadow
-        if self.shadow_surface is None or self.shadow_surface.get_size() != (w + 10, h // 3):
-            self.shadow_surface = pygame.Surface((w + 10, h // 3), pygame.SRCALPHA)
             # Simple oval shadow
-            shadow_color = (0, 0, 0, 40)
-            pygame.draw.ellipse(self.shadow_surface, shadow_color, (0, 0, w + 10, h // 3))
-
-    def update_and_draw(self, screen, dt):
-        dt_sec = dt / 1000.0
-        self.x -= self.speed * dt_sec * 100
-        self.vertical_float_time += dt_sec * 0.5
-        y_offset = 4 * math.sin(self.vertical_float_time)  # Less movement
+            self.shadows.append(effects.get("ellipse", (w + 10, h // 3), (0, 0, 0), 40))
+        self.widths = np.array([img.get_width() for img in self.images])
+
+        mask = world.mask_of("transform", "velocity", "sprite", "animation")
+        self.ids = np.array([world.create(mask) for _ in range(count)], dtype=int)
+        self.reset(self.ids)
+
+    def reset(self, ids):
+        world = self.world
+        n = len(ids)
+        world.sprite.image[ids] = island_rng.randint(0, len(self.images), n)
+        world.transform.x[ids] = island_rng.randint(900, 1500, n)
+        world.transform.y[ids] = island_rng.randint(100, 220, n)  # Higher up
+        world.velocity.vx[ids] = -island_rng.uniform(*self.speed_range, n) * 100
+        world.velocity.vy[ids] = 0
+        world.animation.phase[ids] = island_rng.uniform(0, 6.28, n)
+        world.animation.speed[ids] = 0.5
 
-        if self.x + self.image.get_width() < 0:
-            self.reset()
+    def update(self, dt):
+        world = self.world
+        ids = self.ids
+        gone = world.transform.x[ids] + self.widths[world.sprite.image[ids]] < 0
+        if gone.any():
+            self.reset(ids[gone])
 
-        # Draw shadow
-        shadow_y = self.y + self.image.get_height() - 8
-        screen.blit(self.shadow_surface, (self.x - 5, shadow_y))
-        
-        # Draw island
-        screen.blit(self.image, (self.x, self.y + y_offset))
+    def draw(self, screen):
+        world = self.world
+        ids = self.ids
+        xs = world.transform.x[ids].tolist()
+        ys = world.transform.y[ids].tolist()
+        float_y = (4 * np.sin(world.animation.phase[ids])).tolist()  # Less movement
+        for x, y, dy, v in zip(xs, ys, float_y, world.sprite.image[ids].tolist()):
+            image = self.images[v]
+            screen.blit(self.shadows[v], (x - 5, y + image.get_height() - 8))
+            screen.blit(image, (x, y + dy))
 
 
 # -------------------------------------------------------------
 # 🌬️ 8-bit Wind Particles
 # -------------------------------------------------------------
 class WindParticle:
-    def __init__(self, width, height):
-        self.streak_cache = {}
-        self.reset(width, height)
+    def __init__(self, view_size):
+        self.width, self.height = view_size
+        self.reset(self.width, self.height)
 
     def reset(self, width, height):
-        self.x = random.randint(0, width)
-        self.y = random.randint(0, height)
-        self.speed = random.uniform(15, 30)  # Slower for 8-bit
-        self.alpha = random.randint(80, 120)
-        self.length = random.randint(4, 8)  # Shorter
-        
-        if self.length not in self.streak_cache:
-            surf = pygame.Surface((self.length, 1), pygame.SRCALPHA)  # Thinner
-            for i in range(self.length):
-                alpha = int(self.alpha * (1 - i/self.length))
-                pygame.draw.line(surf, (255, 255, 255, alpha), 
-                               (i, 0), (i, 1))
-            self.streak_cache[self.length] = surf
-
-    def update_and_draw(self, screen, dt):
+        self.x = particle_rng.randint(0, width)
+        self.y = particle_rng.randint(0, height)
+        self.speed = particle_rng.uniform(15, 30)  # Slower for 8-bit
+        self.alpha = particle_rng.randint(80, 120)
+        self.length = particle_rng.randint(4, 8)  # Shorter
+        self.image = effects.get("streak", (self.length, 1), (255, 255, 255), self.alpha)  # Thinner
+
+    def update(self, dt):
         dt_sec = dt / 1000.0
         self.x -= self.speed * dt_sec
 
         if self.x < -self.length:
-            self.x = screen.get_width() + 10
-            self.y = random.randint(0, screen.get_height())
+            self.x = self.width + 10
+            self.y = particle_rng.randint(0, self.height)
 
-        screen.blit(self.streak_cache[self.length], (self.x, self.y))
+    def draw(self, screen):
+        screen.blit(self.image, (self.x, self.y))
 
 
 # -------------------------------------------------------------
 # ✨ 8-bit Glow Particles
 # -------------------------------------------------------------
 class GlowParticle:
-    def __init__(self, width, height):
-        self.glow_cache = {}
-        self.reset(width, height)
+    def __init__(self, view_size):
+        self.width, self.height = view_size
+        self.reset(self.width, self.height)
 
     def reset(self, width, height):
-        self.x = random.randint(0, width)
-        self.y = random.randint(0, height)
-        self.size = random.randint(2, 4)  # Smaller
-        self.speed = random.uniform(8, 15)
+        self.x = particle_rng.randint(0, width)
+        self.y = particle_rng.randint(0, height)
+        self.size = particle_rng.randint(2, 4)  # Smaller
+        self.speed = particle_rng.uniform(8, 15)
         # Limited 8-bit color palette
-        self.color = random.choice([
+        self.color = particle_rng.choice([
             (200, 220, 255),  # Light blue
             (255, 240, 200),  # Warm white
             (220, 200, 255),  # Lavender
         ])
-        self.alpha = random.randint(80, 140)
-        self.float_time = random.uniform(0, 6.28)
+        self.alpha = particle_rng.randint(80, 140)
+        self.float_time = particle_rng.uniform(0, 6.28)
         self.glow_size = self.size + 2  # Smaller glow
-        
-        cache_key = (self.size, self.glow_size, self.alpha)
-        if cache_key not in self.glow_cache:
-            glow_surface = pygame.Surface((self.glow_size, self.glow_size), pygame.SRCALPHA)
-            # Simple square for 8-bit style
-            pygame.draw.rect(glow_surface, (*self.color, self.alpha),
-                           (0, 0, self.glow_size, self.glow_size))
-            self.glow_cache[cache_key] = glow_surface
-
-    def update_and_draw(self, screen, dt):
+        # Simple square for 8-bit style
+        self.image = effects.get("rect", (self.glow_size, self.glow_size), self.color, self.alpha)
+
+    def update(self, dt):
         dt_sec = dt / 1000.0
         self.x -= self.speed * dt_sec
         self.float_time += dt_sec * 0.3  # Slower
-        y_offset = 2 * math.sin(self.float_time)
 
         if self.x < -self.glow_size:
-            self.reset(*screen.get_size())
-            self.x = screen.get_width() + self.glow_size
-
-        cache_key = (self.size, self.glow_size, self.alpha)
-        screen.blit(self.glow_cache[cache_key], 
-                   (self.x - self.size//2, self.y + y_offset - self.size//2))
-
-
-# -------------------------------------------------------------
-# 🌞 8-bit Style Sun
-# -------------------------------------------------------------
-class Sun:
-    def __init__(self, x, y, radius=70):  # Smaller for 8-bit
-        self.x = x
-        self.y = y
-        self.radius = radius
-        self.pulse_timer = 0.0
-        self.glow_surface = None
-        self.core_surface = None
-        
-    def update(self, dt):
-        self.pulse_timer += dt * 0.0008  # Slower pulse
-        
-        pulse = 0.5 + 0.5 * math.sin(self.pulse_timer)
-        
-        if self.glow_surface is None:
-            self.create_sun_surfaces(pulse)
-        
-    def create_sun_surfaces(self, pulse):
-        """Create 8-bit style sun surfaces"""
-        # Simple glow (concentric squares for 8-bit)
-        self.glow_surface = pygame.Surface((self.radius * 4, self.radius * 4), pygame.SRCALPHA)
-        
-        # Create pixelated glow effect
-        glow_colors = [
-            (255, 220, 120, 60),
-            (255, 200, 100, 90),
-            (255, 180, 80, 120)
-        ]
-        
-        for i, (color, size_factor) in enumerate([(glow_colors[0], 1.5), 
-                                                 (glow_colors[1], 1.2), 
-                                                 (glow_colors[2], 1.0)]):
-            size = int(self.radius * size_factor * (0.9 + 0.1 * pulse))
-            # Draw square for 8-bit style
-            rect = pygame.Rect(
-                self.glow_surface.get_width()//2 - size//2,
-                self.glow_surface.get_height()//2 - size//2,
-                size, size
-            )
-            pygame.draw.rect(self.glow_surface, color, rect)
-        
-        # Sun core (simple square)
-        self.core_surface = pygame.Surface((self.radius, self.radius), pygame.SRCALPHA)
-        core_color = (255, 240, 180, 255)
-        pygame.draw.rect(self.core_surface, core_color, (0, 0, self.radius, self.radius))
-        
-        # Add pixel grid effect
-        for x in range(0, self.radius, 4):
-            for y in range(0, self.radius, 4):
-                if (x + y) % 8 == 0:
-                    bright = (min(255, core_color[0] + 20),
-                            min(255, core_color[1] + 20),
-                            min(255, core_color[2] + 20),
-                            255)
-                    pygame.draw.rect(self.core_surface, bright, (x, y, 2, 2))
+            self.reset(self.width, self.height)
+            self.x = self.width + self.glow_size
 
     def draw(self, screen):
-        if self.glow_surface is None:
-            self.update(16)
-            
-        # Draw glow
-        screen.blit(self.glow_surface, 
-                   (self.x - self.glow_surface.get_width() // 2, 
-                    self.y - self.glow_surface.get_height() // 2),
-                   special_flags=pygame.BLEND_RGBA_ADD)
-        
-        # Draw core
-        if self.core_surface:
-            screen.blit(self.core_surface,
-                       (self.x - self.core_surface.get_width() // 2,
-                        self.y - self.core_surface.get_height() // 2),
-                       special_flags=pygame.BLEND_RGBA_ADD)
-
-
-# -------------------------------------------------------------
-# 🌅 8-bit Background Manager
-# -------------------------------------------------------------
-class BackgroundManager:
-    def __init__(self, screen):
-        self.screen = screen
-        self.time = 0.0
-        self.gradient_cache = None
-        self.gradient_timer = 0
-
-        # 🌞 Add 8-bit sun
-        self.sun = Sun(x=180, y=150, radius=60)
-
-        # Layers with 8-bit style
-        self.layers = [
-            ParallaxLayer("assets/backgrounds/clouds_far.png", speed=6, stretch=False),
-            ParallaxLayer("assets/backgrounds/fl_island1.png", speed=10, stretch=False),
-        ]
-        
-        # Add 8-bit hill range
-        self.mountain_range = MountainRange(screen.get_height(), num_hills=4)
-
-        # Reduced particle counts for 8-bit
-        self.islands = [FloatingIsland("assets/backgrounds/fl_island1.png") for _ in range(2)]
-        self.wind_particles = [WindParticle(*screen.get_size()) for _ in range(8)]
-        self.glow_particles = [GlowParticle(*screen.get_size()) for _ in range(6)]
-        
-        # 8-bit color palette for sky
-        self.top_sky_color = (70, 110, 180)    # Deep blue
-        self.mid_sky_color = (120, 160, 220)   # Medium blue
-        self.bottom_sky_color = (180, 200, 240) # Light blue
-
-    def create_gradient_surface(self, width, height):
-        """Create 8-bit style gradient with limited colors"""
-        gradient = pygame.Surface((width, height))
-        
-        # Create stepped gradient for 8-bit effect
-        steps = 8
-        step_height = height // steps
-        
-        for step in range(steps):
-            # Calculate color for this step
-            blend = step / steps
-            r = int(self.top_sky_color[0] * (1 - blend) + self.bottom_sky_color[0] * blend)
-            g = int(self.top_sky_color[1] * (1 - blend) + self.bottom_sky_color[1] * blend)
-            b = int(self.top_sky_color[2] * (1 - blend) + self.bottom_sky_color[2] * blend)
-            
-            # Quantize colors for 8-bit effect
-            r = (r // 32) * 32
-            g = (g // 32) * 32
-            b = (b // 32) * 32
-            
-            step_color = (r, g, b)
-            
-            # Draw step
-            y_start = step * step_height
-            y_end = min((step + 1) * step_height, height)
-            pygame.draw.rect(gradient, step_color, (0, y_start, width, y_end - y_start))
-        
-        return gradient
-
-    def update_and_draw(self, dt):
-        dt_sec = dt / 1000.0
-        self.time += dt_sec
-        self.gradient_timer += dt_sec
-        
-        # Update sun
-        self.sun.update(dt)
-        
-        # Update gradient cache periodically
-        if (self.gradient_cache is None or 
-            self.gradient_timer > 2.0 or  # Update less frequently
-            self.gradient_cache.get_size() != self.screen.get_size()):
-            
-            self.gradient_cache = self.create_gradient_surface(
-                self.screen.get_width(), 
-                self.screen.get_height()
-            )
-            self.gradient_timer = 0
-        
-        # Draw background
-        self.screen.blit(self.gradient_cache, (0, 0))
-        
-        # ☀️ Draw 8-bit sun
-        self.sun.draw(self.screen)
-
-        # Draw layers
-        for layer in self.layers:
-            layer.update_and_draw(self.screen, dt)
-            
-        # Draw hills
-        self.mountain_range.update_and_draw(self.screen, dt)
-            
-        # Draw particles
-        for island in self.islands:
-            island.update_and_draw(self.screen, dt)
-        for p in self.wind_particles:
-            p.update_and_draw(self.screen, dt)
-        for g in self.glow_particles:
-            g.update_and_draw(self.screen, dt)
\ No newline at end of file
+        y_offset = 2 * math.sin(self.float_time)
+        screen.blit(self.image, 
+                   (self.x - self.size//2, self.y + y_offset - self.size//2))
@@ -0,0 +1,25 @@
+class GameClock:
+    """Simulation time, advanced by the main loop rather than read from SDL.
+
+    Everything that animates on "time since start" reads ``clock.ticks()``
+    instead of ``pygame.time.get_ticks()``. ``Game.step`` advances it by each
+    frame's ``dt``, so a replay that feeds the same ``dt`` values sees the
+    same times no matter how fast it runs.
+    """
+
+    def __init__(self):
+        self.time = 0.0  # ms
+
+    def advance(self, dt):
+        self.time += dt
+
+    def ticks(self):
+        """Milliseconds of simulated time, as an int like ``get_ticks``."""
+        return int(self.time)
+
+    def reset(self):
+        self.time = 0.0
+
+
+# Simulation clock for the running game
+clock = GameClock()
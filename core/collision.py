@@ -0,0 +1,164 @@
+import weakref
+import pygame
+
+# -------------------------------------------------------------
+# Collision layers (bit flags)
+# -------------------------------------------------------------
+LAYER_PLAYER = 1
+LAYER_BOLT = 2
+LAYER_ENEMY = 4
+LAYER_PICKUP = 8
+
+# Pixel masks are built once per sprite frame and dropped with the surface
+_mask_cache = weakref.WeakKeyDictionary()
+
+
+def get_mask(surface):
+    """Cached pygame.mask for one sprite frame."""
+    mask = _mask_cache.get(surface)
+    if mask is None:
+        mask = pygame.mask.from_surface(surface)
+        _mask_cache[surface] = mask
+    return mask
+
+
+class CollisionWorld:
+    """Broad-phase spatial hash with pixel-mask narrow phase.
+
+    Bodies are axis-aligned boxes on a uniform grid of ``cell_size``
+    pixels. ``move`` only touches the grid when a body changes cells, so
+    keeping the hash in sync each tick costs little for bodies that barely
+    move. A pair is tested only if one body's layer is in the other's
+    ``collides_with`` mask, and each pair is tested once, in the cell that
+    holds the top-left corner of the two boxes' overlap.
+    """
+
+    # Body record indices
+    X, Y, W, H, LAYER, COLLIDES, MASK, CELLS = range(8)
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}   # (cx, cy) -> {body_id: body}
+        self.bodies = {}  # body_id -> body record
+        self.groups = {}  # group -> slots mirrored by sync()
+        self.contacts = {}
+
+    def _cell_range(self, x, y, w, h):
+        cs = self.cell_size
+        return (int(x // cs), int(y // cs), int((x + w - 1) // cs), int((y + h - 1) // cs))
+
+    def _insert(self, body_id, body):
+        cx0, cy0, cx1, cy1 = body[self.CELLS]
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is None:
+                    cell = self.cells[(cx, cy)] = {}
+                cell[body_id] = body
+
+    def _remove(self, body_id, body):
+        cx0, cy0, cx1, cy1 = body[self.CELLS]
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = self.cells[(cx, cy)]
+                del cell[body_id]
+                if not cell:
+                    del self.cells[(cx, cy)]
+
+    def add(self, body_id, rect, layer, collides_with=0, surface=None):
+        """Register a body; ``surface`` enables the pixel-mask narrow phase."""
+        if body_id in self.bodies:
+            self.remove(body_id)
+        x, y, w, h = rect
+        mask = get_mask(surface) if surface is not None else None
+        body = [x, y, w, h, layer, collides_with, mask, self._cell_range(x, y, w, h)]
+        self.bodies[body_id] = body
+        self._insert(body_id, body)
+
+    def move(self, body_id, x, y, surface=None):
+        body = self.bodies[body_id]
+        body[self.X] = x
+        body[self.Y] = y
+        if surface is not None:
+            body[self.MASK] = get_mask(surface)
+            body[self.W], body[self.H] = surface.get_size()
+        cells = self._cell_range(x, y, body[self.W], body[self.H])
+        if cells != body[self.CELLS]:
+            self._remove(body_id, body)
+            body[self.CELLS] = cells
+            self._insert(body_id, body)
+
+    def remove(self, body_id):
+        body = self.bodies.pop(body_id, None)
+        if body is not None:
+            self._remove(body_id, body)
+
+    def sync(self, group, slots, xs, ys, size, layer, collides_with=0, surface=None):
+        """Mirror a pool of array-backed bodies into the hash.
+
+        Bodies are identified as ``(group, slot)``; slots that appear are
+        added, slots that vanished since the last sync are removed, and the
+        rest are moved.
+        """
+        live = self.groups.get(group, set())
+        current = set()
+        w, h = size
+        for slot, x, y in zip(slots, xs, ys):
+            body_id = (group, slot)
+            current.add(slot)
+            if slot in live:
+                self.move(body_id, x, y)
+            else:
+                self.add(body_id, (x, y, w, h), layer, collides_with, surface)
+        for slot in live - current:
+            self.remove((group, slot))
+        self.groups[group] = current
+
+    def clear(self):
+        self.cells.clear()
+        self.bodies.clear()
+        self.groups.clear()
+        self.contacts = {}
+
+    def _touching(self, a, b):
+        ax, ay, bx, by = a[0], a[1], b[0], b[1]
+        if ax >= bx + b[2] or bx >= ax + a[2] or ay >= by + b[3] or by >= ay + a[3]:
+            return False
+        if a[6] is not None and b[6] is not None:
+            return a[6].overlap(b[6], (int(bx) - int(ax), int(by) - int(ay))) is not None
+        return True
+
+    def collide(self):
+        """Find every touching pair and group them by layer pair.
+
+        Returns (and keeps in ``self.contacts``) a dict mapping
+        ``(layer_a, layer_b)`` with ``layer_a <= layer_b`` to a list of
+        ``(id_a, id_b)`` pairs, where ``id_a`` is on ``layer_a``.
+        """
+        cs = self.cell_size
+        contacts = {}
+        for key, cell in self.cells.items():
+            if len(cell) < 2:
+                continue
+            items = list(cell.items())
+            for i in range(len(items) - 1):
+                id_a, a = items[i]
+                for id_b, b in items[i + 1:]:
+                    if not (a[4] & b[5] or b[4] & a[5]):
+                        continue
+                    # Test the pair only in the cell owning the overlap's corner
+                    corner = (int(max(a[0], b[0]) // cs), int(max(a[1], b[1]) // cs))
+                    if corner != key or not self._touching(a, b):
+                        continue
+                    if a[4] <= b[4]:
+                        contacts.setdefault((a[4], b[4]), []).append((id_a, id_b))
+                    else:
+                        contacts.setdefault((b[4], a[4]), []).append((id_b, id_a))
+        self.contacts = contacts
+        return contacts
+
+    def pairs(self, layer_a, layer_b):
+        """Contacts from the last ``collide()`` between two layers, ``layer_a`` first."""
+        if layer_a <= layer_b:
+            return self.contacts.get((layer_a, layer_b), [])
+        return [(b, a) for a, b in self.contacts.get((layer_b, layer_a), [])]
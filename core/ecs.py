@@ -0,0 +1,137 @@
+import numpy as np
+
+# -------------------------------------------------------------
+# Component layouts: component -> {field: dtype}
+# -------------------------------------------------------------
+COMPONENTS = {
+    "transform": {"x": np.float64, "y": np.float64},
+    "velocity": {"vx": np.float64, "vy": np.float64},
+    "sprite": {"image": np.int32, "scale": np.float32, "alpha": np.float32,
+               "r": np.uint8, "g": np.uint8, "b": np.uint8},
+    "animation": {"phase": np.float64, "speed": np.float64},
+    "lifetime": {"remaining": np.float64},
+    "collider": {"w": np.float32, "h": np.float32, "layer": np.uint8, "collides": np.uint8},
+}
+
+
+class Component:
+    """One component type: a bit in the entity mask plus one array per field."""
+
+    def __init__(self, bit, fields, capacity):
+        self.bit = bit
+        self.fields = fields
+        for name, dtype in fields.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def grow(self, capacity):
+        for name, dtype in self.fields.items():
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+
+class EntityStore:
+    """Entities as indices into contiguous, typed component arrays.
+
+    Every component field is a numpy array indexed by entity id, and each
+    entity carries a bit mask of the components it has. Destroyed ids go on
+    a free stack and are reused, so spawning and despawning creates no
+    per-entity objects. ``step`` runs the built-in systems (movement,
+    animation, lifetime) over all matching entities at once; game code
+    queries the ids it cares about and works on the arrays in bulk.
+    """
+
+    def __init__(self, capacity=256, components=COMPONENTS):
+        self.capacity = capacity
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.masks = np.zeros(capacity, dtype=np.uint32)
+        self.free = list(range(capacity - 1, -1, -1))
+        self.components = {}
+        for name, fields in components.items():
+            self.register(name, fields)
+
+    def register(self, name, fields):
+        component = Component(1 << len(self.components), fields, self.capacity)
+        self.components[name] = component
+        setattr(self, name, component)
+        return component
+
+    def __len__(self):
+        return self.capacity - len(self.free)
+
+    def _grow(self):
+        old = self.capacity
+        self.capacity = old * 2
+        alive = np.zeros(self.capacity, dtype=bool)
+        alive[:old] = self.alive
+        masks = np.zeros(self.capacity, dtype=np.uint32)
+        masks[:old] = self.masks
+        self.alive, self.masks = alive, masks
+        for component in self.components.values():
+            component.grow(self.capacity)
+        self.free.extend(range(self.capacity - 1, old - 1, -1))
+
+    def mask_of(self, *names):
+        mask = 0
+        for name in names:
+            mask |= self.components[name].bit
+        return mask
+
+    def create(self, mask):
+        """Allocate an entity with a component mask; the caller fills the fields."""
+        if not self.free:
+            self._grow()
+        eid = self.free.pop()
+        self.masks[eid] = mask
+        self.alive[eid] = True
+        return eid
+
+    def spawn(self, **components):
+        """Create an entity: ``spawn(transform={"x": 1, "y": 2}, velocity={...})``."""
+        eid = self.create(self.mask_of(*components))
+        for name, values in components.items():
+            component = self.components[name]
+            for field in component.fields:
+                getattr(component, field)[eid] = values.get(field, 0)
+        return eid
+
+    def destroy(self, eids):
+        eids = np.unique(np.asarray(eids, dtype=int))
+        eids = eids[self.alive[eids]]
+        self.alive[eids] = False
+        self.masks[eids] = 0
+        self.free.extend(eids.tolist())
+
+    def clear(self):
+        self.destroy(np.flatnonzero(self.alive))
+
+    def query(self, *names):
+        """Ids of live entities that have every named component."""
+        mask = self.mask_of(*names)
+        return np.flatnonzero(self.alive & ((self.masks & mask) == mask))
+
+    # ---------------------------------------------------------
+    # Built-in systems
+    # ---------------------------------------------------------
+    def step(self, dt):
+        dt_sec = dt / 1000
+        self.movement_system(dt_sec)
+        self.animation_system(dt_sec)
+        self.lifetime_system(dt_sec)
+
+    def movement_system(self, dt_sec):
+        ids = self.query("transform", "velocity")
+        self.transform.x[ids] += self.velocity.vx[ids] * dt_sec
+        self.transform.y[ids] += self.velocity.vy[ids] * dt_sec
+
+    def animation_system(self, dt_sec):
+        ids = self.query("animation")
+        self.animation.phase[ids] += self.animation.speed[ids] * dt_sec
+
+    def lifetime_system(self, dt_sec):
+        ids = self.query("lifetime")
+        self.lifetime.remaining[ids] -= dt_sec
+        expired = ids[self.lifetime.remaining[ids] <= 0]
+        if len(expired):
+            self.destroy(expired)
@@ -0,0 +1,126 @@
+import pygame
+import threading
+from collections import OrderedDict
+from core.memory import memory
+
+
+# -------------------------------------------------------------
+# 🎨 Effect shapes
+# -------------------------------------------------------------
+def _rect(surface, color):
+    surface.fill(color)
+
+
+def _circle(surface, color):
+    w, h = surface.get_size()
+    pygame.draw.circle(surface, color, (w // 2, h // 2), min(w, h) // 2)
+
+
+def _ellipse(surface, color):
+    pygame.draw.ellipse(surface, color, surface.get_rect())
+
+
+def _streak(surface, color):
+    """Horizontal streak fading out from the left edge."""
+    w, h = surface.get_size()
+    r, g, b, a = color
+    for i in range(w):
+        pygame.draw.line(surface, (r, g, b, int(a * (1 - i / w))), (i, 0), (i, h - 1))
+
+
+def _fade(surface, color):
+    """Vertical band fading out from the top edge (drop shadows)."""
+    w, h = surface.get_size()
+    r, g, b, a = color
+    for i in range(h):
+        pygame.draw.line(surface, (r, g, b, int(a * (1 - i / h))), (0, i), (w - 1, i))
+
+
+EFFECT_SHAPES = {
+    "rect": _rect,
+    "circle": _circle,
+    "ellipse": _ellipse,
+    "streak": _streak,
+    "fade": _fade,
+}
+
+
+# -------------------------------------------------------------
+# 🗃️ Shared effect cache
+# -------------------------------------------------------------
+class EffectCache:
+    """Procedural effect surfaces shared by every module, within a byte budget.
+
+    A surface is named by its recipe: shape, size, color, alpha and blend.
+    ``blend="alpha"`` gives a per-pixel-alpha surface for a normal blit;
+    ``blend="add"`` gives an opaque surface with the color premultiplied by
+    alpha, meant to be blitted with ``special_flags=pygame.BLEND_RGB_ADD``.
+    Alpha is rounded to ``alpha_step`` so fading effects share a handful of
+    surfaces instead of one per frame. Least recently used surfaces are
+    dropped once the cache holds more than ``budget`` bytes; callers that
+    keep a surface keep it alive, the cache just stops handing it out.
+    Lookups take a lock, since hill variants are rendered on a worker thread.
+    """
+
+    def __init__(self, budget=8 * 1024 * 1024, alpha_step=8):
+        self.budget = budget
+        memory.bound("effects", budget)  # Fills up to the budget by design
+        self.alpha_step = alpha_step
+        self.surfaces = OrderedDict()  # recipe -> surface, oldest first
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, shape, size, color, alpha=255, blend="alpha"):
+        """The surface for a recipe, built on first use."""
+        step = self.alpha_step
+        alpha = max(0, min(255, int(alpha + step // 2) // step * step))
+        recipe = (shape, (int(size[0]), int(size[1])), tuple(color[:3]), alpha, blend)
+        with self._lock:
+            return self._get(recipe)
+
+    def _get(self, recipe):
+        surface = self.surfaces.get(recipe)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(recipe)
+            return surface
+
+        self.misses += 1
+        surface = self._build(*recipe)
+        self.surfaces[recipe] = surface
+        self.bytes += surface.get_height() * surface.get_pitch()
+        while self.bytes > self.budget and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.bytes -= old.get_height() * old.get_pitch()
+            self.evictions += 1
+        return surface
+
+    def _build(self, shape, size, color, alpha, blend):
+        size = (max(1, size[0]), max(1, size[1]))
+        if blend == "add":
+            surface = memory.surface(size, owner="effects")
+            surface.fill((0, 0, 0))
+            premultiplied = tuple(c * alpha // 255 for c in color)
+            EFFECT_SHAPES[shape](surface, (*premultiplied, 255))
+        else:
+            surface = memory.surface(size, pygame.SRCALPHA, owner="effects")
+            EFFECT_SHAPES[shape](surface, (*color, alpha))
+        return surface
+
+    def clear(self):
+        with self._lock:
+            self.surfaces.clear()
+            self.bytes = 0
+
+    def report(self):
+        lookups = max(1, self.hits + self.misses)
+        return (f"effect cache: {len(self.surfaces)} surfaces, {self.bytes / 1024:.0f} KB "
+                f"of {self.budget / 1024:.0f} KB, {self.hits} hits, {self.misses} misses "
+                f"({100 * self.hits / lookups:.1f}% hit), {self.evictions} evicted")
+
+
+# Shared effect cache for the running game
+effects = EffectCache()
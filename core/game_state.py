@@ -1,7 +1,197 @@
 # core/game_state.py
-class GameState:
+import pygame
+from core import assets
+from core.input_handler import inputs
+from core.latency import latency
+from core.gc_policy import gc_policy
+
+
+# -------------------------------------------------------------
+# 📦 Reference-counted resource sets
+# -------------------------------------------------------------
+def surface_bytes(root):
+    """Pixel bytes of every distinct surface reachable from ``root``.
+
+    Subsurfaces are counted through their parent, so atlases and strips
+    that hand out views of one sheet are only counted once.
+    """
+    seen, surfaces = set(), {}
+    display = pygame.display.get_surface()
+    if display is not None:
+        seen.add(id(display))  # Shared by everything that draws; not owned
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, pygame.Surface):
+            while obj.get_parent() is not None:
+                obj = obj.get_parent()
+            surfaces[id(obj)] = obj.get_height() * obj.get_pitch()
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+            stack.extend(vars(obj).values())
+    return sum(surfaces.values())
+
+
+class Resources:
+    """Named resource sets that load on first use and unload when unused.
+
+    Each set is built by a factory; the object it returns is kept while at
+    least one holder has acquired the set, and its ``release()`` (if any)
+    runs when the last holder lets go, which hands its images back to the
+    shared cache's reference counts.
+    """
+
     def __init__(self):
-        self.current = "menu"
+        self.factories = {}
+        self.loaded = {}  # name -> object
+        self.refs = {}    # name -> holder count
+
+    def define(self, name, factory):
+        self.factories[name] = factory
+
+    def acquire(self, name):
+        if name not in self.loaded:
+            self.loaded[name] = self.factories[name]()
+        self.refs[name] = self.refs.get(name, 0) + 1
+        return self.loaded[name]
+
+    def release(self, name):
+        count = self.refs.get(name, 0) - 1
+        if count > 0:
+            self.refs[name] = count
+            return
+        self.refs.pop(name, None)
+        resource = self.loaded.pop(name, None)
+        if hasattr(resource, "release"):
+            resource.release()
+
+    def get(self, name):
+        return self.loaded[name]
+
+    def close(self):
+        """Release every loaded set, whoever holds it (the game is shutting down)."""
+        for name in list(self.loaded):
+            self.refs[name] = 1
+            self.release(name)
+
+    def report(self):
+        lines = [f"{'resource set':<16} {'refs':>5} {'resident KB':>12}"]
+        for name, resource in sorted(self.loaded.items()):
+            lines.append(f"{name:<16} {self.refs.get(name, 0):5d} {surface_bytes(resource) / 1024:12.0f}")
+        lines.append(f"{'image cache':<16} {'':>5} {assets.cached_bytes() / 1024:12.0f}")
+        return "\n".join(lines)
+
+
+# -------------------------------------------------------------
+# 🎮 States
+# -------------------------------------------------------------
+class GameState:
+    """One state of the game; subclasses override the hooks they need.
+
+    ``resources`` names the resource sets the state needs while it is
+    active. They are acquired before ``enter`` and released after ``exit``,
+    so sets shared with the next state stay loaded across the change.
+
+    ``events`` lists the event types the state needs queued beyond the
+    input system's BASE_EVENTS, and ``handlers`` maps input actions to the
+    names of methods that take the ``Press``; presses of other actions are
+    ignored while the state is active.
+
+    ``pause_gc`` turns off automatic garbage collection while the state is
+    active; the GC policy collects on frames with time to spare instead.
+    """
+
+    name = None
+    resources = ()
+    events = ()
+    handlers = {}
+    pause_gc = False
+
+    def __init__(self, game):
+        self.game = game
+
+    def enter(self, previous):
+        pass
+
+    def exit(self, following):
+        pass
+
+    def update(self, dt, events):
+        pass
+
+    def draw(self, screen):
+        pass
+
+    def close(self):
+        """The game is shutting down; let go of anything held outside the state."""
+        pass
+
+
+class StateManager:
+    """Runs the active GameState and moves between states.
+
+    ``prefetch(name)`` loads a state's resource sets ahead of a change that
+    is known to be coming; the change then finds them already resident.
+    """
+
+    def __init__(self, resources):
+        self.resources = resources
+        self.states = {}
+        self.state = None
+        self.prefetched = {}  # state name -> resource sets held early
+
+    @property
+    def current(self):
+        return self.state.name if self.state else None
+
+    def add(self, state):
+        self.states[state.name] = state
+
+    def prefetch(self, name):
+        if name in self.prefetched:
+            return
+        sets = self.states[name].resources
+        for resource in sets:
+            self.resources.acquire(resource)
+        self.prefetched[name] = sets
+
+    def change(self, name):
+        previous, following = self.state, self.states[name]
+        if previous is not None:
+            previous.exit(following)
+
+        for resource in following.resources:
+            self.resources.acquire(resource)
+        for resource in self.prefetched.pop(name, ()):
+            self.resources.release(resource)
+        if previous is not None:
+            for resource in previous.resources:
+                self.resources.release(resource)
+
+        self.state = following
+        inputs.allow(following.events)
+        following.enter(previous)
+        gc_policy.enter(following)
+
+    def handle(self, press):
+        """Dispatch one input press through the active state's handler table."""
+        method = self.state.handlers.get(press.action)
+        if method is not None:
+            getattr(self.state, method)(press)
+            latency.respond(press.action)  # Drawn by this frame's draw
+
+    def update(self, dt, events):
+        self.state.update(dt, events)
+
+    def draw(self, screen):
+        self.state.draw(screen)
 
-    def set_state(self, new_state):
-        self.current = new_state
+    def close(self):
+        for state in self.states.values():
+            state.close()
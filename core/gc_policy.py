@@ -0,0 +1,97 @@
+import gc
+import time
+
+
+class GCPolicy:
+    """When the cyclic garbage collector is allowed to run.
+
+    ``settle`` runs once the game is built: a full collection, then
+    ``gc.freeze`` moves everything left (modules, loaded assets, the states)
+    into the permanent generation so no later collection walks it again.
+    States with ``pause_gc`` set turn automatic collection off while they
+    are active. ``end_frame`` then collects by hand on frames that finished
+    with at least ``slack_ms`` to spare, one generation at a time and only
+    once the collector's own thresholds say it is due. If garbage piles up
+    to ``overdue`` times the young threshold, it collects anyway so nothing
+    runs away. Every state change unfreezes and settles again, since the
+    frame is already a long one and the previous state's assets have just
+    been let go. Off until ``enabled`` is set (main.py and the soak tool
+    opt in), which leaves Python's default collector alone; ``restore``
+    hands collection back to Python when the game closes.
+    """
+
+    def __init__(self, frame_ms=1000 / 60, slack_ms=4.0, overdue=10):
+        self.enabled = False
+        self.engaged = False  # Whether GC settings have been changed and need restoring
+        self.frame_ms = frame_ms
+        self.slack_ms = slack_ms
+        self.overdue = overdue
+        self.paused = False
+        self.pauses = {}  # (generation, reason) -> [count, total ms, max ms]
+
+    def _collect(self, generation, reason):
+        start = time.perf_counter()
+        gc.collect(generation)
+        ms = (time.perf_counter() - start) * 1000
+        entry = self.pauses.setdefault((generation, reason), [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += ms
+        entry[2] = max(entry[2], ms)
+
+    def settle(self):
+        """Full collection, then freeze what survived."""
+        if not self.enabled:
+            return
+        self._collect(2, "settle")
+        gc.freeze()
+
+    def enter(self, state):
+        """Called on every state change, once ``state`` has entered."""
+        if not self.enabled:
+            return
+        self.engaged = True
+        gc.unfreeze()
+        self.settle()
+        self.paused = state.pause_gc
+        if self.paused:
+            gc.disable()
+        else:
+            gc.enable()
+
+    def restore(self):
+        """Undo the policy: unfreeze and turn automatic collection back on."""
+        if not self.engaged:
+            return
+        gc.unfreeze()
+        gc.enable()
+        self.paused = False
+        self.engaged = False
+
+    def end_frame(self, work_ms):
+        """Collect what is due if the frame that took ``work_ms`` left room."""
+        if not self.paused:
+            return
+        counts, thresholds = gc.get_count(), gc.get_threshold()
+        if counts[0] < thresholds[0]:
+            return
+        if work_ms > self.frame_ms - self.slack_ms and counts[0] < thresholds[0] * self.overdue:
+            return
+        # The oldest generation that is due, as the automatic collector would pick
+        generation = 0
+        if counts[1] >= thresholds[1]:
+            generation = 2 if counts[2] >= thresholds[2] else 1
+        self._collect(generation, "idle")
+
+    def report(self):
+        if not self.pauses:
+            return "gc policy: no collections"
+        lines = [f"gc policy ({'paused' if self.paused else 'automatic'} now, "
+                 f"{gc.get_freeze_count()} objects frozen)"]
+        lines.append(f"{'collection':<16} {'count':>6} {'mean ms':>8} {'max ms':>8}")
+        for (generation, reason), (count, total, peak) in sorted(self.pauses.items()):
+            lines.append(f"{f'gen{generation} {reason}':<16} {count:6d} {total / count:8.2f} {peak:8.2f}")
+        return "\n".join(lines)
+
+
+# GC policy for the running game
+gc_policy = GCPolicy()
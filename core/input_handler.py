@@ -1,19 +1,180 @@
 # core/input_handler.py
+import time
+from collections import namedtuple
 import pygame
+from core.latency import latency
 
-def handle_input(events, player=None):
-    for event in events:
-        if event.type == pygame.QUIT:
-            return "quit"
-
-    keys = pygame.key.get_pressed()
-    if player:
-        if keys[pygame.K_w]:
-            player.move(0, -1)
-        if keys[pygame.K_s]:
-            player.move(0, 1)
-        if keys[pygame.K_a]:
-            player.move(-1, 0)
-        if keys[pygame.K_d]:
-            player.move(1, 0)
-    return None
+# -------------------------------------------------------------
+# ⌨️ Bindings
+# -------------------------------------------------------------
+KEY_BINDINGS = {
+    pygame.K_LEFT: "left", pygame.K_a: "left",
+    pygame.K_RIGHT: "right", pygame.K_d: "right",
+    pygame.K_UP: "up", pygame.K_w: "up",
+    pygame.K_DOWN: "down", pygame.K_s: "down",
+    pygame.K_SPACE: "fire",
+    pygame.K_RETURN: "confirm", pygame.K_KP_ENTER: "confirm",
+    pygame.K_F9: "report",
+    pygame.K_F10: "dump",
+}
+BUTTON_BINDINGS = {
+    1: "click",  # Left mouse button
+}
+
+# Always let these through: quitting, key releases (so nothing sticks held
+# across a state change) and focus loss; states add the rest they need
+BASE_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.WINDOWFOCUSLOST)
+
+# One press of an action: when it was polled (perf_counter seconds) and
+# where the mouse was
+Press = namedtuple("Press", "action time pos")
+
+
+class InputSystem:
+    """Keys and buttons mapped to actions, fed once per frame from events.
+
+    ``poll`` reads the SDL queue, stamps each event with the time it was
+    read and collapses mouse motion to the frame's last position, so a
+    flood of motion events costs the same as one. ``allow`` narrows the
+    queue to the event types the active state handles. ``feed`` turns the
+    frame's events into ``presses`` (one Press per bound key or button going
+    down, in order) and tracks which actions are held; ``active(action)`` is
+    true while held *or* if it was pressed this frame, so a tap that goes
+    down and up between two frames is not lost. Gameplay reads this rather
+    than polling SDL, so the live queue and a recorded session drive the
+    game the same way.
+    """
+
+    def __init__(self, keys=KEY_BINDINGS, buttons=BUTTON_BINDINGS):
+        self.keys = keys
+        self.buttons = buttons
+        self.held = set()     # keys down
+        self.down = set()     # actions held
+        self.mouse = (0, 0)
+        self.presses = []     # this frame's Press list
+        self.pressed = set()  # actions pressed this frame
+
+    def allow(self, types):
+        """Only queue BASE_EVENTS plus ``types`` from now on."""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(BASE_EVENTS) + list(types))
+
+    def poll(self):
+        """This frame's events from SDL, time-stamped, with motion collapsed."""
+        now = time.perf_counter()
+        events = pygame.event.get()
+        for event in events:
+            event.stamp = now
+        return self._collapse_motion(events)
+
+    def poll_until(self, deadline):
+        """Keep polling about once a millisecond until ``deadline`` (a
+        ``time.perf_counter`` value). Used instead of sleeping in
+        ``Clock.tick`` when measuring latency, so each stamp is within a
+        millisecond of the event arriving rather than up to a frame late."""
+        events = []
+        while True:
+            now = time.perf_counter()
+            for event in pygame.event.get():
+                event.stamp = now
+                events.append(event)
+            if now >= deadline:
+                return self._collapse_motion(events)
+            pygame.time.wait(1)
+
+    @staticmethod
+    def _collapse_motion(events):
+        motion = None
+        kept = []
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                motion = event
+            else:
+                kept.append(event)
+        if motion is not None:
+            kept.append(motion)
+        return kept
+
+    def feed(self, events):
+        now = time.perf_counter()
+        self.presses = []
+        self.pressed.clear()
+        changed = False
+        for event in events:
+            kind = event.type
+            if kind == pygame.KEYDOWN:
+                self.held.add(event.key)
+                changed = True
+                action = self.keys.get(event.key)
+                if action:
+                    self._press(action, getattr(event, "stamp", now))
+            elif kind == pygame.KEYUP:
+                self.held.discard(event.key)
+                changed = True
+            elif kind == pygame.MOUSEMOTION:
+                self.mouse = event.pos
+            elif kind == pygame.MOUSEBUTTONDOWN:
+                self.mouse = event.pos
+                action = self.buttons.get(event.button)
+                if action:
+                    self._press(action, getattr(event, "stamp", now))
+            elif kind == pygame.MOUSEBUTTONUP:
+                self.mouse = event.pos
+            elif kind == pygame.WINDOWFOCUSLOST:
+                self.held.clear()  # Key-ups go to another window
+                changed = True
+        if changed:
+            self.down = {self.keys[key] for key in self.held if key in self.keys}
+
+    def _press(self, action, stamp):
+        self.presses.append(Press(action, stamp, self.mouse))
+        self.pressed.add(action)
+        latency.press(action, stamp)
+
+    def active(self, action):
+        return action in self.down or action in self.pressed
+
+    def reset(self):
+        self.held.clear()
+        self.down = set()
+        self.mouse = (0, 0)
+        self.presses = []
+        self.pressed.clear()
+
+
+# Input system for the running game
+inputs = InputSystem()
+
+
+# -------------------------------------------------------------
+# 🎮 Player actions
+# -------------------------------------------------------------
+class PlayerActions:
+    """One frame of player intent: a movement direction and whether to fire.
+
+    ``move_x`` and ``move_y`` run from -1 to 1 (right and down positive).
+    ``Player.update`` consumes these rather than reading keys, so the
+    keyboard and an autopilot are interchangeable sources.
+    """
+
+    __slots__ = ("move_x", "move_y", "fire")
+
+    def __init__(self, move_x=0.0, move_y=0.0, fire=False):
+        self.move_x = move_x
+        self.move_y = move_y
+        self.fire = fire
+
+
+class KeyboardPilot:
+    """Player actions from the bound movement and fire actions."""
+
+    def actions(self, player, enemies, dt):
+        active = inputs.active
+        move_x = active("right") - active("left")
+        if active("up"):
+            move_y = -1  # Up wins when both are held
+        elif active("down"):
+            move_y = 1
+        else:
+            move_y = 0
+        return PlayerActions(move_x, move_y, active("fire"))
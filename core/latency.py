@@ -0,0 +1,93 @@
+import time
+
+# Histogram bucket upper edges in ms (the last bucket is everything above)
+BUCKETS_MS = (8, 16, 24, 33, 50, 67, 100, 150, 250)
+
+
+class LatencyTracker:
+    """Input-to-display latency per action.
+
+    Presses come in time-stamped from the input system (``press``). Code
+    that produces the visible result of an action calls ``respond(action)``
+    in the frame it does so (a bolt spawning, the witch moving, a menu
+    selection changing); the next ``presented`` after ``display.flip`` then
+    closes every responded press with the time from its stamp to the flip
+    and the number of frames it took. Presses nothing responds to within
+    ``expire`` seconds (a tap during the fire cooldown) are counted as
+    dropped. Off unless ``enabled`` is set, so the normal loop pays nothing.
+    """
+
+    def __init__(self, expire=1.0):
+        self.enabled = False
+        self.expire = expire
+        self.frame = 0
+        self.pending = {}    # action -> [(stamp, frame pressed)]
+        self.responded = []  # [(action, stamp, frame pressed)] awaiting a flip
+        self.samples = {}    # action -> [(ms, frames)]
+        self.dropped = {}    # action -> count
+
+    def press(self, action, stamp):
+        if self.enabled:
+            self.pending.setdefault(action, []).append((stamp, self.frame))
+
+    def respond(self, action):
+        """The result of ``action`` was drawn into this frame."""
+        if not self.enabled:
+            return
+        waiting = self.pending.pop(action, None)
+        if waiting:
+            self.responded.extend((action, stamp, frame) for stamp, frame in waiting)
+
+    def presented(self):
+        """Call right after ``pygame.display.flip()`` on frames that were drawn."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        for action, stamp, frame in self.responded:
+            self.samples.setdefault(action, []).append(((now - stamp) * 1000, self.frame - frame + 1))
+        self.responded = []
+        for action, waiting in list(self.pending.items()):
+            fresh = [(stamp, frame) for stamp, frame in waiting if now - stamp < self.expire]
+            if len(fresh) < len(waiting):
+                self.dropped[action] = self.dropped.get(action, 0) + len(waiting) - len(fresh)
+            if fresh:
+                self.pending[action] = fresh
+            else:
+                del self.pending[action]
+
+    def end_frame(self):
+        if self.enabled:
+            self.frame += 1
+
+    def histogram(self, action):
+        """Counts per BUCKETS_MS bucket for ``action``, plus one overflow bucket."""
+        counts = [0] * (len(BUCKETS_MS) + 1)
+        for ms, _ in self.samples.get(action, ()):
+            index = 0
+            while index < len(BUCKETS_MS) and ms > BUCKETS_MS[index]:
+                index += 1
+            counts[index] += 1
+        return counts
+
+    def report(self):
+        if not self.samples and not self.dropped:
+            return "input latency: no presses measured"
+        edges = [f"<={edge}" for edge in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"]
+        lines = [f"{'action':<10} {'n':>5} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>7} {'frames':>7} {'dropped':>8}  "
+                 + " ".join(f"{edge:>5}" for edge in edges)]
+        for action in sorted(set(self.samples) | set(self.dropped)):
+            samples = self.samples.get(action, [])
+            ordered = sorted(ms for ms, _ in samples)
+            frames = sorted(n for _, n in samples)
+            if ordered:
+                stats = (f"{ordered[len(ordered) // 2]:7.1f} {ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]:7.1f} "
+                         f"{ordered[-1]:7.1f} {frames[len(frames) // 2]:7d}")
+            else:
+                stats = f"{'-':>7} {'-':>7} {'-':>7} {'-':>7}"
+            lines.append(f"{action:<10} {len(samples):5d} {stats} {self.dropped.get(action, 0):8d}  "
+                         + " ".join(f"{count:5d}" for count in self.histogram(action)))
+        return "\n".join(lines)
+
+
+# Input latency tracker for the running game
+latency = LatencyTracker()
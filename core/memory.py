@@ -0,0 +1,118 @@
+import weakref
+import pygame
+
+
+class SurfaceTracker:
+    """Live surface memory by owner tag.
+
+    Code that creates surfaces through the asset and cache layers either
+    asks the tracker for them (``surface``) or registers them (``track``)
+    under an owner tag. A weak-reference finalizer takes each surface back
+    off the books when it is freed, so ``resident()`` is what is actually
+    alive. ``end_frame`` closes the frame's allocation counts and, every
+    ``sample_every`` frames, samples resident bytes per owner so that
+    ``growing()`` can point at owners that keep climbing over a soak run.
+    """
+
+    def __init__(self, history=600, sample_every=60, samples=120):
+        self.enabled = True
+        self.history = history
+        self.sample_every = sample_every
+        self.max_samples = samples
+        self.bytes = {}    # owner -> resident bytes
+        self.counts = {}   # owner -> live surfaces
+        self.current = {}  # owner -> [allocations, bytes] this frame
+        self.frames = []   # recent per-frame allocation dicts
+        self.samples = []  # resident-bytes snapshots, oldest first
+        self.bounds = {}   # owner -> byte ceiling the owner enforces itself
+        self.frame_count = 0
+
+    def track(self, surface, owner):
+        """Count ``surface`` against ``owner`` until it is freed; returns it."""
+        if not self.enabled:
+            return surface
+        size = surface.get_height() * surface.get_pitch()
+        self.bytes[owner] = self.bytes.get(owner, 0) + size
+        self.counts[owner] = self.counts.get(owner, 0) + 1
+        frame = self.current.setdefault(owner, [0, 0])
+        frame[0] += 1
+        frame[1] += size
+        weakref.finalize(surface, self._freed, owner, size)
+        return surface
+
+    def bound(self, owner, limit):
+        """Declare that ``owner`` keeps itself under ``limit`` bytes (a cache
+        with a budget), so filling up to it is not reported as growth."""
+        self.bounds[owner] = limit
+
+    def surface(self, size, flags=0, owner="untagged"):
+        """A new tracked ``pygame.Surface``."""
+        return self.track(pygame.Surface(size, flags), owner)
+
+    def _freed(self, owner, size):
+        self.bytes[owner] -= size
+        self.counts[owner] -= 1
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.frames.append(self.current)
+        if len(self.frames) > self.history:
+            del self.frames[0]
+        self.current = {}
+        self.frame_count += 1
+        if self.frame_count % self.sample_every == 0:
+            self.samples.append(dict(self.bytes))
+            if len(self.samples) > self.max_samples:
+                del self.samples[0]
+
+    def resident(self):
+        return {owner: size for owner, size in self.bytes.items() if self.counts[owner]}
+
+    def allocations(self):
+        """{owner: (allocations per frame, bytes per frame)} averaged over the kept history."""
+        totals = {}
+        for frame in self.frames:
+            for owner, (count, size) in frame.items():
+                total = totals.setdefault(owner, [0, 0])
+                total[0] += count
+                total[1] += size
+        frames = max(1, len(self.frames))
+        return {owner: (count / frames, size / frames) for owner, (count, size) in totals.items()}
+
+    def growing(self, min_samples=6, min_bytes=64 * 1024):
+        """Owners whose resident bytes keep rising: every sample in the later
+        half of the run sits above every sample in the earlier half, and the
+        total rise is at least ``min_bytes``. Bounded owners are only
+        flagged once they pass their bound."""
+        if len(self.samples) < min_samples:
+            return {}
+        half = len(self.samples) // 2
+        early, late = self.samples[:half], self.samples[half:]
+        flagged = {}
+        for owner in self.samples[-1]:
+            if self.samples[-1][owner] <= self.bounds.get(owner, -1):
+                continue
+            before = max(sample.get(owner, 0) for sample in early)
+            after = min(sample.get(owner, 0) for sample in late)
+            rise = self.samples[-1][owner] - self.samples[0].get(owner, 0)
+            if after > before and rise >= min_bytes:
+                flagged[owner] = rise
+        return flagged
+
+    def report(self):
+        allocations = self.allocations()
+        resident = self.resident()
+        owners = sorted(set(resident) | set(allocations), key=lambda o: -resident.get(o, 0))
+        lines = [f"{'owner':<24} {'live':>6} {'resident KB':>12} {'allocs/frame':>13} {'KB/frame':>9}"]
+        for owner in owners:
+            count, size = allocations.get(owner, (0.0, 0.0))
+            lines.append(f"{owner:<24} {self.counts.get(owner, 0):6d} {resident.get(owner, 0) / 1024:12.0f} "
+                         f"{count:13.2f} {size / 1024:9.1f}")
+        for owner, rise in sorted(self.growing().items(), key=lambda item: -item[1]):
+            lines.append(f"[LEAK?] {owner} grew by {rise / 1024:.0f} KB over the run")
+        return "\n".join(lines)
+
+
+# Shared surface tracker for the running game
+memory = SurfaceTracker()
@@ -0,0 +1,306 @@
+import math
+import pygame
+from core.assets import AssetScope
+from core.ecs import EntityStore
+from core.scroll_strip import ScrollStrip
+from core.memory import memory
+
+
+# -------------------------------------------------------------
+# 🌄 Parallax Engine
+# -------------------------------------------------------------
+class ParallaxEngine:
+    """Layered parallax renderer driven by a declarative scene definition.
+
+    A scene is a dict with a ``name`` and an ordered list of ``layers``;
+    each layer spec names its class under ``type`` and passes the rest of
+    its keys as constructor arguments. Layers share the image cache through
+    one AssetScope per engine, so ``release()`` frees everything the scene
+    holds and the next update loads it again.
+
+    Layer classes that set ``uses_world`` also get the engine's EntityStore
+    as ``world``; the engine steps it once per update before the layers run.
+    Classes that load images with fixed options list them in
+    ``image_options`` so ``image_recipes`` can report them for baking.
+    """
+
+    def __init__(self, scene, view_size, preload=True):
+        self.scene = scene
+        self.view_size = view_size
+        self.scope = AssetScope(scene["name"])
+        self.layers = []
+        self.named = {}
+        self.world = None
+        if preload:
+            self.load()
+
+    @property
+    def loaded(self):
+        return bool(self.layers)
+
+    def load(self):
+        if self.loaded:
+            return
+        self.world = EntityStore()
+        for spec in self.scene["layers"]:
+            params = dict(spec)
+            layer_type = params.pop("type")
+            name = params.pop("name", None)
+            if getattr(layer_type, "uses_world", False):
+                params["world"] = self.world
+            layer = layer_type(self.scope, self.view_size, **params)
+            self.layers.append(layer)
+            if name:
+                self.named[name] = layer
+
+    def release(self):
+        """Drop every layer and the scene's cached images."""
+        self.layers = []
+        self.named = {}
+        self.world = None
+        self.scope.release()
+
+    def update(self, dt):
+        if not self.loaded:
+            self.load()
+        self.world.step(dt)
+        for layer in self.layers:
+            layer.update(dt)
+
+    def draw(self, surface):
+        for layer in self.layers:
+            layer.draw(surface)
+
+    def update_and_draw(self, surface, dt):
+        self.update(dt)
+        self.draw(surface)
+
+
+def image_recipes(scene):
+    """(path, scale, pixelate, smooth) for every image a scene loads."""
+    recipes = set()
+    for spec in scene["layers"]:
+        options = {"scale": None, "pixelate": False, "smooth": False}
+        options.update(getattr(spec["type"], "image_options", {}))
+        options.update({key: spec[key] for key in options if key in spec})
+        paths = [spec["image"]] if "image" in spec else spec.get("images", [])
+        for path in paths:
+            recipes.add((path, options["scale"], options["pixelate"], options["smooth"]))
+    return recipes
+
+
+# -------------------------------------------------------------
+# 🎨 Sky Gradient
+# -------------------------------------------------------------
+class GradientLayer:
+    """Vertical gradient through evenly spaced color stops, baked once.
+
+    With ``steps`` the gradient is drawn as flat 8-bit bands, and
+    ``quantize`` snaps each channel down to a multiple of that value.
+    """
+
+    def __init__(self, scope, view_size, stops, steps=None, quantize=None):
+        width, height = view_size
+        self.surface = memory.surface((width, height), owner="parallax")
+
+        if steps:
+            step_height = height // steps
+            for step in range(steps):
+                color = self._blend(stops, step / steps, quantize)
+                y_start = step * step_height
+                y_end = min((step + 1) * step_height, height)
+                pygame.draw.rect(self.surface, color, (0, y_start, width, y_end - y_start))
+        else:
+            segments = len(stops) - 1
+            segment_height = height // segments
+            for y in range(height):
+                segment = min(y // segment_height, segments - 1)
+                blend = (y - segment * segment_height) / segment_height
+                color = self._lerp(stops[segment], stops[segment + 1], blend, quantize)
+                pygame.draw.line(self.surface, color, (0, y), (width, y))
+
+    @staticmethod
+    def _lerp(a, b, blend, quantize):
+        color = [int(a[i] * (1 - blend) + b[i] * blend) for i in range(3)]
+        if quantize:
+            color = [(c // quantize) * quantize for c in color]
+        return tuple(color)
+
+    @classmethod
+    def _blend(cls, stops, t, quantize):
+        segments = len(stops) - 1
+        segment = min(int(t * segments), segments - 1)
+        return cls._lerp(stops[segment], stops[segment + 1], t * segments - segment, quantize)
+
+    def update(self, dt):
+        pass
+
+    def draw(self, surface):
+        surface.blit(self.surface, (0, 0))
+
+
+# -------------------------------------------------------------
+# 🌞 Sun
+# -------------------------------------------------------------
+class SunLayer:
+    """Sun in one of two styles.
+
+    ``pixel``: concentric 8-bit squares, rendered once and added to the sky.
+    ``glow``: soft pulsing circles, re-rendered into the same surface every
+    ``refresh_ms`` milliseconds.
+    """
+
+    def __init__(self, scope, view_size, pos, radius, style="pixel", glow_radius=None, refresh_ms=50):
+        self.x, self.y = pos
+        self.radius = radius
+        self.style = style
+        self.timer = 0.0
+        self.refresh_ms = refresh_ms
+        self.since_refresh = 0
+
+        if style == "glow":
+            self.glow_radius = glow_radius or radius * 2
+            size = self.glow_radius * 2
+            self.surface = memory.surface((size, size), pygame.SRCALPHA, owner="parallax")
+            self._render_glow()
+            self.core_surface = None
+        else:
+            self.surface, self.core_surface = self._render_pixel()
+
+    def _render_pixel(self):
+        """Create 8-bit style sun surfaces"""
+        # Simple glow (concentric squares for 8-bit)
+        glow_surface = memory.surface((self.radius * 4, self.radius * 4), pygame.SRCALPHA, owner="parallax")
+
+        # Create pixelated glow effect
+        glow_colors = [
+            (255, 220, 120, 60),
+            (255, 200, 100, 90),
+            (255, 180, 80, 120)
+        ]
+
+        pulse = 0.5
+        for color, size_factor in [(glow_colors[0], 1.5),
+                                   (glow_colors[1], 1.2),
+                                   (glow_colors[2], 1.0)]:
+            size = int(self.radius * size_factor * (0.9 + 0.1 * pulse))
+            # Draw square for 8-bit style
+            rect = pygame.Rect(
+                glow_surface.get_width() // 2 - size // 2,
+                glow_surface.get_height() // 2 - size // 2,
+                size, size
+            )
+            pygame.draw.rect(glow_surface, color, rect)
+
+        # Sun core (simple square)
+        core_surface = memory.surface((self.radius, self.radius), pygame.SRCALPHA, owner="parallax")
+        core_color = (255, 240, 180, 255)
+        pygame.draw.rect(core_surface, core_color, (0, 0, self.radius, self.radius))
+
+        # Add pixel grid effect
+        bright = (min(255, core_color[0] + 20),
+                  min(255, core_color[1] + 20),
+                  min(255, core_color[2] + 20),
+                  255)
+        for x in range(0, self.radius, 4):
+            for y in range(0, self.radius, 4):
+                if (x + y) % 8 == 0:
+                    pygame.draw.rect(core_surface, bright, (x, y, 2, 2))
+
+        return glow_surface, core_surface
+
+    def _render_glow(self):
+        sun_surface = self.surface
+        sun_surface.fill((0, 0, 0, 0))
+        center = (self.glow_radius, self.glow_radius)
+
+        # Outer magical glow
+        for i in range(5):
+            alpha = 80 - i * 12
+            radius = self.radius * 2 + i * 20 + math.sin(self.timer * 0.7) * 8
+            pygame.draw.circle(sun_surface, (255, 220, 160, alpha), center, int(radius))
+
+        # Inner sun glow
+        for i in range(4):
+            alpha = 180 - i * 30
+            radius = self.radius + i * 12 + math.sin(self.timer) * 6
+            pygame.draw.circle(sun_surface, (255, 230, 180, alpha), center, int(radius))
+
+        # Sun core
+        pygame.draw.circle(sun_surface, (255, 240, 200, 255), center, int(self.radius * 0.8))
+
+    def update(self, dt):
+        self.timer += dt * 0.001
+        if self.style == "glow":
+            self.since_refresh += dt
+            if self.since_refresh >= self.refresh_ms:
+                self.since_refresh = 0
+                self._render_glow()
+
+    def draw(self, screen):
+        if self.style == "glow":
+            screen.blit(self.surface, (self.x - self.glow_radius, self.y - self.glow_radius))
+            return
+
+        # Draw glow
+        screen.blit(self.surface,
+                   (self.x - self.surface.get_width() // 2,
+                    self.y - self.surface.get_height() // 2),
+                   special_flags=pygame.BLEND_RGBA_ADD)
+
+        # Draw core
+        screen.blit(self.core_surface,
+                   (self.x - self.core_surface.get_width() // 2,
+                    self.y - self.core_surface.get_height() // 2),
+                   special_flags=pygame.BLEND_RGBA_ADD)
+
+
+# -------------------------------------------------------------
+# 🏔️ Scrolling Image Plane
+# -------------------------------------------------------------
+class StripLayer:
+    """One image plane scrolled through a baked ScrollStrip.
+
+    With ``align_bottom`` the ``y`` offset is measured from the bottom of
+    the view instead of the top.
+    """
+
+    def __init__(self, scope, view_size, image, speed, y=0, period=None,
+                 scale=None, pixelate=False, smooth=False, align_bottom=False):
+        view_w, view_h = view_size
+        source = scope.image(image, scale=scale, pixelate=pixelate, smooth=smooth)
+
+        self.y = view_h - source.get_height() + y if align_bottom else y
+        self.strip = ScrollStrip.tiled(source, speed, view_w, period=period)
+
+    def update(self, dt):
+        self.strip.update(dt)
+
+    def draw(self, surface):
+        self.strip.draw(surface, self.y)
+
+
+# -------------------------------------------------------------
+# ✨ Particle Set
+# -------------------------------------------------------------
+class ParticleLayer:
+    """A fixed number of particle objects updated and drawn together.
+
+    Each particle is built as ``particle(view_size, **kwargs)``; an
+    ``image`` path is loaded through the scene scope first.
+    """
+
+    image_options = {"pixelate": True}
+
+    def __init__(self, scope, view_size, particle, count, image=None, **kwargs):
+        if image is not None:
+            kwargs["image"] = scope.image(image, **self.image_options)
+        self.particles = [particle(view_size, **kwargs) for _ in range(count)]
+
+    def update(self, dt):
+        for p in self.particles:
+            p.update(dt)
+
+    def draw(self, surface):
+        for p in self.particles:
+            p.draw(surface)
@@ -0,0 +1,63 @@
+import time
+from contextlib import contextmanager
+
+
+class FrameProfiler:
+    """Per-frame timings of named subsystems.
+
+    Subsystems wrap their work in ``profiler.section(name)`` (or call
+    ``record`` directly); the main loop calls ``end_frame`` once per frame
+    to close the frame's totals into a rolling history.
+    """
+
+    def __init__(self, history=600):
+        self.enabled = True
+        self.history = history
+        self.current = {}  # name -> ms accumulated this frame
+        self.frames = []   # list of {name: ms} for recent frames
+
+    @contextmanager
+    def section(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def record(self, name, ms):
+        self.current[name] = self.current.get(name, 0.0) + ms
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.frames.append(self.current)
+        if len(self.frames) > self.history:
+            del self.frames[0]
+        self.current = {}
+
+    def last(self, name):
+        """Cost of ``name`` in the most recent finished frame, in ms."""
+        return self.frames[-1].get(name, 0.0) if self.frames else 0.0
+
+    def summary(self):
+        """{name: (mean_ms, max_ms)} over the kept history."""
+        totals = {}
+        for frame in self.frames:
+            for name, ms in frame.items():
+                total, peak = totals.get(name, (0.0, 0.0))
+                totals[name] = (total + ms, max(peak, ms))
+        count = max(1, len(self.frames))
+        return {name: (total / count, peak) for name, (total, peak) in totals.items()}
+
+    def report(self):
+        lines = [f"{'section':<24} {'mean ms':>9} {'max ms':>9}"]
+        for name, (mean, peak) in sorted(self.summary().items()):
+            lines.append(f"{name:<24} {mean:9.3f} {peak:9.3f}")
+        return "\n".join(lines)
+
+
+# Shared profiler for the running game
+profiler = FrameProfiler()
@@ -0,0 +1,98 @@
+import hashlib
+import struct
+import zlib
+import pygame
+
+MAGIC = b"ZREC"
+VERSION = 2
+HEADER = struct.Struct("<4sHQBB")  # magic, version, seed, then lengths of the start state and autopilot names
+FRAME = struct.Struct("<dH")      # dt (ms), event count
+EVENT = struct.Struct("<HiHIhhB")  # type, key, mod, unicode, x, y, button
+DIGEST_SIZE = 20
+
+# Only the events the game reacts to are recorded
+RECORDED_EVENTS = (
+    pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.WINDOWFOCUSLOST,
+)
+
+
+def encode_event(event):
+    x, y = getattr(event, "pos", (0, 0))
+    unicode = getattr(event, "unicode", "")
+    return EVENT.pack(event.type, getattr(event, "key", 0), getattr(event, "mod", 0),
+                      ord(unicode) if len(unicode) == 1 else 0,
+                      x, y, getattr(event, "button", 0))
+
+
+def decode_event(data, offset):
+    kind, key, mod, unicode, x, y, button = EVENT.unpack_from(data, offset)
+    return pygame.event.Event(kind, key=key, mod=mod, unicode=chr(unicode) if unicode else "",
+                              pos=(x, y), rel=(0, 0), buttons=(0, 0, 0), button=button)
+
+
+def screen_digest(surface):
+    """SHA-1 of a surface's pixels, to check a replay ended on the same frame."""
+    return hashlib.sha1(pygame.image.tobytes(surface, "RGB")).digest()
+
+
+class Recording:
+    """A played session: the seed, start state and autopilot (if any), then
+    every frame's dt and events.
+
+    Saved files are zlib-compressed; ``digest`` is the hash of the last frame
+    drawn, which a replay compares against to prove it reproduced the run.
+    """
+
+    def __init__(self, seed, start="menu", autopilot=None):
+        self.seed = seed
+        self.start = start
+        self.autopilot = autopilot
+        self.frames = []  # [(dt, [events])]
+        self.digest = None
+
+    def add(self, dt, events):
+        self.frames.append((dt, [e for e in events if e.type in RECORDED_EVENTS]))
+
+    @property
+    def duration(self):
+        """Simulated milliseconds."""
+        return sum(dt for dt, _ in self.frames)
+
+    def save(self, path):
+        start, autopilot = self.start.encode(), (self.autopilot or "").encode()
+        chunks = [HEADER.pack(MAGIC, VERSION, self.seed, len(start), len(autopilot)), start, autopilot,
+                  self.digest or bytes(DIGEST_SIZE)]
+        for dt, events in self.frames:
+            chunks.append(FRAME.pack(dt, len(events)))
+            chunks.extend(encode_event(e) for e in events)
+        with open(path, "wb") as f:
+            f.write(zlib.compress(b"".join(chunks), 9))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = zlib.decompress(f.read())
+        magic, version, seed, start_size, autopilot_size = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} recording")
+        offset = HEADER.size
+        start = data[offset:offset + start_size].decode()
+        offset += start_size
+        autopilot = data[offset:offset + autopilot_size].decode() or None
+        offset += autopilot_size
+        recording = cls(seed, start, autopilot)
+        digest = data[offset:offset + DIGEST_SIZE]
+        recording.digest = digest if any(digest) else None
+        offset += DIGEST_SIZE
+
+        while offset < len(data):
+            dt, count = FRAME.unpack_from(data, offset)
+            offset += FRAME.size
+            events = []
+            for _ in range(count):
+                events.append(decode_event(data, offset))
+                offset += EVENT.size
+            recording.frames.append((dt, events))
+        return recording
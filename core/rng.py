@@ -0,0 +1,45 @@
+import random
+import zlib
+import numpy as np
+
+
+class RandomStreams:
+    """Independently seeded random streams, one per subsystem.
+
+    ``stream(name)`` hands out a ``random.Random`` and ``numpy(name)`` a
+    ``numpy.random.RandomState``; both are drawn from the master seed and the
+    stream's name, so one subsystem drawing more or fewer numbers never shifts
+    what another one sees. Modules keep the stream objects they are given,
+    and ``reseed`` reseeds them in place, which lets a recorded session be
+    replayed with exactly the same random draws.
+    """
+
+    def __init__(self, seed=None):
+        self.streams = {}  # name -> random.Random
+        self.arrays = {}   # name -> numpy RandomState
+        self.reseed(seed)
+
+    def _seed_for(self, name):
+        return (self.seed * 1000003 + zlib.crc32(name.encode())) & 0xFFFFFFFF
+
+    def reseed(self, seed=None):
+        """Reseed every stream; a ``None`` seed picks a fresh random one."""
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(1 << 32)
+        for name, stream in self.streams.items():
+            stream.seed(self._seed_for(name))
+        for name, state in self.arrays.items():
+            state.seed(self._seed_for(name))
+
+    def stream(self, name):
+        if name not in self.streams:
+            self.streams[name] = random.Random(self._seed_for(name))
+        return self.streams[name]
+
+    def numpy(self, name):
+        if name not in self.arrays:
+            self.arrays[name] = np.random.RandomState(self._seed_for(name))
+        return self.arrays[name]
+
+
+# Random streams for the running game
+streams = RandomStreams()
@@ -0,0 +1,89 @@
+import math
+import pygame
+from core.memory import memory
+
+
+class ScrollStrip:
+    """Pre-composited, horizontally repeating strip for one parallax plane.
+
+    The plane is baked once into a ring-buffer surface that is a whole
+    number of periods wide and at least as wide as the viewport, so a frame
+    never needs more than the two source rects that cover the viewport.
+    Transparent borders are trimmed from every piece and the column spans
+    that actually hold pixels are recorded, so empty gaps are never blitted.
+    Offsets are snapped to whole pixels when drawing.
+    """
+
+    def __init__(self, pieces, period, speed, view_width):
+        """pieces: list of (surface, x, y) placed within one period."""
+        self.period = max(1, int(period))
+        self.speed = speed
+        self.offset = 0.0
+
+        # Trim transparent borders so neither rows nor columns are wasted
+        trimmed = []
+        for surf, x, y in pieces:
+            bounds = surf.get_bounding_rect()
+            if bounds.width and bounds.height:
+                trimmed.append((surf.subsurface(bounds), x + bounds.x, y + bounds.y))
+
+        self.y = min((y for _, _, y in trimmed), default=0)
+        self.height = max((y + s.get_height() for s, _, y in trimmed), default=0) - self.y
+        self.width = self.period * max(1, math.ceil(view_width / self.period))
+
+        self.surface = memory.surface((self.width, max(1, self.height)), pygame.SRCALPHA, owner="scroll_strip")
+        self.spans = []
+        self._compose(trimmed)
+
+        self._blit_list = []
+
+    @classmethod
+    def tiled(cls, surface, speed, view_width, period=None, y=0):
+        """A single image repeated every ``period`` pixels (default: its width)."""
+        return cls([(surface, 0, y)], period or surface.get_width(), speed, view_width)
+
+    @classmethod
+    def merged(cls, planes, speed, view_width, period):
+        """Merge several planes that scroll at the same speed into one strip.
+
+        planes: list of (surface, x, y) tuples sharing one period.
+        """
+        return cls(planes, period, speed, view_width)
+
+    def _compose(self, pieces):
+        covered = []
+        for surf, x, y in pieces:
+            w = surf.get_width()
+            for k in range(self.width // self.period):
+                start = (x + k * self.period) % self.width
+                # Pieces wider than the remaining strip wrap around the ring
+                for m in range(-(w // self.width) - 1, 1):
+                    px = start + m * self.width
+                    if px + w > 0 and px < self.width:
+                        self.surface.blit(surf, (px, y - self.y))
+                        covered.append((max(0, px), min(self.width, px + w)))
+
+        # Union of covered columns, drawn as one blit per span
+        for a, b in sorted(covered):
+            if self.spans and a <= self.spans[-1][1]:
+                self.spans[-1][1] = max(self.spans[-1][1], b)
+            else:
+                self.spans.append([a, b])
+
+    def update(self, dt):
+        self.offset = (self.offset + self.speed * dt / 1000) % self.width
+
+    def draw(self, surface, y=0):
+        left = int(self.offset)  # snap to whole pixels, no resampling
+        right = left + surface.get_width()
+        top = y + self.y
+        blits = self._blit_list
+        blits.clear()
+        # Window [left, right) may wrap once past the end of the ring
+        for shift in (0, self.width):
+            for a, b in self.spans:
+                a = max(a + shift, left)
+                b = min(b + shift, right)
+                if a < b:
+                    blits.append((self.surface, (a - left, top), (a - shift, 0, b - a, self.height)))
+        surface.blits(blits, doreturn=False)
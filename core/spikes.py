@@ -0,0 +1,136 @@
+import gc
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+
+# One caught frame: its index, duration, the state(s) it ran in, the stack
+# samples taken during it (root-first tuples) and its GC pauses
+# [(generation, ms, collected)]
+Spike = namedtuple("Spike", "frame ms state samples gc")
+
+
+def frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SpikeCatcher:
+    """Stack samples of the frames that blow the frame budget.
+
+    ``start`` runs a daemon thread that snapshots the main thread's Python
+    stack every ``interval`` seconds and hooks ``gc.callbacks`` to time
+    collections. The main loop calls ``end_frame`` with each frame's
+    duration and state: frames over ``threshold_ms`` keep their samples
+    and GC pauses as a Spike (the latest ``keep`` of them), the rest are
+    thrown away. ``dump`` writes every kept sample in the folded-stack
+    format flamegraph.pl, speedscope and inferno read, rooted at the state
+    the spike happened in. Off until started, so normal runs pay nothing.
+    """
+
+    def __init__(self, threshold_ms=33.0, interval=0.001, keep=50, depth=64):
+        self.threshold_ms = threshold_ms
+        self.interval = interval
+        self.keep = keep
+        self.depth = depth
+        self.enabled = False
+        self.frame = 0
+        self.samples = []   # This frame's stacks, appended by the sampler thread
+        self.gc_events = []  # This frame's (generation, ms, collected)
+        self.spikes = []
+        self.caught = 0
+        self._thread = None
+        self._gc_start = None
+
+    def start(self, threshold_ms=None):
+        if threshold_ms is not None:
+            self.threshold_ms = threshold_ms
+        if self.enabled:
+            return
+        self.enabled = True
+        gc.callbacks.append(self._on_gc)
+        self._thread = threading.Thread(target=self._sample, args=(threading.main_thread().ident,),
+                                        name="spike-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        gc.callbacks.remove(self._on_gc)
+        self._thread.join()
+        self._thread = None
+
+    def _sample(self, thread_id):
+        while self.enabled:
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None and len(stack) < self.depth:
+                stack.append(frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.samples.append(tuple(reversed(stack)))
+            time.sleep(self.interval)
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            ms = (time.perf_counter() - self._gc_start) * 1000
+            self.gc_events.append((info["generation"], ms, info["collected"]))
+            self._gc_start = None
+
+    def end_frame(self, ms, state):
+        """Close a frame that took ``ms``, keeping its samples if it spiked."""
+        if not self.enabled:
+            return
+        # Swap rather than clear: the sampler may be appending right now
+        samples, self.samples = self.samples, []
+        gc_events, self.gc_events = self.gc_events, []
+        if ms >= self.threshold_ms:
+            self.caught += 1
+            self.spikes.append(Spike(self.frame, ms, state, samples, gc_events))
+            if len(self.spikes) > self.keep:
+                del self.spikes[0]
+        self.frame += 1
+
+    def folded(self):
+        """{folded stack: sample count} over every kept spike."""
+        counts = {}
+        for spike in self.spikes:
+            for stack in spike.samples:
+                key = ";".join((spike.state, *stack))
+                counts[key] = counts.get(key, 0) + 1
+            for generation, ms, _ in spike.gc:
+                # GC pauses as their own leaf, weighted like samples would be
+                key = f"{spike.state};[gc gen{generation}]"
+                counts[key] = counts.get(key, 0) + max(1, round(ms / 1000 / self.interval))
+        return counts
+
+    def dump(self, path):
+        """Write the kept spikes as folded stacks (``flamegraph.pl path``)."""
+        with open(path, "w") as f:
+            for stack, count in sorted(self.folded().items()):
+                f.write(f"{stack} {count}\n")
+        return path
+
+    def report(self, top=3):
+        if not self.caught:
+            return f"spikes: no frames over {self.threshold_ms:.0f} ms"
+        lines = [f"spikes: {self.caught} frames over {self.threshold_ms:.0f} ms, latest {len(self.spikes)} kept"]
+        for spike in sorted(self.spikes, key=lambda s: s.ms, reverse=True)[:10]:
+            gc_ms = sum(ms for _, ms, _ in spike.gc)
+            lines.append(f"  #{spike.frame:<6} {spike.ms:7.1f} ms  {spike.state:<18} "
+                         f"{len(spike.samples):4d} samples, gc {gc_ms:.1f} ms in {len(spike.gc)}")
+            # The innermost frames seen most often, which is where the time went
+            leaves = {}
+            for stack in spike.samples:
+                leaves[stack[-1]] = leaves.get(stack[-1], 0) + 1
+            for label, count in sorted(leaves.items(), key=lambda item: item[1], reverse=True)[:top]:
+                lines.append(f"      {count * 100 // max(1, len(spike.samples)):3d}%  {label}")
+        return "\n".join(lines)
+
+
+# Spike catcher for the running game
+spikes = SpikeCatcher()
@@ -1,8 +1,9 @@
 # core/utils.py
 import pygame
+from core.asset_pack import load_surface
 
 def load_image(path, scale=None):
-    image = pygame.image.load(path).convert_alpha()
+    image = load_surface(path)
     if scale:
         image = pygame.transform.scale(image, scale)
     return image
@@ -0,0 +1,94 @@
+import math
+import numpy as np
+from core.settings import *
+from core.input_handler import PlayerActions
+
+
+def steer(position, target, deadzone=6):
+    """-1, 0 or 1 towards ``target``, like a player tapping a direction key."""
+    delta = target - position
+    if abs(delta) <= deadzone:
+        return 0
+    return 1 if delta > 0 else -1
+
+
+# -------------------------------------------------------------
+# 🛩️ Scripted flight patterns
+# -------------------------------------------------------------
+# Each pattern maps seconds flown to the point the witch steers for
+PATTERNS = {
+    # Wide vertical weave while drifting back and forth in the left third
+    "weave": lambda t: (SCREEN_WIDTH * (0.25 + 0.08 * math.sin(t * 0.7)),
+                        SCREEN_HEIGHT * (0.5 + 0.35 * math.sin(t * 1.3))),
+    # Slow top-to-bottom sweeps close to the left edge
+    "sweep": lambda t: (SCREEN_WIDTH * 0.18,
+                        SCREEN_HEIGHT * (0.5 + 0.38 * math.sin(t * 0.5))),
+    # Loops around the middle of the left half
+    "loop": lambda t: (SCREEN_WIDTH * (0.3 + 0.12 * math.cos(t * 0.9)),
+                       SCREEN_HEIGHT * (0.5 + 0.3 * math.sin(t * 0.9))),
+}
+
+
+class ScriptedPilot:
+    """Flies one of the PATTERNS and fires constantly."""
+
+    def __init__(self, pattern="weave"):
+        self.path = PATTERNS[pattern]
+        self.time = 0.0
+
+    def actions(self, player, enemies, dt):
+        self.time += dt / 1000
+        x, y = self.path(self.time)
+        return PlayerActions(steer(player.rect.centerx, x), steer(player.rect.centery, y), True)
+
+
+# -------------------------------------------------------------
+# 🎯 Greedy targeting
+# -------------------------------------------------------------
+class HunterPilot:
+    """Lines up with the nearest saucer ahead and fires constantly.
+
+    Stays in the left part of the screen and backs away vertically from any
+    saucer that gets within ``danger`` pixels, so runs last long enough to
+    keep bolts, hits and explosions flowing.
+    """
+
+    def __init__(self, home_x=0.22, danger=150):
+        self.home_x = SCREEN_WIDTH * home_x
+        self.danger = danger
+
+    def actions(self, player, enemies, dt):
+        px, py = player.rect.center
+        live = np.flatnonzero(enemies.active)
+        if not len(live):
+            return PlayerActions(steer(px, self.home_x), steer(py, SCREEN_HEIGHT / 2), True)
+
+        cx = enemies.x[live]  # Saucer positions are their centres
+        cy = enemies.y[live]
+        distance = np.hypot(cx - px, cy - py)
+
+        # Dodge first: move away from the closest saucer if it is too near
+        closest = int(np.argmin(distance))
+        if distance[closest] < self.danger:
+            away = -1 if cy[closest] > py else 1
+            if not 40 < py + away * 40 < SCREEN_HEIGHT - 40:
+                away = -away  # Pinned against an edge; slip past the other way
+            return PlayerActions(steer(px, self.home_x - 80), away, True)
+
+        # Otherwise line up with the nearest saucer still in front of us
+        ahead = cx > px
+        pool = np.flatnonzero(ahead) if ahead.any() else np.arange(len(live))
+        target = pool[np.argmin(distance[pool])]
+        return PlayerActions(steer(px, self.home_x), steer(py, cy[target]), True)
+
+
+def make_autopilot(name):
+    """An autopilot by name: a PATTERNS key for a scripted flight, or "hunter"."""
+    if name == "hunter":
+        return HunterPilot()
+    if name in PATTERNS:
+        return ScriptedPilot(name)
+    raise ValueError(f"unknown autopilot '{name}' (try hunter, {', '.join(PATTERNS)})")
+
+
+AUTOPILOTS = ["hunter", *PATTERNS]
@@ -0,0 +1,195 @@
+import math
+import numpy as np
+from core.settings import *
+from core import assets
+from core.collision import LAYER_BOLT, LAYER_ENEMY, LAYER_PLAYER
+from core.profiler import profiler
+from core.rng import streams
+
+rng = streams.stream("enemies")
+
+# Movement patterns, stored per saucer in SaucerSwarm.pattern
+PATTERN_SINE = 0   # sine dive: drift left while weaving up and down
+PATTERN_SWOOP = 1  # swoop: arc down through the lane and back up while crossing
+PATTERN_HOVER = 2  # hover: glide in, bob in place for a while, then leave
+PATTERNS = {"sine": PATTERN_SINE, "swoop": PATTERN_SWOOP, "hover": PATTERN_HOVER}
+
+SAUCER_IMAGE = "assets/sprites/enemies/saucer_monster.png"
+SAUCER_SIZE = (72, 54)
+SAUCER_SCORE = 10
+
+
+def build_waves(step=2.0, first=2.0):
+    """One wave every ``step`` percent of level progress, growing as it goes."""
+    waves = []
+    names = ["sine", "swoop", "hover"]
+    at = first
+    index = 0
+    while at < 100:
+        waves.append({
+            "at": at,
+            "pattern": names[index % len(names)],
+            "count": 4 + int(at // 4),
+            "spacing": 0.35,  # seconds between spawns within a wave
+        })
+        at += step
+        index += 1
+    return waves
+
+
+WAVES = build_waves()
+
+
+class WaveScheduler:
+    """Starts waves as ``Background.progress`` crosses each wave's threshold."""
+
+    def __init__(self, waves=WAVES):
+        self.waves = waves
+        self.next_wave = 0
+        self.active = []  # [wave, spawned, timer] for waves still spawning
+
+    def reset(self):
+        self.next_wave = 0
+        self.active = []
+
+    def update(self, dt, progress, swarm):
+        while self.next_wave < len(self.waves) and progress >= self.waves[self.next_wave]["at"]:
+            self.active.append([self.waves[self.next_wave], 0, 0.0])
+            self.next_wave += 1
+
+        dt_sec = dt / 1000
+        for entry in self.active:
+            wave = entry[0]
+            entry[2] -= dt_sec
+            while entry[2] <= 0 and entry[1] < wave["count"]:
+                swarm.spawn(PATTERNS[wave["pattern"]])
+                entry[1] += 1
+                entry[2] += wave["spacing"]
+        self.active = [entry for entry in self.active if entry[1] < entry[0]["count"]]
+
+
+class SaucerSwarm:
+    """Pooled saucer enemies stored as parallel numpy arrays.
+
+    Spawning only fills a free slot; every pattern is evaluated as array
+    math over all live saucers that use it, and all saucers draw with one
+    ``Surface.blits`` call.
+    """
+
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.base_y = np.zeros(capacity)
+        self.start_x = np.zeros(capacity)
+        self.age = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.amplitude = np.zeros(capacity)
+        self.frequency = np.zeros(capacity)
+        self.phase = np.zeros(capacity)
+        self.hover_x = np.zeros(capacity)
+        self.hover_time = np.zeros(capacity)
+        self.pattern = np.zeros(capacity, dtype=np.int8)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.free = list(range(capacity - 1, -1, -1))
+
+        self.scope = assets.AssetScope("saucers")
+        self.sprite = self.scope.image(SAUCER_IMAGE, scale=SAUCER_SIZE, smooth=True)
+        self.width, self.height = self.sprite.get_size()
+        self.kills = 0
+
+    def release(self):
+        """Hand the saucer sprite back to the image cache."""
+        self.sprite = None
+        self.scope.release()
+
+    def __len__(self):
+        return self.capacity - len(self.free)
+
+    def spawn(self, pattern, y=None):
+        if not self.free:
+            return -1
+        slot = self.free.pop()
+        margin = self.height
+        base_y = y if y is not None else rng.uniform(margin + 60, SCREEN_HEIGHT - margin - 160)
+        self.x[slot] = self.start_x[slot] = SCREEN_WIDTH + self.width
+        self.y[slot] = self.base_y[slot] = base_y
+        self.age[slot] = 0.0
+        self.speed[slot] = rng.uniform(120, 200)
+        self.amplitude[slot] = rng.uniform(40, 90)
+        self.frequency[slot] = rng.uniform(1.5, 3.0)
+        self.phase[slot] = rng.uniform(0, 2 * math.pi)
+        self.hover_x[slot] = rng.uniform(SCREEN_WIDTH * 0.55, SCREEN_WIDTH * 0.85)
+        self.hover_time[slot] = rng.uniform(2.5, 4.0)
+        self.pattern[slot] = pattern
+        self.active[slot] = True
+        return slot
+
+    def kill(self, slots):
+        slots = np.unique(np.asarray(slots, dtype=int))
+        slots = slots[self.active[slots]]
+        self.active[slots] = False
+        self.free.extend(slots.tolist())
+        return len(slots)
+
+    def clear(self):
+        self.kill(np.flatnonzero(self.active))
+
+    def update(self, dt):
+        with profiler.section("enemies.update"):
+            self._update(dt / 1000)
+
+    def _update(self, dt_sec):
+        live = self.active
+        if not live.any():
+            return
+        self.age[live] += dt_sec
+
+        # Sine dive
+        m = live & (self.pattern == PATTERN_SINE)
+        self.x[m] -= self.speed[m] * dt_sec
+        self.y[m] = self.base_y[m] + self.amplitude[m] * np.sin(self.frequency[m] * self.age[m] + self.phase[m])
+
+        # Swoop: one deep arc over the whole crossing
+        m = live & (self.pattern == PATTERN_SWOOP)
+        self.x[m] -= self.speed[m] * 1.3 * dt_sec
+        crossed = np.clip((self.start_x[m] - self.x[m]) / (self.start_x[m] + self.width), 0.0, 1.0)
+        self.y[m] = self.base_y[m] + self.amplitude[m] * 1.8 * np.sin(np.pi * crossed)
+
+        # Hover: ease toward the hover point, bob, then leave
+        m = live & (self.pattern == PATTERN_HOVER)
+        leaving = m & (self.age > self.hover_time)
+        arriving = m & ~leaving
+        self.x[arriving] += (self.hover_x[arriving] - self.x[arriving]) * min(1.0, 2.0 * dt_sec)
+        self.x[leaving] -= self.speed[leaving] * 1.5 * dt_sec
+        self.y[m] = self.base_y[m] + 0.3 * self.amplitude[m] * np.sin(2.0 * self.age[m] + self.phase[m])
+
+        gone = live & (self.x + self.width < 0)
+        if gone.any():
+            self.kill(np.flatnonzero(gone))
+
+    def sync_bodies(self, world):
+        """Mirror live saucers into a CollisionWorld as enemy bodies."""
+        idx = np.flatnonzero(self.active)
+        world.sync("saucer", idx.tolist(), (self.x[idx] - self.width / 2).tolist(),
+                   (self.y[idx] - self.height / 2).tolist(), (self.width, self.height),
+                   LAYER_ENEMY, LAYER_BOLT | LAYER_PLAYER, self.sprite)
+
+    def resolve_hits(self, world, projectiles):
+        """Kill saucers and bolts that touch; returns the number of saucers destroyed."""
+        hits = world.pairs(LAYER_BOLT, LAYER_ENEMY)
+        if not hits:
+            return 0
+        projectiles.kill([bolt[1] for bolt, _ in hits])
+        killed = self.kill(list({saucer[1] for _, saucer in hits}))
+        self.kills += killed
+        return killed
+
+    def draw(self, surface):
+        idx = np.flatnonzero(self.active)
+        if not len(idx):
+            return
+        xs = (self.x[idx] - self.width / 2).astype(int).tolist()
+        ys = (self.y[idx] - self.height / 2).astype(int).tolist()
+        sprite = self.sprite
+        surface.blits([(sprite, pos) for pos in zip(xs, ys)], doreturn=False)
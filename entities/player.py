@@ -1,22 +1,41 @@
 # At the top of player.py
 import pygame
 import math
-import random
 from core.settings import *
-from .projectile import MagicBolt  # <-- fixed
+from core.animation import AnimationAtlas, animations
+from core.collision import LAYER_ENEMY, LAYER_PLAYER
+from core.latency import latency
+from .projectile import ProjectileSystem
+
+# --- Witch animation ---
+WITCH_FRAMES = {
+    "idle": "assets/sprites/Witch/player_idle.png",
+    "blink": "assets/sprites/Witch/player_idle2.png",
+    "attack": "assets/sprites/Witch/player_attack.png",
+    "hurt": "assets/sprites/Witch/player_hurt.png",
+}
+WITCH_CLIPS = {
+    "idle": {"frames": ["idle"], "hold": (3.0, 5.0), "next": "blink"},
+    "blink": {"frames": ["blink"], "hold": 0.15, "next": "idle"},
+    "attack": {"frames": ["attack"], "hold": 0.1, "next": "idle"},  # how long attack frame shows
+    "hurt": {"frames": ["hurt", "hurt"], "variants": ["flash", "base"], "frame_time": 0.08,
+             "hold": 0.6, "next": "idle"},
+}
+WITCH_TRANSITIONS = {
+    "idle": {"attack": "attack", "hurt": "hurt"},
+    "blink": {"attack": "attack", "hurt": "hurt"},
+    "attack": {"attack": "attack", "hurt": "hurt"},
+}
 
 
 class Player:
     def __init__(self):
-        # --- Load idle and attack sprites ---
-        self.frames = [
-            pygame.image.load("assets/sprites/Witch/player_idle.png").convert_alpha(),     # idle
-            pygame.image.load("assets/sprites/Witch/player_idle2.png").convert_alpha(),    # blink
-            pygame.image.load("assets/sprites/Witch/player_attack.png").convert_alpha()    # attack frame
-        ]
-        self.current_frame = 0
-        self.image = self.frames[self.current_frame]
-        self.rect = self.image.get_rect()
+        # --- Animation atlas and clips ---
+        self.atlas = AnimationAtlas(WITCH_FRAMES, flash=True, glow=(255, 210, 160, 40))
+        self.character = animations.compile(self.atlas, WITCH_CLIPS, WITCH_TRANSITIONS)
+        self.anim = animations.add(self.character, "idle")
+        self.image, self.anchor = animations.frame(self.anim)
+        self.rect = pygame.Rect((0, 0), self.atlas.sizes["idle"])
 
         # --- Position ---
         self.rect.centerx = SCREEN_WIDTH * 0.25
@@ -30,38 +49,26 @@ class Player:
         self.idle_amplitude = 10
         self.idle_speed = 2.0
 
-        # --- Blinking animation ---
-        self.blink_timer = 0.0
-        self.blink_interval = random.uniform(3, 5)
-        self.is_blinking = False
-        self.blink_duration = 0.15
-
         # --- Attack / Projectiles ---
-        self.projectiles = []
+        self.projectiles = ProjectileSystem()
         self.shoot_cooldown = 0.25  # seconds
         self.shoot_timer = 0.0
-        self.attack_frame_timer = 0.1  # how long attack frame shows
-        self.attack_frame_active = False
-        self.attack_frame_counter = 0.0
 
-    def update(self, dt):
-        keys = pygame.key.get_pressed()
+    def update(self, dt, actions):
+        """Advance one frame driven by ``actions`` (a PlayerActions from the
+        keyboard or an autopilot)."""
         moved = False
 
         # --- Horizontal movement ---
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.rect.x -= self.speed * dt / 1000
-            moved = True
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.rect.x += self.speed * dt / 1000
+        if actions.move_x:
+            self.rect.x += self.speed * actions.move_x * dt / 1000
+            latency.respond("right" if actions.move_x > 0 else "left")
             moved = True
 
         # --- Vertical movement ---
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            self.rect.y -= self.vertical_speed * dt / 1000
-            moved = True
-        elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            self.rect.y += self.vertical_speed * dt / 1000
+        if actions.move_y:
+            self.rect.y += self.vertical_speed * actions.move_y * dt / 1000
+            latency.respond("down" if actions.move_y > 0 else "up")
             moved = True
 
         # --- Idle hover motion ---
@@ -72,64 +79,51 @@ class Player:
         else:
             self.base_y = self.rect.centery
 
-        # --- Blinking animation ---
-        self.blink_timer += dt / 1000
-        if not self.is_blinking and self.blink_timer > self.blink_interval:
-            self.is_blinking = True
-            self.current_frame = 1
-            self.blink_timer = 0
-            self.blink_interval = random.uniform(3, 5)
-        elif self.is_blinking and self.blink_timer > self.blink_duration:
-            self.is_blinking = False
-            self.current_frame = 0
-            self.blink_timer = 0
-
         # --- Shooting / Attack frame ---
         self.shoot_timer += dt / 1000
-        if keys[pygame.K_SPACE] and self.shoot_timer >= self.shoot_cooldown:
+        if actions.fire and self.shoot_timer >= self.shoot_cooldown:
             self.shoot()
             self.shoot_timer = 0
-            self.attack_frame_active = True
-            self.attack_frame_counter = 0.0
-
-        # --- Handle attack frame duration ---
-        if self.attack_frame_active:
-            self.attack_frame_counter += dt / 1000
-            self.current_frame = 2  # attack sprite
-            if self.attack_frame_counter > self.attack_frame_timer:
-                self.attack_frame_active = False
-                self.current_frame = 0  # back to idle
+            animations.trigger(self.anim, "attack")
+            latency.respond("fire")
 
         # --- Update projectiles ---
-        for bolt in self.projectiles:
-            bolt.update(dt)
-        self.projectiles = [b for b in self.projectiles if b.active]
+        self.projectiles.update(dt)
 
-        # --- Update current image ---
-        self.image = self.frames[self.current_frame]
+        # --- Update current image (clips are advanced by the shared animation system) ---
+        self.image, self.anchor = animations.frame(self.anim)
 
         # --- Keep within screen bounds ---
         self.rect.clamp_ip(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
 
     def shoot(self):
         # Magic bolt appears in front of player
-        bolt = MagicBolt(self.rect.centerx + self.rect.width // 2, self.rect.centery)
-        self.projectiles.append(bolt)
+        self.projectiles.spawn(self.rect.centerx + self.rect.width // 2, self.rect.centery)
+
+    def release(self):
+        """Take the witch's entity out of the animation system."""
+        animations.remove(self.anim)
+
+    def hurt(self):
+        """Play the hurt clip; returns False while already hurt."""
+        return animations.trigger(self.anim, "hurt")
+
+    def sync_body(self, world):
+        """Mirror the player into a CollisionWorld, masked by the current
+        frame and placed where draw() blits it."""
+        x, y = self.rect.centerx + self.anchor[0], self.rect.centery + self.anchor[1]
+        if ("player", 0) in world.bodies:
+            world.move(("player", 0), x, y, self.image)
+        else:
+            world.add(("player", 0), self.image.get_rect(topleft=(x, y)), LAYER_PLAYER, LAYER_ENEMY, self.image)
 
     def draw(self, surface):
-        # --- Soft glow ---
-        glow_surface = pygame.Surface((self.rect.width + 40, self.rect.height + 40), pygame.SRCALPHA)
-        pygame.draw.circle(
-            glow_surface,
-            (255, 210, 160, 40),
-            (glow_surface.get_width() // 2, glow_surface.get_height() // 2),
-            glow_surface.get_width() // 2,
-        )
-        surface.blit(glow_surface, (self.rect.x - 20, self.rect.y - 20))
+        # --- Soft glow (baked once into the atlas) ---
+        glow = self.atlas.glow
+        surface.blit(glow, glow.get_rect(center=self.rect.center))
 
         # --- Draw player ---
-        surface.blit(self.image, self.rect)
+        surface.blit(self.image, (self.rect.centerx + self.anchor[0], self.rect.centery + self.anchor[1]))
 
         # --- Draw projectiles ---
-        for bolt in self.projectiles:
-            bolt.draw(surface)
+        self.projectiles.draw(surface)
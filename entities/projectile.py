@@ -1,21 +1,105 @@
-import pygame
+import math
+import numpy as np
 from core.settings import *
+from core.atlas import load_sprite
+from core.collision import LAYER_BOLT, LAYER_ENEMY
+from core.ecs import EntityStore
 
-class MagicBolt:
-    def __init__(self, x, y, direction=1, speed=400):
-        self.image = pygame.image.load("assets/sprites/Witch/magic_bolt.png").convert_alpha()
-        self.rect = self.image.get_rect(center=(x, y))
-        self.speed = speed
-        self.direction = direction  # 1 = right, -1 = left
-        self.active = True
+# Projectile types, indexed by the sprite image id of each projectile entity
+BOLT_TYPES = [
+    {"name": "magic_bolt", "image": "assets/sprites/Witch/magic_bolt.png", "speed": 400, "lifetime": 5.0},
+]
+MAGIC_BOLT = 0
+
+
+class ProjectileSystem:
+    """All live projectiles, stored as entities in an EntityStore.
+
+    Positions and velocities are float arrays, so slow bolts keep their
+    sub-pixel motion. Freed entity ids are reused, movement and lifetime
+    run through the store's bulk systems, off-screen culling is one array
+    test, and each projectile type shares one trimmed atlas sprite that is
+    drawn with a single ``Surface.blits`` call.
+    """
+
+    def __init__(self, capacity=4096):
+        self.entities = EntityStore(capacity)
+        self.mask = self.entities.mask_of("transform", "velocity", "lifetime", "sprite", "collider")
+
+        # Trimmed sprites, placed by their offset from the projectile's centre
+        self.sprites = []
+        anchors = []
+        for bolt_type in BOLT_TYPES:
+            sprite, offset, full = load_sprite(bolt_type["image"])
+            self.sprites.append(sprite)
+            anchors.append((offset[0] - full[0] / 2, offset[1] - full[1] / 2))
+        self.anchor_x = np.array([a[0] for a in anchors])
+        self.anchor_y = np.array([a[1] for a in anchors])
+
+    def __len__(self):
+        return len(self.entities)
+
+    def spawn(self, x, y, direction=1, kind=MAGIC_BOLT, speed=None, angle=0.0):
+        """Fire one projectile centred on (x, y); returns its entity id."""
+        e = self.entities
+        eid = e.create(self.mask)
+        bolt_type = BOLT_TYPES[kind]
+        speed = bolt_type["speed"] if speed is None else speed
+        e.transform.x[eid] = x
+        e.transform.y[eid] = y
+        e.velocity.vx[eid] = speed * direction * math.cos(angle)
+        e.velocity.vy[eid] = speed * math.sin(angle)
+        e.lifetime.remaining[eid] = bolt_type["lifetime"]
+        e.sprite.image[eid] = kind
+        e.collider.w[eid], e.collider.h[eid] = self.sprites[kind].get_size()
+        e.collider.layer[eid] = LAYER_BOLT
+        e.collider.collides[eid] = LAYER_ENEMY
+        return eid
+
+    def spawn_spread(self, x, y, count, spread=0.5, direction=1, kind=MAGIC_BOLT):
+        """Fire ``count`` projectiles fanned evenly across ``spread`` radians."""
+        for i in range(count):
+            angle = spread * (i / (count - 1) - 0.5) if count > 1 else 0.0
+            self.spawn(x, y, direction, kind, angle=angle)
+
+    def kill(self, eids):
+        self.entities.destroy(eids)
 
     def update(self, dt):
-        # Move projectile
-        self.rect.x += self.speed * self.direction * dt / 1000
+        e = self.entities
+        e.step(dt)
+
+        # Cull off-screen projectiles in one pass
+        ids = e.query("transform", "sprite", "collider")
+        kinds = e.sprite.image[ids]
+        x = e.transform.x[ids] + self.anchor_x[kinds]
+        y = e.transform.y[ids] + self.anchor_y[kinds]
+        off = ((x + e.collider.w[ids] < 0) | (x > SCREEN_WIDTH) |
+               (y + e.collider.h[ids] < 0) | (y > SCREEN_HEIGHT))
+        if off.any():
+            e.destroy(ids[off])
+
+    def _by_kind(self):
+        e = self.entities
+        ids = e.query("transform", "sprite")
+        kinds = e.sprite.image[ids]
+        for kind, sprite in enumerate(self.sprites):
+            idx = ids[kinds == kind]
+            if len(idx):
+                yield kind, sprite, idx
 
-        # Deactivate if off-screen
-        if self.rect.right < 0 or self.rect.left > SCREEN_WIDTH:
-            self.active = False
+    def sync_bodies(self, world):
+        """Mirror live projectiles into a CollisionWorld as bolt bodies."""
+        e = self.entities
+        for kind, sprite in enumerate(self.sprites):
+            idx = np.flatnonzero(e.alive & (e.sprite.image == kind))
+            world.sync(("bolt", kind), idx.tolist(), (e.transform.x[idx] + self.anchor_x[kind]).tolist(),
+                       (e.transform.y[idx] + self.anchor_y[kind]).tolist(), sprite.get_size(),
+                       LAYER_BOLT, LAYER_ENEMY, sprite)
 
     def draw(self, surface):
-        surface.blit(self.image, self.rect)
+        e = self.entities
+        for kind, sprite, idx in self._by_kind():
+            xs = (e.transform.x[idx] + self.anchor_x[kind]).astype(int).tolist()
+            ys = (e.transform.y[idx] + self.anchor_y[kind]).astype(int).tolist()
+            surface.blits([(sprite, pos) for pos in zip(xs, ys)], doreturn=False)
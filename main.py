@@ -1,191 +1,457 @@
 import pygame
+import argparse
+import time
 import traceback
 from ui.start_menu import StartMenu
 from ui.hud import HUD
 from core.settings import *
-from core.game_state import GameState
+from core.game_state import GameState, StateManager, Resources
+from core.collision import CollisionWorld, LAYER_ENEMY, LAYER_PLAYER
+from core.profiler import profiler
+from core.memory import memory
+from core.effects import effects
+from core.clock import clock
+from core.rng import streams
+from core.input_handler import inputs, KeyboardPilot
+from core.latency import latency
+from core.spikes import spikes
+from core.allocations import allocations
+from core.gc_policy import gc_policy
+from core.replay import Recording, screen_digest
+from core.animation import animations
 from entities.player import Player
+from entities.autopilot import AUTOPILOTS, make_autopilot
+from entities.enemy import SaucerSwarm, WaveScheduler, SAUCER_SCORE
 from world.background import Background
 from world.environment import Environment
 from ui.cutscene import Cutscene
 
-# -----------------------------
-# Initialize Pygame & Mixer
-# -----------------------------
-pygame.init()
-pygame.mixer.init()
-
-try:
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("Zethia: Skyfall Run")
-except Exception as e:
-    print(f"Failed to create display: {e}")
-    pygame.quit()
-    exit()
 
-clock = pygame.time.Clock()
+def play_music(path):
+    try:
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(0.5)
+        pygame.mixer.music.play(-1)
+    except Exception as e:
+        print(f"Could not load music {path}: {e}")
+
+
+def fade_music(ms):
+    try:
+        pygame.mixer.music.fadeout(ms)
+    except pygame.error:
+        pass
 
-# -----------------------------
-# Try to load and play menu music (with fallback)
-# -----------------------------
-try:
-    pygame.mixer.music.load("assets/music/menu_theme.mp3")
-    pygame.mixer.music.set_volume(0.5)
-    pygame.mixer.music.play(-1)
-except Exception as e:
-    print(f"Could not load menu music: {e}")
-    print("Continuing without music...")
 
 # -----------------------------
-# Setup UI, Player, World, Cutscene
+# Game States
 # -----------------------------
-try:
-    menu = StartMenu(screen)
-    hud = HUD(screen)
-    state = GameState()
-    player = Player()
-    background = Background()
-    environment = Environment()
-    cutscene = Cutscene(screen)
-except Exception as e:
-    print(f"Failed to initialize game components: {e}")
-    traceback.print_exc()
-    pygame.quit()
-    exit()
-
-# --- Transition variables ---
-transition_alpha = 0
-transition_speed = 3
-transition_text = ""
-try:
-    transition_font = pygame.font.Font("assets/fonts/8-bitanco.ttf", 60)
-except:
-    transition_font = pygame.font.SysFont("courier", 60, bold=True)  # Fallback font
-transition_stage = 0  # 0: fade to black, 1: show text, 2: fade to cutscene
-
-running = True
-error_occurred = False
-error_message = ""
+class MenuState(GameState):
+    name = "menu"
+    resources = ("menu",)
+    events = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN)
+    handlers = {"up": "select_previous", "down": "select_next", "confirm": "confirm", "click": "click"}
+
+    def enter(self, previous):
+        self.menu = self.game.resources.get("menu")
+        self.dt = 0
+        play_music("assets/music/menu_theme.mp3")
+
+    def exit(self, following):
+        self.menu = None
+
+    def select_previous(self, press):
+        self.menu.select(-1)
+
+    def select_next(self, press):
+        self.menu.select(1)
+
+    def confirm(self, press):
+        self.choose(self.menu.activate())
+
+    def click(self, press):
+        self.choose(self.menu.click(press.pos))
+
+    def choose(self, action):
+        if action == "Start Game":
+            fade_music(1000)
+            self.game.states.change("transition")
+        elif action == "Quit":
+            self.game.running = False
+
+    def update(self, dt, events):
+        self.dt = dt
+        self.menu.update(dt)
+
+    def draw(self, screen):
+        self.menu.draw(self.dt)
+
+
+class TransitionState(GameState):
+    """Fade to black, show the title, then fade into the cutscene"""
+    name = "transition"
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.speed = 3
+        self.text = "Zethia: Skyfall Run"
+        try:
+            self.font = pygame.font.Font("assets/fonts/8-bitanco.ttf", 60)
+        except:
+            self.font = pygame.font.SysFont("courier", 60, bold=True)  # Fallback font
+        self.fade_surface = memory.surface((WIDTH, HEIGHT), owner="transition")
+        self.fade_surface.fill((0, 0, 0))
+
+    def enter(self, previous):
+        self.alpha = 0
+        self.stage = 0  # 0: fade to black, 1: show text, 2: fade to cutscene
+
+    def update(self, dt, events):
+        if self.stage == 0:  # Fade to black
+            self.alpha += self.speed
+            if self.alpha >= 255:
+                self.alpha = 255
+                self.stage = 1
+                # Load the cutscene while the title card hides it
+                self.game.states.prefetch("cutscene")
+
+        elif self.stage == 1:  # Show text
+            # Wait a bit then move to cutscene
+            if clock.ticks() % 3000 < dt:  # Show text for 3 seconds
+                self.stage = 2
+
+        elif self.stage == 2:  # Fade to cutscene
+            if self.alpha == 255:  # Only load music once
+                play_music("assets/music/cutscene_theme.mp3")
+            self.alpha -= self.speed
+            if self.alpha <= 0:
+                self.alpha = 0
+                self.game.states.change("cutscene")
+
+    def draw(self, screen):
+        screen.fill((0, 0, 0))  # Black background
+
+        if self.stage == 1:  # Show text in the middle of black screen
+            text_surface = self.font.render(self.text, True, (255, 255, 255))
+            screen.blit(text_surface, text_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
+
+        # Apply fade overlay
+        if self.alpha > 0:
+            self.fade_surface.set_alpha(self.alpha)
+            screen.blit(self.fade_surface, (0, 0))
+
+
+class CutsceneState(GameState):
+    name = "cutscene"
+    resources = ("cutscene",)
+    handlers = {"fire": "advance"}
+
+    def enter(self, previous):
+        self.cutscene = self.game.resources.get("cutscene")
+
+    def exit(self, following):
+        self.cutscene = None
+
+    def advance(self, press):
+        self.cutscene.advance()
+
+    def update(self, dt, events):
+        self.cutscene.update(dt)
+
+        # Gameplay is next; start loading its sky during the last scene
+        if self.cutscene.current_scene == "witch_dialogue":
+            self.game.states.prefetch("game")
+
+        # Check if cutscene is finished (spacebar will advance through text)
+        if self.cutscene.finished:
+            self.game.states.change("game")
+
+    def draw(self, screen):
+        self.cutscene.draw()
+
+
+class GameplayScene:
+    """Everything gameplay draws or simulates, built as the "gameplay"
+    resource set so none of it is resident outside a run."""
+
+    def __init__(self, screen):
+        self.background = Background()
+        self.hud = HUD(screen)
+        self.player = Player()
+        self.environment = Environment()
+        self.enemies = SaucerSwarm()
+        self.waves = WaveScheduler()
+        self.collisions = CollisionWorld()
+
+    def release(self):
+        self.background.release()
+        self.player.release()
+        self.enemies.release()
+
+
+class GameplayState(GameState):
+    name = "game"
+    resources = ("gameplay",)
+    pause_gc = True
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.pilot = make_autopilot(game.autopilot) if game.autopilot else KeyboardPilot()
+        self.exit(None)
+
+    def enter(self, previous):
+        scene = self.game.resources.get("gameplay")
+        self.background, self.hud, self.player = scene.background, scene.hud, scene.player
+        self.environment, self.enemies, self.waves = scene.environment, scene.enemies, scene.waves
+        self.collisions = scene.collisions
+        fade_music(800)
+        play_music("assets/music/game_theme.mp3")
+
+    def exit(self, following):
+        self.background = self.hud = self.player = None
+        self.environment = self.enemies = self.waves = self.collisions = None
+
+    def update(self, dt, events):
+        player, enemies, collisions, hud = self.player, self.enemies, self.collisions, self.hud
+        self.background.update(dt)
+        self.environment.update(dt)
+        player.update(dt, self.pilot.actions(player, enemies, dt))
+        animations.update(dt)
+        self.waves.update(dt, self.background.progress, enemies)
+        enemies.update(dt)
+
+        # Bolts vs saucers
+        with profiler.section("collisions"):
+            player.projectiles.sync_bodies(collisions)
+            player.sync_body(collisions)
+            enemies.sync_bodies(collisions)
+            collisions.collide()
+            hud.score += enemies.resolve_hits(collisions, player.projectiles) * SAUCER_SCORE
+            if collisions.pairs(LAYER_PLAYER, LAYER_ENEMY) and player.hurt():
+                hud.health = max(0, hud.health - 10)
+        hud.update(dt)
+
+    def draw(self, screen):
+        self.background.draw(screen)
+        self.environment.draw(screen)
+        self.enemies.draw(screen)
+        self.player.draw(screen)
+        self.hud.draw()
+
 
 # -----------------------------
-# Main Loop
+# Game
 # -----------------------------
-while running:
-    try:
-        dt = clock.tick(FPS)
-        events = pygame.event.get()
+class Game:
+    """The window, resource sets and state machine.
+
+    ``seed`` seeds every subsystem's random stream (a fresh seed when None).
+    ``autopilot`` names an autopilot (see entities/autopilot.py) that flies
+    the witch in place of the keyboard. With ``record=True`` each frame's dt
+    and input events are kept in ``self.recording``; feeding them back
+    through ``step`` on a game built with the same seed, start state and
+    autopilot plays the session back exactly.
+    """
+
+    def __init__(self, start="menu", seed=None, record=False, autopilot=None):
+        streams.reseed(seed)
+        clock.reset()
+        inputs.reset()
+        animations.reset()
+        self.autopilot = autopilot
+        self.recording = Recording(streams.seed, start, autopilot) if record else None
+
+        pygame.init()
+        pygame.mixer.init()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("Zethia: Skyfall Run")
+        self.clock = pygame.time.Clock()
+
+        # Resource sets, loaded while a state that needs them is live
+        self.resources = Resources()
+        self.resources.define("menu", lambda: StartMenu(self.screen))
+        self.resources.define("cutscene", lambda: Cutscene(self.screen))
+        self.resources.define("gameplay", lambda: GameplayScene(self.screen))
+
+        self.states = StateManager(self.resources)
+        for state_type in (MenuState, TransitionState, CutsceneState, GameplayState):
+            self.states.add(state_type(self))
+
+        self.running = True
+        self.error_occurred = False
+        self.error_message = ""
+        self.rendered = False  # Whether the last step drew its frame
+        self.states.change(start)
+
+    def close(self):
+        """Tear the game down; call before ``pygame.quit``."""
+        self.states.close()
+        self.resources.close()
+        gc_policy.restore()
+
+    def handle_events(self, events):
+        """Quit on QUIT; send every action press to the game, then the active state."""
         for e in events:
             if e.type == pygame.QUIT:
-                running = False
+                self.running = False
+        for press in inputs.presses:
+            if press.action == "report":
+                print(profiler.report())
+                print(self.resources.report())
+                print(memory.report())
+                print(effects.report())
+                if latency.enabled:
+                    print(latency.report())
+                if spikes.enabled:
+                    print(spikes.report())
+                if allocations.enabled:
+                    print(allocations.report())
+                print(gc_policy.report())
+            elif press.action == "dump" and spikes.enabled:
+                print(f"Spike stacks written to {spikes.dump(SPIKE_DUMP)}")
+            self.states.handle(press)
+
+    def step(self, dt, events, render=True):
+        """Run one frame: events, update and, when ``render`` is set, draw and flip."""
+        started, state = time.perf_counter(), self.states.current
+        if self.recording is not None:
+            self.recording.add(dt, events)
+        clock.advance(dt)
+        inputs.feed(events)
+        self.handle_events(events)
 
+        with profiler.section("update"):
+            self.states.update(dt, events)
+
+        self.rendered = render
+        if render:
+            with profiler.section("draw"):
+                self.draw()
+            latency.presented()
+        profiler.end_frame()
+        memory.end_frame()
+        latency.end_frame()
+        gc_policy.end_frame((time.perf_counter() - started) * 1000)
+        allocations.end_frame(self.states.current)
+        if spikes.enabled:
+            if self.states.current != state:
+                state = f"{state}>{self.states.current}"
+            spikes.end_frame((time.perf_counter() - started) * 1000, state)
+
+    def draw(self):
         # Clear screen
-        screen.fill((0, 0, 0))
-
-        # MENU STATE ---------------------
-        if state.current == "menu":
-            action = menu.update(events, dt)
-
-            if action == "Start Game":
-                try:
-                    pygame.mixer.music.fadeout(1000)
-                except:
-                    pass
-                state.set_state("transition")
-                transition_alpha = 0
-                transition_stage = 0
-
-            elif action == "Quit":
-                running = False
-
-            menu.draw(dt)
-
-        # TRANSITION STATE ---------------------
-        elif state.current == "transition":
-            # Update transition
-            if transition_stage == 0:  # Fade to black
-                transition_alpha += transition_speed
-                if transition_alpha >= 255:
-                    transition_alpha = 255
-                    transition_stage = 1
-                    transition_text = "Zethia: Skyfall Run"
-                    
-            elif transition_stage == 1:  # Show text
-                # Wait a bit then move to cutscene
-                if pygame.time.get_ticks() % 3000 < dt:  # Show text for 3 seconds
-                    transition_stage = 2
-                    
-            elif transition_stage == 2:  # Fade to cutscene
-                # Start cutscene music and transition
-                if transition_alpha == 255:  # Only load music once
-                    try:
-                        pygame.mixer.music.load("assets/music/cutscene_theme.mp3")
-                        pygame.mixer.music.set_volume(0.5)
-                        pygame.mixer.music.play(-1)
-                    except:
-                        print("Could not load cutscene music")
-
-                transition_alpha -= transition_speed
-                if transition_alpha <= 0:
-                    transition_alpha = 0
-                    state.set_state("cutscene")
-
-            # Draw transition
-            screen.fill((0, 0, 0))  # Black background
-            
-            if transition_stage == 1:  # Show text in the middle of black screen
-                text_surface = transition_font.render(transition_text, True, (255, 255, 255))
-                text_rect = text_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-                screen.blit(text_surface, text_rect)
-            
-            # Apply fade overlay
-            if transition_alpha > 0:
-                fade_surface = pygame.Surface((WIDTH, HEIGHT))
-                fade_surface.fill((0, 0, 0))
-                fade_surface.set_alpha(transition_alpha)
-                screen.blit(fade_surface, (0, 0))
-
-        # CUTSCENE STATE ---------------------
-        elif state.current == "cutscene":
-            # Pass events to cutscene for proper spacebar handling
-            cutscene.update(dt, events)
-            cutscene.draw()
-
-            # Check if cutscene is finished (spacebar will advance through text)
-            if cutscene.finished:
-                try:
-                    pygame.mixer.music.fadeout(800)
-                    pygame.mixer.music.load("assets/music/game_theme.mp3")
-                    pygame.mixer.music.set_volume(0.5)
-                    pygame.mixer.music.play(-1)
-                except:
-                    print("Could not load game music")
-                state.set_state("game")
-
-        # GAME STATE ---------------------
-        elif state.current == "game":
-            background.update(dt)
-            environment.update(dt)
-            player.update(dt)
-            hud.update(dt)
-
-            background.draw(screen)
-            environment.draw(screen)
-            player.draw(screen)
-            hud.draw()
+        self.screen.fill((0, 0, 0))
+        self.states.draw(self.screen)
 
         # Display error message if something went wrong
-        if error_occurred:
+        if self.error_occurred:
             error_font = pygame.font.SysFont("arial", 24)
-            error_surface = error_font.render(f"Error: {error_message}", True, (255, 0, 0))
-            screen.blit(error_surface, (10, 10))
+            error_surface = error_font.render(f"Error: {self.error_message}", True, (255, 0, 0))
+            self.screen.blit(error_surface, (10, 10))
 
         pygame.display.flip()
 
+    def final_digest(self):
+        """screen_digest of the last stepped frame, drawing it first if that
+        step skipped rendering (turbo runs draw one frame in N)."""
+        if not self.rendered:
+            self.draw()
+        return screen_digest(self.screen)
+
+    def run(self, turbo_dt=None, render_every=1):
+        """Main loop. With ``turbo_dt`` every frame advances the game by that
+        many ms without waiting on the clock, drawing only every
+        ``render_every`` frames, and simulated frames per second are printed
+        as it goes. While measuring latency the frame's idle time is spent
+        polling input instead of sleeping, so press stamps are not late by
+        up to a frame."""
+        frames, report_at = 0, time.perf_counter() + 5.0
+        started = frame_start = time.perf_counter()
+        while self.running:
+            try:
+                if turbo_dt is None and latency.enabled:
+                    events = inputs.poll_until(frame_start + 1 / FPS)
+                    now = time.perf_counter()
+                    dt, frame_start = (now - frame_start) * 1000, now
+                    self.step(dt, events)
+                    continue
+                if turbo_dt is None:
+                    self.step(self.clock.tick(FPS), inputs.poll())
+                    continue
+                self.step(turbo_dt, inputs.poll(), render=frames % render_every == 0)
+                frames += 1
+                if time.perf_counter() >= report_at:
+                    report_at += 5.0
+                    print(turbo_report(frames, turbo_dt, time.perf_counter() - started))
+            except Exception as e:
+                print(f"Error in main loop: {e}")
+                traceback.print_exc()
+                self.error_occurred = True
+                self.error_message = str(e)
+                # Try to keep running to see error on screen
+        if turbo_dt is not None:
+            print(turbo_report(frames, turbo_dt, time.perf_counter() - started))
+
+
+# Where F10 and --spikes write the caught frames' folded stacks
+SPIKE_DUMP = "spikes.folded"
+
+
+def turbo_report(frames, dt, wall):
+    """Throughput line for turbo runs: frames, simulated time and sim fps."""
+    wall = max(wall, 1e-9)
+    return (f"[TURBO] {frames} frames, {frames * dt / 1000:.0f} s simulated in {wall:.1f} s: "
+            f"{frames / wall:.0f} sim fps ({frames * dt / 1000 / wall:.1f}x real time)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zethia: Skyfall Run")
+    parser.add_argument("--seed", type=int, help="seed for every random stream")
+    parser.add_argument("--record", metavar="PATH", help="save the session for tools/replay.py")
+    parser.add_argument("--autopilot", choices=AUTOPILOTS, help="let an autopilot fly the witch")
+    parser.add_argument("--turbo", action="store_true", help="run uncapped on a fixed virtual dt")
+    parser.add_argument("--dt", type=float, default=1000 / FPS, help="virtual ms per frame in turbo mode")
+    parser.add_argument("--render-every", type=int, default=1, metavar="N", help="in turbo mode, draw one frame in N")
+    parser.add_argument("--latency", action="store_true", help="measure input-to-display latency per action")
+    parser.add_argument("--spikes", type=float, nargs="?", const=33.0, metavar="MS",
+                        help=f"sample stacks of frames over MS (default 33); F10 writes them to {SPIKE_DUMP}")
+    parser.add_argument("--alloc", type=int, nargs="?", const=1, metavar="N",
+                        help="trace Python allocations per subsystem, diffing every N frames")
+    parser.add_argument("--auto-gc", action="store_true", help="leave garbage collection to Python's defaults")
+    args = parser.parse_args()
+    latency.enabled = args.latency
+    gc_policy.enabled = not args.auto_gc
+    if args.alloc:
+        allocations.start(args.alloc)
+    if args.spikes:
+        spikes.start(args.spikes)
+
+    try:
+        game = Game(seed=args.seed, record=bool(args.record), autopilot=args.autopilot)
     except Exception as e:
-        print(f"Error in main loop: {e}")
+        print(f"Failed to initialize game components: {e}")
         traceback.print_exc()
-        error_occurred = True
-        error_message = str(e)
-        # Try to keep running to see error on screen
+        pygame.quit()
+        exit()
+    if args.turbo:
+        game.run(turbo_dt=args.dt, render_every=max(1, args.render_every))
+    else:
+        game.run()
+    if args.latency:
+        print(latency.report())
+    if args.alloc:
+        print(allocations.report())
+    if args.spikes:
+        spikes.stop()
+        print(spikes.report())
+        print(f"Spike stacks written to {spikes.dump(SPIKE_DUMP)}")
+    if args.record:
+        game.recording.digest = game.final_digest()
+        game.recording.save(args.record)
+        print(f"Recorded {len(game.recording.frames)} frames (seed {game.recording.seed}) to {args.record}")
+    game.close()
+    pygame.quit()
+
 
-pygame.quit()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
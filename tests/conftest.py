@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Let the tests import main, core and tools like the game does, from any cwd
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
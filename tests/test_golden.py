@@ -0,0 +1,38 @@
+"""Rendered frames of each state against the references in tests/golden/.
+
+Re-record with ``python -m tools.golden --update`` after a change that is
+meant to alter the picture; ``python -m tools.golden`` prints the same
+comparison with frame times against the stored ones.
+"""
+import pytest
+
+from tools import golden
+
+TOLERANCE = 16
+MAX_BAD = 0.005
+
+
+@pytest.fixture(scope="module")
+def rendered():
+    return golden.render_all()
+
+
+@pytest.mark.parametrize("scene", list(golden.SCENES))
+def test_scene_matches_reference(scene, rendered, record_property):
+    reference = golden.load_reference(scene)
+    if reference is None:
+        pytest.skip(f"no reference for {scene}; run python -m tools.golden --update")
+    pixels, ms = rendered[scene]
+    record_property("frame_ms", round(ms, 3))
+    record_property("reference_ms", golden.load_timings().get(scene))
+
+    bad, psnr = golden.compare(reference, pixels, TOLERANCE)
+    assert reference.shape == pixels.shape
+    assert bad <= MAX_BAD, f"{bad:.2%} of pixels differ (PSNR {psnr:.1f} dB)"
+
+
+def test_compare_tolerates_small_differences():
+    reference = golden.np.zeros((4, 4, 3), golden.np.uint8)
+    nudged = reference + TOLERANCE
+    assert golden.compare(reference, nudged, TOLERANCE)[0] == 0.0
+    assert golden.compare(reference, nudged + 1, TOLERANCE)[0] == 1.0
@@ -0,0 +1,179 @@
+"""Bake every scaled/pixelated image the game loads, in parallel.
+
+Recipes come from the scene definitions, the saucer sprite and the
+cutscene backgrounds. Each recipe runs the same transform the runtime
+loader would and is written as soon as it finishes to its own
+single-image pack under assets/baked/, which ``core.assets`` maps instead
+of redoing the work. Recipes whose source bytes and options hash the same
+as last time (core.asset_pack.content_hash) are skipped, and the sprite
+atlas is rebuilt (trimmed and packed) as one more job when its sources
+change. The manifest also records each source's size and mtime, which is
+all the game checks before using a bake.
+
+Unless --jobs says otherwise, a handful of jobs is baked in this process:
+a worker costs a fresh interpreter and a pygame start-up, more than a
+small recipe takes. Larger batches, or any --jobs above 1, go to a
+process pool whose workers set pygame up once each.
+
+Run from the repository root:
+
+    python -m tools.bake [--jobs N] [--force]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.asset_pack import MANIFEST, content_hash, load_manifest, manifest_entry
+
+SPRITE_DIR = "assets/sprites"
+INPROCESS_JOBS = 16  # Without --jobs, up to this many jobs bake here rather than in workers
+JOBS_PER_WORKER = 8  # Don't start a worker for fewer jobs than this
+
+
+def collect_recipes():
+    """Every (path, scale, pixelate, smooth) load that does real work at runtime."""
+    from world.scenes import MENU_SKY, GAMEPLAY_SKY
+    from core.parallax import image_recipes
+    from entities.enemy import SAUCER_IMAGE, SAUCER_SIZE
+    from ui import cutscene
+
+    recipes = image_recipes(MENU_SKY) | image_recipes(GAMEPLAY_SKY) | cutscene.image_recipes()
+    recipes.add((SAUCER_IMAGE, SAUCER_SIZE, False, True))
+    return sorted((r for r in recipes if r[1] is not None or r[2]), key=str)
+
+
+# -------------------------------------------------------------
+# Jobs (run here or in pool workers)
+# -------------------------------------------------------------
+def init_pygame():
+    """Once per process: scene imports load through display-converting helpers."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def bake_recipe(recipe):
+    from core.assets import transform
+    from core.asset_pack import recipe_name, baked_path, write_pack
+
+    start = time.perf_counter()
+    path, scale, pixelate, smooth = recipe
+    image = transform(pygame.image.load(path), scale, pixelate, smooth)
+    name = recipe_name(*recipe)
+    write_pack(baked_path(name), {name: image})
+    return (time.perf_counter() - start) * 1000
+
+
+def bake_atlas():
+    from tools import pack_sprites
+
+    start = time.perf_counter()
+    paths, _ = pack_sprites.find_sprites([SPRITE_DIR], 256)
+    pack_sprites.pack(paths, "sprites")
+    return (time.perf_counter() - start) * 1000
+
+
+# -------------------------------------------------------------
+# Driver
+# -------------------------------------------------------------
+def save_manifest(manifest):
+    os.makedirs(os.path.dirname(MANIFEST), exist_ok=True)
+    with open(MANIFEST, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+
+def plan_jobs(force):
+    """[(name, manifest entry, job, args)] for everything that is out of date."""
+    from core.asset_pack import recipe_name, baked_path
+    from tools.pack_sprites import find_sprites
+
+    manifest = load_manifest()
+    jobs, fresh = [], []
+    for recipe in collect_recipes():
+        name = recipe_name(*recipe)
+        entry = manifest_entry(content_hash([recipe[0]], name), recipe[0])
+        if not force and manifest.get(name, {}).get("hash") == entry["hash"] and os.path.exists(baked_path(name)):
+            manifest[name] = entry  # Same bytes, maybe a new mtime: keep the game's check passing
+            fresh.append(name)
+        else:
+            jobs.append((name, entry, bake_recipe, (recipe,)))
+
+    sprites, _ = find_sprites([SPRITE_DIR], 256)
+    entry = manifest_entry(content_hash(sprites, "atlas|" + "|".join(sprites)))
+    if not force and manifest.get("sprite atlas", {}).get("hash") == entry["hash"]:
+        fresh.append("sprite atlas")
+    else:
+        jobs.append(("sprite atlas", entry, bake_atlas, ()))
+    return manifest, jobs, fresh
+
+
+def default_workers(job_count):
+    return max(1, min(os.cpu_count() or 1, job_count // JOBS_PER_WORKER))
+
+
+def run_jobs(jobs, workers):
+    """Yield (name, manifest entry, ms or exception) as each job finishes."""
+    if workers <= 1:
+        for name, entry, job, job_args in jobs:
+            try:
+                yield name, entry, job(*job_args)
+            except Exception as e:
+                yield name, entry, e
+        return
+
+    # Fresh interpreters rather than forks of this SDL-initialised process
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=init_pygame) as pool:
+        futures = {pool.submit(job, *job_args): (name, entry) for name, entry, job, job_args in jobs}
+        for future in as_completed(futures):
+            name, entry = futures[future]
+            try:
+                yield name, entry, future.result()
+            except Exception as e:
+                yield name, entry, e
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, help="worker processes (default: from the job count)")
+    parser.add_argument("--force", action="store_true", help="rebake everything")
+    args = parser.parse_args()
+
+    init_pygame()
+    manifest, jobs, fresh = plan_jobs(args.force)
+    save_manifest(manifest)
+    workers = args.jobs or (1 if len(jobs) <= INPROCESS_JOBS else default_workers(len(jobs)))
+
+    timings = []
+    start = time.perf_counter()
+    for name, entry, result in run_jobs(jobs, workers):
+        if isinstance(result, Exception):
+            timings.append((name, f"FAILED: {result}", 0.0))
+        else:
+            timings.append((name, "baked", result))
+            manifest[name] = entry
+            save_manifest(manifest)  # Keep finished work even if a later job fails
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    width = max([len(name) for name, _, _ in timings] + [len(name) for name in fresh] + [5])
+    print(f"{'asset':<{width}}  {'ms':>8}  status")
+    for name, status, ms in sorted(timings, key=lambda t: -t[2]):
+        print(f"{name:<{width}}  {ms:8.1f}  {status}")
+    for name in fresh:
+        print(f"{name:<{width}}  {'-':>8}  up to date")
+    serial_ms = sum(ms for _, _, ms in timings)
+    print(f"\n{len(timings)} baked, {len(fresh)} up to date with {workers} workers: "
+          f"{wall_ms:.0f} ms wall, {serial_ms:.0f} ms of work "
+          f"({serial_ms / max(wall_ms, 1e-9):.1f}x)")
+    if any(status != "baked" for _, status, _ in timings):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
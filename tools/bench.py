@@ -0,0 +1,282 @@
+"""Benchmark startup, frame time and memory, and compare against a stored baseline.
+
+``run`` plays each benchmarked state headless on a fixed seed and dt, in a
+fresh interpreter per state and repeat, one at a time so no measurement
+competes with another for CPU, cache or memory bandwidth. For each it
+measures the startup time (imports plus building the game into that
+state), the mean and p95 frame time, the frame profiler's section
+timings, the peak resident set size and the surface memory left live.
+Results are written as JSON under benchmarks/, tagged with the git
+commit and a fingerprint of the machine. ``--baseline`` also makes them
+this machine's baseline.
+
+``compare`` runs the same benchmark (or loads one with --current) and tests
+every metric against the baseline. A metric regresses when it is worse by
+more than --threshold and a permutation test on the repeats puts the
+chance of that being noise below --alpha. Any regression exits non-zero,
+so this can gate a merge locally.
+
+Run from the repository root:
+
+    python -m tools.bench run --baseline [--repeats 5]   # on the commit to compare against
+    python -m tools.bench compare                         # on the change
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STORE = os.path.join(ROOT, "benchmarks")
+SEED = 1
+DT = 16
+WARMUP = 60  # Frames left out of the frame-time figures
+
+# State -> (frames to play, autopilot)
+STATES = {
+    "menu": (600, None),
+    "cutscene": (600, None),
+    "game": (1200, "hunter"),
+}
+
+
+# -------------------------------------------------------------
+# Worker job (runs in a child process)
+# -------------------------------------------------------------
+def measure(state):
+    """One sample of every metric for ``state``: {metric: value}."""
+    started = time.perf_counter()
+    os.chdir(ROOT)
+    import pygame
+    from main import Game
+    from core.memory import memory
+    from core.profiler import profiler
+
+    frames, autopilot = STATES[state]
+    game = Game(start=state, seed=SEED, autopilot=autopilot)
+    metrics = {f"startup.{state}_ms": (time.perf_counter() - started) * 1000}
+
+    profiler.history = frames
+    frame_ms = []
+    for frame in range(frames):
+        if frame == WARMUP:
+            profiler.frames = []
+        pygame.event.pump()
+        began = time.perf_counter()
+        game.step(DT, [])
+        frame_ms.append((time.perf_counter() - began) * 1000)
+
+    ordered = sorted(frame_ms[WARMUP:])
+    metrics[f"frame.{state}.mean_ms"] = sum(ordered) / len(ordered)
+    metrics[f"frame.{state}.p95_ms"] = ordered[int(len(ordered) * 0.95)]
+    for name, (mean, _) in profiler.summary().items():
+        metrics[f"section.{state}.{name}_ms"] = mean
+    metrics[f"memory.{state}.surfaces_mb"] = sum(memory.resident().values()) / 2 ** 20
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        metrics[f"memory.{state}.rss_mb"] = peak / (2 ** 20 if sys.platform == "darwin" else 2 ** 10)
+    game.close()
+    pygame.quit()
+    return metrics
+
+
+# -------------------------------------------------------------
+# Tags and storage
+# -------------------------------------------------------------
+def git(*args):
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def machine():
+    """What the timings depend on, plus a short fingerprint of it."""
+    import pygame
+
+    info = {
+        "node": platform.node(),
+        "system": f"{platform.system()} {platform.release()}",
+        "cpu": platform.processor() or platform.machine(),
+        "cores": os.cpu_count(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(map(str, pygame.get_sdl_version())),
+    }
+    info["fingerprint"] = hashlib.sha1(json.dumps(info, sort_keys=True).encode()).hexdigest()[:12]
+    return info
+
+
+def baseline_path(fingerprint):
+    return os.path.join(STORE, f"baseline-{fingerprint}.json")
+
+
+def run(repeats):
+    """{metric: [one value per repeat]} for every state."""
+    jobs = [state for state in STATES for _ in range(repeats)]
+    samples = {}
+    context = multiprocessing.get_context("spawn")
+    # Timed jobs run serially; the pool only provides a fresh process per job
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1) as pool:
+        for metrics in pool.map(measure, jobs):
+            for name, value in metrics.items():
+                samples.setdefault(name, []).append(value)
+    return samples
+
+
+def record(samples, repeats):
+    commit = git("rev-parse", "--short", "HEAD") or "unknown"
+    return {
+        "commit": commit,
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": machine(),
+        "seed": SEED,
+        "dt": DT,
+        "repeats": repeats,
+        "metrics": samples,
+    }
+
+
+def save(result, baseline=False):
+    os.makedirs(STORE, exist_ok=True)
+    stamp = result["created"].replace(":", "").replace("-", "")
+    path = os.path.join(STORE, f"{stamp}-{result['commit']}{'-dirty' if result['dirty'] else ''}.json")
+    paths = [path] + ([baseline_path(result["machine"]["fingerprint"])] if baseline else [])
+    for target in paths:
+        with open(target, "w") as f:
+            json.dump(result, f, indent=1, sort_keys=True)
+    return paths
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+# -------------------------------------------------------------
+# Statistics
+# -------------------------------------------------------------
+def mean(values):
+    return sum(values) / len(values)
+
+
+def permutation_p(base, current, rounds=5000, seed=0):
+    """One-sided p-value for ``current`` having a higher mean than ``base``
+    by chance: the share of relabelings of the pooled samples whose mean
+    difference is at least the observed one. Exact when the number of
+    relabelings is at most ``rounds``, sampled otherwise."""
+    pooled = list(base) + list(current)
+    size = len(current)
+    total = sum(pooled)
+    observed = mean(current) - mean(base)
+
+    def difference(indices):
+        picked = sum(pooled[i] for i in indices)
+        return picked / size - (total - picked) / len(base)
+
+    if math.comb(len(pooled), size) <= rounds:
+        draws = list(itertools.combinations(range(len(pooled)), size))
+    else:
+        rng = random.Random(seed)
+        draws = [rng.sample(range(len(pooled)), size) for _ in range(rounds)]
+    extreme = sum(1 for indices in draws if difference(indices) >= observed - 1e-12)
+    return extreme / len(draws)
+
+
+def compare(baseline, current, threshold, alpha):
+    """[(metric, base mean, current mean, change, p, verdict)] for every shared metric."""
+    rows = []
+    for name in sorted(set(baseline) & set(current)):
+        base, now = baseline[name], current[name]
+        before, after = mean(base), mean(now)
+        change = (after - before) / before if before else 0.0
+        verdict = ""
+        if change > threshold:
+            p = permutation_p(base, now)
+            verdict = "REGRESSION" if p < alpha else ""
+        elif change < -threshold:
+            p = permutation_p(now, base)
+            verdict = "faster" if p < alpha else ""
+        else:
+            p = None
+        rows.append((name, before, after, change, p, verdict))
+    return rows
+
+
+def format_rows(rows):
+    lines = [f"{'metric':<40} {'baseline':>10} {'current':>10} {'change':>8} {'p':>7}"]
+    for name, before, after, change, p, verdict in rows:
+        p_text = f"{p:7.3f}" if p is not None else f"{'-':>7}"
+        lines.append(f"{name:<40} {before:10.3f} {after:10.3f} {change * 100:+7.1f}% {p_text}  {verdict}".rstrip())
+    return "\n".join(lines)
+
+
+# -------------------------------------------------------------
+# Driver
+# -------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="benchmark this tree and store the results")
+    run_parser.add_argument("--baseline", action="store_true", help="also make this the machine's baseline")
+    compare_parser = commands.add_parser("compare", help="benchmark this tree against the baseline")
+    compare_parser.add_argument("--against", metavar="PATH", help="baseline file (default: this machine's)")
+    compare_parser.add_argument("--current", metavar="PATH", help="compare a stored result instead of running")
+    compare_parser.add_argument("--threshold", type=float, default=0.05, help="smallest relative change that counts")
+    compare_parser.add_argument("--alpha", type=float, default=0.01, help="significance level of the test")
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--repeats", type=int, default=5, help="fresh runs per state")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        result = record(run(args.repeats), args.repeats)
+        for path in save(result, args.baseline):
+            print(f"results written to {path}")
+        return
+
+    against = args.against or baseline_path(machine()["fingerprint"])
+    if not os.path.exists(against):
+        print(f"[WARN] no baseline at {against}; run 'python -m tools.bench run --baseline' on the reference commit")
+        raise SystemExit(2)
+    baseline = load(against)
+    if args.current:
+        current = load(args.current)
+    else:
+        current = record(run(args.repeats), args.repeats)
+        save(current)
+    if 1 / math.comb(baseline["repeats"] + current["repeats"], current["repeats"]) >= args.alpha:
+        print(f"[WARN] too few repeats for any change to reach p < {args.alpha}; use --repeats 5 or more")
+    if baseline["machine"]["fingerprint"] != current["machine"]["fingerprint"]:
+        print("[WARN] baseline was measured on a different machine; timings may not be comparable")
+
+    rows = compare(baseline["metrics"], current["metrics"], args.threshold, args.alpha)
+    print(f"baseline {baseline['commit']} ({baseline['created']}) vs current {current['commit']}"
+          f"{' (dirty)' if current['dirty'] else ''}, {current['repeats']} repeats")
+    print(format_rows(rows))
+    regressions = [row[0] for row in rows if row[5] == "REGRESSION"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        raise SystemExit(1)
+    print("\nno significant regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark the spatial-hash collision world against naive all-pairs checks.
+
+Bodies keep the same density at every size (the arena grows with the
+count), so the hash should scale linearly while all-pairs grows with n^2.
+
+Run from the repository root:
+
+    python -m tools.bench_collision [--ticks 60] [--sizes 250 1000 4000]
+"""
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from core.settings import *
+from core.collision import CollisionWorld, LAYER_BOLT, LAYER_ENEMY, LAYER_PICKUP, LAYER_PLAYER
+
+
+def arena_size(count, base=250):
+    """Grow the arena with the body count so density stays constant."""
+    scale = max(1.0, (count / base) ** 0.5)
+    return WIDTH * scale, HEIGHT * scale
+
+
+def make_bodies(count, rng):
+    """Half bolts, the rest enemies with a sprinkle of pickups."""
+    arena_w, arena_h = arena_size(count)
+    bodies = []
+    for i in range(count):
+        if i % 2 == 0:
+            layer, collides, size = LAYER_BOLT, LAYER_ENEMY, (32, 24)
+        elif i % 10 == 1:
+            layer, collides, size = LAYER_PICKUP, LAYER_PLAYER, (24, 24)
+        else:
+            layer, collides, size = LAYER_ENEMY, LAYER_BOLT | LAYER_PLAYER, (64, 48)
+        bodies.append({
+            "id": i, "layer": layer, "collides": collides, "w": size[0], "h": size[1],
+            "x": rng.uniform(0, arena_w), "y": rng.uniform(0, arena_h),
+            "vx": rng.uniform(-300, 300), "vy": rng.uniform(-100, 100),
+        })
+    return bodies
+
+
+def step(bodies, dt_sec):
+    arena_w, arena_h = arena_size(len(bodies))
+    for b in bodies:
+        b["x"] = (b["x"] + b["vx"] * dt_sec) % arena_w
+        b["y"] = (b["y"] + b["vy"] * dt_sec) % arena_h
+
+
+def naive_pairs(bodies):
+    found = 0
+    for i in range(len(bodies) - 1):
+        a = bodies[i]
+        ra = pygame.Rect(a["x"], a["y"], a["w"], a["h"])
+        for b in bodies[i + 1:]:
+            if not (a["layer"] & b["collides"] or b["layer"] & a["collides"]):
+                continue
+            if ra.colliderect((b["x"], b["y"], b["w"], b["h"])):
+                found += 1
+    return found
+
+
+def bench_hash(count, ticks, rng):
+    bodies = make_bodies(count, rng)
+    world = CollisionWorld()
+    for b in bodies:
+        world.add(b["id"], (b["x"], b["y"], b["w"], b["h"]), b["layer"], b["collides"])
+    found = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        step(bodies, 1 / FPS)
+        for b in bodies:
+            world.move(b["id"], b["x"], b["y"])
+        found += sum(len(p) for p in world.collide().values())
+    return (time.perf_counter() - start) * 1000 / ticks, found / ticks
+
+
+def bench_naive(count, ticks, rng):
+    bodies = make_bodies(count, rng)
+    found = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        step(bodies, 1 / FPS)
+        found += naive_pairs(bodies)
+    return (time.perf_counter() - start) * 1000 / ticks, found / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=30)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000, 4000])
+    parser.add_argument("--naive-limit", type=int, default=1000,
+                        help="skip all-pairs runs above this many bodies")
+    args = parser.parse_args()
+
+    print(f"{'bodies':>8} {'hash ms/tick':>14} {'contacts':>9} {'naive ms/tick':>15}")
+    for count in args.sizes:
+        hash_ms, pairs = bench_hash(count, args.ticks, random.Random(count))
+        if count <= args.naive_limit:
+            naive_ms, _ = bench_naive(count, max(1, args.ticks // 5), random.Random(count))
+            naive = f"{naive_ms:15.2f}"
+        else:
+            naive = f"{'-':>15}"
+        print(f"{count:8d} {hash_ms:14.2f} {pairs:9.1f} {naive}")
+
+
+if __name__ == "__main__":
+    main()
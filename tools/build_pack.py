@@ -0,0 +1,55 @@
+"""Build the raw-pixel asset pack that the game memory-maps at startup.
+
+Every PNG under the source directories is decoded once here and stored as
+32-bit pixels in the layout the display uses, so at runtime each image is a
+``frombuffer`` view over the mapped file instead of a PNG decode. Music is
+streamed by pygame.mixer and is left out.
+
+Run from the repository root:
+
+    python -m tools.build_pack [--src assets] [--out assets/assets.pack]
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from core.asset_pack import PACK_PATH, write_pack
+
+
+def find_images(sources):
+    paths = []
+    for source in sources:
+        for root, _, files in os.walk(source):
+            for name in files:
+                if name.lower().endswith(".png"):
+                    paths.append(os.path.join(root, name).replace(os.sep, "/"))
+    return sorted(paths)
+
+
+def build(paths, out_path):
+    return write_pack(out_path, {path: pygame.image.load(path) for path in paths})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--src", nargs="+", default=["assets"], help="directories to scan for PNGs")
+    parser.add_argument("--out", default=PACK_PATH)
+    args = parser.parse_args()
+
+    pygame.init()
+    paths = find_images(args.src)
+    if not paths:
+        parser.error(f"no images found in {', '.join(args.src)}")
+    start = time.perf_counter()
+    index = build(paths, args.out)
+    elapsed = time.perf_counter() - start
+    opaque = sum(1 for entry in index.values() if not entry[5])
+    print(f"packed {len(index)} images ({opaque} opaque) into {args.out}: "
+          f"{os.path.getsize(args.out) / 1e6:.1f} MB in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Run many seeded headless simulations across CPU cores and aggregate them.
+
+Each run is a fresh interpreter (dummy SDL video and audio) that builds the
+game with its own seed and plays it on a fixed virtual dt as fast as it
+will go, driven by the soak script's key presses or by the input of a
+recorded session, with an optional autopilot flying the witch. A
+recording contributes only its input and start state: each run keeps its
+own seed, so the session plays out differently from run to run. Per run
+it reports frame-time percentiles, the peak counts of saucers, bolts,
+sky entities and particles, the score and the simulated time at which
+the level was completed; the last table aggregates every run.
+
+Run from the repository root:
+
+    python -m tools.farm [--runs 8] [--jobs N] [--seed 1] [--level] [--frames 5400]
+                         [--replay PATH] [--autopilot hunter] [--render-every 4] [--json PATH]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+PEAKS = ("saucers", "bolts", "sky", "particles")
+
+
+def entity_counts(game):
+    """Live saucers, bolts, sky entities and particles in the current state."""
+    state = game.states.state
+    counts = dict.fromkeys(PEAKS, 0)
+    if state.name == "menu":
+        counts["particles"] = len(state.menu.particles)
+        counts["sky"] = len(state.menu.bg.world or ())
+    elif state.name == "cutscene":
+        counts["particles"] = len(state.cutscene.particles) + len(state.cutscene.magic_particles)
+    elif state.name == "game":
+        counts["saucers"] = len(state.enemies)
+        counts["bolts"] = len(state.player.projectiles)
+        counts["sky"] = len(state.background.sky.world or ())
+        counts["particles"] = len(state.environment.particles)
+    return counts
+
+
+def percentile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+# -------------------------------------------------------------
+# Worker job (runs in a child process)
+# -------------------------------------------------------------
+def simulate(seed, frames, level, after, dt, render_every, replay, autopilot):
+    """Play one seeded run and return its metrics."""
+    from main import Game
+    from core.replay import Recording
+    from tools.soak import scripted_keys
+
+    recording = Recording.load(replay) if replay else None
+    recorded = recording.frames if recording else None
+    game = Game(start=recording.start if recording else "menu", seed=seed, autopilot=autopilot)
+    frame_ms, peaks = [], dict.fromkeys(PEAKS, 0)
+    completed_at = None
+    started = time.perf_counter()
+    frame = 0
+    while frame < frames and game.running:
+        if recorded is not None and frame < len(recorded):
+            frame_dt, events = recorded[frame]
+        else:
+            frame_dt, events = dt, ([] if recorded is not None else scripted_keys(game, frame + 1))
+        frame += 1
+        pygame.event.pump()
+        start = time.perf_counter()
+        game.step(frame_dt, events, render=frame % render_every == 0)
+        frame_ms.append((time.perf_counter() - start) * 1000)
+
+        for name, count in entity_counts(game).items():
+            peaks[name] = max(peaks[name], count)
+        if completed_at is None:
+            scene = game.resources.loaded.get("gameplay")
+            if scene is not None and scene.background.show_completion:
+                completed_at, completed_frame = game_seconds(frame, dt, recorded), frame
+        if completed_at is not None and level and frame - completed_frame >= after:
+            break
+
+    scene = game.resources.loaded.get("gameplay")
+    ordered = sorted(frame_ms)
+    result = {
+        "seed": seed,
+        "frames": frame,
+        "wall_s": time.perf_counter() - started,
+        "final_state": game.states.current,
+        "completed_s": completed_at,
+        "score": scene.hud.score if scene else None,
+        "health": scene.hud.health if scene else None,
+        "kills": scene.enemies.kills if scene else None,
+        "p50_ms": percentile(ordered, 0.50),
+        "p95_ms": percentile(ordered, 0.95),
+        "p99_ms": percentile(ordered, 0.99),
+        "max_ms": ordered[-1],
+        **{f"peak_{name}": count for name, count in peaks.items()},
+    }
+    game.close()
+    pygame.quit()
+    return result
+
+
+def game_seconds(frame, dt, recorded):
+    if recorded is not None:
+        played = recorded[:frame]
+        return (sum(d for d, _ in played) + (frame - len(played)) * dt) / 1000
+    return frame * dt / 1000
+
+
+# -------------------------------------------------------------
+# Driver
+# -------------------------------------------------------------
+# (result key, heading, width, decimals)
+COLUMNS = [
+    ("seed", "seed", 10, 0), ("frames", "frames", 7, 0), ("completed_s", "done s", 7, 1),
+    ("score", "score", 6, 0), ("kills", "kills", 5, 0), ("health", "hp", 4, 0),
+    ("p50_ms", "p50", 6, 2), ("p95_ms", "p95", 6, 2), ("p99_ms", "p99", 6, 2), ("max_ms", "max", 8, 1),
+    ("peak_saucers", "saucers", 7, 0), ("peak_bolts", "bolts", 5, 0),
+    ("peak_sky", "sky", 4, 0), ("peak_particles", "particles", 9, 0),
+]
+
+
+def format_row(values):
+    cells = []
+    for key, _, width, decimals in COLUMNS:
+        value = values.get(key)
+        if value is None:
+            value = "-"
+        cells.append(f"{value:>{width}}" if isinstance(value, str) else f"{value:>{width}.{decimals}f}")
+    return "  ".join(cells)
+
+
+def aggregate(results):
+    """{label: row} with the mean, best and worst of every numeric column."""
+    rows = {}
+    numeric = [key for key, _, _, _ in COLUMNS if key != "seed"]
+    for label, pick in (("mean", lambda v: sum(v) / len(v)), ("min", min), ("max", max)):
+        row = {"seed": label}
+        for name in numeric:
+            values = [r[name] for r in results if r[name] is not None]
+            row[name] = pick(values) if values else None
+        rows[label] = row
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=8)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the first run; the rest count up")
+    parser.add_argument("--frames", type=int, help="frames per run (default 5400, or no limit with --level)")
+    parser.add_argument("--level", action="store_true", help="play each run until the level is complete")
+    parser.add_argument("--after", type=int, default=300, help="frames to keep running once the level is complete")
+    parser.add_argument("--dt", type=float, default=16, help="milliseconds per simulated frame")
+    parser.add_argument("--render-every", type=int, default=4, metavar="N", help="draw one frame in N")
+    parser.add_argument("--replay", metavar="PATH", help="drive every run with this recording's input")
+    parser.add_argument("--autopilot", help="fly the witch with an autopilot (hunter, weave, sweep, loop)")
+    parser.add_argument("--json", metavar="PATH", help="also write every run's metrics as JSON")
+    args = parser.parse_args()
+
+    frames = args.frames or (10 ** 9 if args.level else 5400)
+    seeds = range(args.seed, args.seed + args.runs)
+    job_args = (frames, args.level, args.after, args.dt, max(1, args.render_every), args.replay,
+                args.autopilot)
+
+    results = []
+    start = time.perf_counter()
+    # Fresh interpreters, one per run, so no module-level state carries between seeds
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=args.jobs, mp_context=context, max_tasks_per_child=1) as pool:
+        futures = {pool.submit(simulate, seed, *job_args): seed for seed in seeds}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"[WARN] seed {futures[future]} failed: {e}")
+    wall = time.perf_counter() - start
+
+    results.sort(key=lambda r: r["seed"])
+    print(format_row({key: heading for key, heading, _, _ in COLUMNS}))
+    for result in results:
+        print(format_row(result))
+    if results:
+        print()
+        for row in aggregate(results).values():
+            print(format_row(row))
+    sim_frames = sum(r["frames"] for r in results)
+    print(f"\n{len(results)}/{args.runs} runs, {sim_frames} frames with {args.jobs} workers in {wall:.1f} s "
+          f"({sim_frames / max(wall, 1e-9):.0f} sim fps overall)")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=1)
+    if len(results) < args.runs:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
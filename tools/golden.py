@@ -0,0 +1,169 @@
+"""Render fixed frames of every state and check them against reference images.
+
+Each scene builds the game in a fresh interpreter (dummy SDL video and
+audio) with a fixed seed, starts it in one state and steps it a fixed
+number of frames on a fixed dt, so randomness and the game clock are the
+same on every run. The last frame is compared with the stored reference
+image in tests/golden/. A pixel counts as different when any channel is
+off by more than --tolerance, and a scene fails when more than --max-bad
+of its pixels differ. The PSNR is printed as an overall closeness figure.
+The mean frame time of each scene is printed next to the time stored
+with the references, so a rendering change comes with both its visual
+and its speed evidence.
+
+Run from the repository root:
+
+    python -m tools.golden            # compare (also: python -m pytest tests)
+    python -m tools.golden --update   # re-render the references after an intended change
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GOLDEN_DIR = os.path.join(ROOT, "tests", "golden")
+TIMINGS = os.path.join(GOLDEN_DIR, "timings.json")
+SEED = 1
+DT = 16
+
+# Scene name -> (start state, frames to run, autopilot)
+SCENES = {
+    "intro": ("menu", 90, None),  # Studio card before the menu fades in
+    "menu": ("menu", 300, None),
+    "transition": ("transition", 230, None),  # Fading out towards the cutscene
+    "cutscene": ("cutscene", 240, None),
+    "game": ("game", 600, "hunter"),  # Saucers, bolts and explosions in flight
+}
+
+
+def render_scene(name):
+    """(RGB pixels as an array, mean step ms) for the last frame of ``name``."""
+    os.chdir(ROOT)  # Assets load by relative path; this runs in its own process
+    from main import Game
+
+    start, frames, autopilot = SCENES[name]
+    game = Game(start=start, seed=SEED, autopilot=autopilot)
+    step_ms = []
+    for _ in range(frames):
+        pygame.event.pump()
+        began = time.perf_counter()
+        game.step(DT, [])
+        step_ms.append((time.perf_counter() - began) * 1000)
+    pixels = pygame.surfarray.array3d(game.screen).swapaxes(0, 1)
+    game.close()
+    pygame.quit()
+    return pixels, sum(step_ms) / len(step_ms)
+
+
+def render_all(names=None):
+    """{scene: (pixels, mean ms)}, one fresh process per scene so no
+    module-level state carries from one scene into the next."""
+    names = list(names or SCENES)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context, max_tasks_per_child=1) as pool:
+        return dict(zip(names, pool.map(render_scene, names)))
+
+
+def reference_path(name):
+    return os.path.join(GOLDEN_DIR, f"{name}.png")
+
+
+def load_reference(name):
+    """Reference pixels for ``name``, or None if it was never recorded."""
+    path = reference_path(name)
+    if not os.path.exists(path):
+        return None
+    return pygame.surfarray.array3d(pygame.image.load(path)).swapaxes(0, 1)
+
+
+def save_image(pixels, path):
+    pygame.image.save(pygame.surfarray.make_surface(pixels.swapaxes(0, 1)), path)
+
+
+def load_timings():
+    if not os.path.exists(TIMINGS):
+        return {}
+    with open(TIMINGS) as f:
+        return json.load(f)
+
+
+def compare(reference, pixels, tolerance=16):
+    """(fraction of pixels off by more than ``tolerance`` in any channel,
+    PSNR in dB) of ``pixels`` against ``reference``."""
+    if reference.shape != pixels.shape:
+        return 1.0, 0.0
+    diff = np.abs(reference.astype(np.int16) - pixels.astype(np.int16))
+    bad = float(np.mean(diff.max(axis=2) > tolerance))
+    mse = float(np.mean(diff.astype(np.float64) ** 2))
+    psnr = float("inf") if mse == 0 else 10 * np.log10(255 ** 2 / mse)
+    return bad, psnr
+
+
+def diff_image(reference, pixels):
+    """The frame dimmed, with differing pixels in magenta, for eyeballing a failure."""
+    out = pixels // 3
+    out[np.any(reference != pixels, axis=2)] = (255, 0, 255)
+    return out
+
+
+def update(rendered):
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    timings = load_timings()
+    for name, (pixels, ms) in rendered.items():
+        save_image(pixels, reference_path(name))
+        timings[name] = round(ms, 3)
+        print(f"{name:<12} reference written, {ms:.2f} ms/frame")
+    with open(TIMINGS, "w") as f:
+        json.dump(timings, f, indent=1, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help=f"scenes to render (default all: {', '.join(SCENES)})")
+    parser.add_argument("--update", action="store_true", help="store the rendered frames as the new references")
+    parser.add_argument("--tolerance", type=int, default=16, help="per-channel difference a pixel may have")
+    parser.add_argument("--max-bad", type=float, default=0.005, help="fraction of pixels allowed to differ")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.scenes if name not in SCENES]
+    if unknown:
+        parser.error(f"unknown scene(s) {', '.join(unknown)}")
+    rendered = render_all(args.scenes)
+    if args.update:
+        update(rendered)
+        return
+
+    timings = load_timings()
+    failed = []
+    print(f"{'scene':<12} {'differ':>8} {'psnr dB':>8} {'ms/frame':>9} {'ref ms':>7} {'change':>7}")
+    for name, (pixels, ms) in rendered.items():
+        reference = load_reference(name)
+        if reference is None:
+            print(f"{name:<12} [WARN] no reference, run with --update")
+            failed.append(name)
+            continue
+        bad, psnr = compare(reference, pixels, args.tolerance)
+        ref_ms = timings.get(name)
+        change = f"{(ms / ref_ms - 1) * 100:+6.0f}%" if ref_ms else f"{'-':>7}"
+        verdict = "" if bad <= args.max_bad else "  FAIL"
+        print(f"{name:<12} {bad * 100:7.2f}% {psnr:8.1f} {ms:9.2f} {ref_ms or 0:7.2f} {change}{verdict}")
+        if verdict:
+            failed.append(name)
+            path = os.path.join(GOLDEN_DIR, f"{name}.diff.png")
+            save_image(diff_image(reference, pixels), path)
+            print(f"{'':<12} differences marked in {path}")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
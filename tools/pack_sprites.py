@@ -0,0 +1,120 @@
+"""Pack sprite PNGs into trimmed texture atlases with a compact JSON index.
+
+Each sprite is cropped to its non-transparent bounds and shelf-packed into
+one or more pages. Sprites bigger than ``--max-sprite`` on either side are
+left loose, since the game scales those down on load anyway. The index
+maps every sprite's source path to
+``[page, x, y, w, h, offset_x, offset_y, full_w, full_h]`` so the
+runtime loader (core/atlas.py) can hand out subsurfaces placed like the
+original untrimmed image.
+
+Run from the repository root:
+
+    python -m tools.pack_sprites [--src assets/sprites] [--name sprites] [--max-size 1024]
+                                 [--max-sprite 256]
+"""
+import argparse
+import json
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+ATLAS_DIR = "assets/atlases"
+
+
+def find_sprites(sources, max_sprite):
+    """PNG paths under ``sources``, split into (packable, too_big)."""
+    paths, skipped = [], []
+    for source in sources:
+        for root, _, files in os.walk(source):
+            for name in files:
+                if name.lower().endswith(".png"):
+                    path = os.path.join(root, name).replace(os.sep, "/")
+                    w, h = pygame.image.load(path).get_size()
+                    (paths if max(w, h) <= max_sprite else skipped).append(path)
+    return sorted(paths), sorted(skipped)
+
+
+def trim(path):
+    """Crop a sprite to its visible pixels; returns (surface, offset, full_size)."""
+    image = pygame.image.load(path)
+    bounds = image.get_bounding_rect()
+    if bounds.width == 0 or bounds.height == 0:
+        bounds = pygame.Rect(0, 0, 1, 1)
+    return image.subsurface(bounds).copy(), bounds.topleft, image.get_size()
+
+
+def shelf_pack(sizes, max_size, padding):
+    """Place rects tallest first on horizontal shelves; returns [(page, x, y)] and page sizes."""
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    places = [None] * len(sizes)
+    pages = []  # [width, height] used per page
+    page = x = y = shelf_h = 0
+    for i in order:
+        w, h = sizes[i]
+        if w > max_size or h > max_size:
+            raise ValueError(f"sprite {w}x{h} does not fit a {max_size}px page")
+        if x + w > max_size:
+            x, y, shelf_h = 0, y + shelf_h + padding, 0
+        if y + h > max_size:
+            page, x, y, shelf_h = page + 1, 0, 0, 0
+        if page == len(pages):
+            pages.append([0, 0])
+        places[i] = (page, x, y)
+        pages[page][0] = max(pages[page][0], x + w)
+        pages[page][1] = max(pages[page][1], y + h)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+    return places, pages
+
+
+def pack(paths, name, out_dir=ATLAS_DIR, max_size=1024, padding=1):
+    sprites = [trim(path) for path in paths]
+    places, page_sizes = shelf_pack([s[0].get_size() for s in sprites], max_size, padding)
+
+    pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+    index = {"pages": [f"{name}_{i}.png" for i in range(len(pages))], "sprites": {}}
+    for path, (surface, offset, full), (page, x, y) in zip(paths, sprites, places):
+        pages[page].blit(surface, (x, y))
+        w, h = surface.get_size()
+        index["sprites"][path] = [page, x, y, w, h, offset[0], offset[1], full[0], full[1]]
+
+    os.makedirs(out_dir, exist_ok=True)
+    for surface, file_name in zip(pages, index["pages"]):
+        pygame.image.save(surface, os.path.join(out_dir, file_name))
+    with open(os.path.join(out_dir, f"{name}.json"), "w") as f:
+        json.dump(index, f, separators=(",", ":"))
+
+    source_px = sum(full[0] * full[1] for _, _, full in sprites)
+    packed_px = sum(s[0].get_width() * s[0].get_height() for s in sprites)
+    return index, source_px, packed_px
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--src", nargs="+", default=["assets/sprites"],
+                        help="directories to scan for PNG sprites")
+    parser.add_argument("--name", default="sprites", help="atlas name (index and page file prefix)")
+    parser.add_argument("--out", default=ATLAS_DIR)
+    parser.add_argument("--max-size", type=int, default=1024)
+    parser.add_argument("--padding", type=int, default=1)
+    parser.add_argument("--max-sprite", type=int, default=256,
+                        help="leave sprites larger than this (in either side) out of the atlas")
+    args = parser.parse_args()
+
+    pygame.init()
+    paths, skipped = find_sprites(args.src, args.max_sprite)
+    if not paths:
+        parser.error(f"no sprites found in {', '.join(args.src)}")
+    index, source_px, packed_px = pack(paths, args.name, args.out, args.max_size, args.padding)
+    print(f"packed {len(paths)} sprites into {len(index['pages'])} page(s) in {args.out}")
+    for path in skipped:
+        print(f"  left loose (over {args.max_sprite}px): {path}")
+    print(f"pixels per frame blit: {source_px} untrimmed -> {packed_px} trimmed "
+          f"({100 * packed_px / max(1, source_px):.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
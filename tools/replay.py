@@ -0,0 +1,73 @@
+"""Replay a recorded session headless, as fast as it will run.
+
+Rebuilds the game with the recording's seed and start state and feeds it
+every recorded frame's dt and input events through ``Game.step`` without
+waiting on the clock. Prints the simulated and wall time and, with
+--report, the frame profiler's section timings, and with --latency the
+time from each replayed press to the flip that showed its result (the
+game's own processing latency, without OS or display delay). When the
+recording holds a digest of its last frame, the replay's last frame is
+checked against it and a mismatch exits non-zero.
+
+Record with ``python main.py --record PATH`` or ``python -m tools.soak
+--record PATH``, then run from the repository root:
+
+    python -m tools.replay PATH [--report] [--latency]
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording")
+    parser.add_argument("--report", action="store_true", help="print the frame profiler report")
+    parser.add_argument("--latency", action="store_true", help="print input-to-display latency per action")
+    args = parser.parse_args()
+
+    from main import Game
+    from core.profiler import profiler
+    from core.latency import latency
+    from core.replay import Recording, screen_digest
+
+    recording = Recording.load(args.recording)
+    game = Game(start=recording.start, seed=recording.seed, autopilot=recording.autopilot)
+    latency.enabled = args.latency
+    start = time.perf_counter()
+    for dt, events in recording.frames:
+        pygame.event.pump()  # Keep SDL serviced; its own events are not the game's input
+        now = time.perf_counter()
+        for event in events:
+            event.stamp = now  # As if each arrived just before its frame
+        game.step(dt, events)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    sim_ms = recording.duration
+    print(f"{len(recording.frames)} frames (seed {recording.seed}), ended in '{game.states.current}'")
+    print(f"{sim_ms / 1000:.1f} s simulated in {wall_ms / 1000:.1f} s wall "
+          f"({sim_ms / max(wall_ms, 1e-9):.1f}x real time)")
+    if args.report:
+        print()
+        print(profiler.report())
+    if args.latency:
+        print()
+        print(latency.report())
+
+    matched = True
+    if recording.digest is not None:
+        matched = screen_digest(game.screen) == recording.digest
+        print("last frame matches the recording" if matched else "[WARN] last frame differs from the recording")
+    game.close()
+    pygame.quit()
+    if not matched:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Soak-run the game headless and report surface memory by owner.
+
+Plays through the menu, transition and cutscene into gameplay (or starts
+in a given state) with scripted key presses, then prints the surface
+tracker's report: live surfaces and resident bytes per owner, allocations
+per frame, and owners whose resident memory kept growing. Exits non-zero
+when any owner is flagged.
+
+Frames run back to back on a fixed virtual dt, so the simulation goes as
+fast as the CPU allows; --render-every N draws only one frame in N. With
+--level the run continues until the level is finished and the Quest
+Complete overlay has been up for --after frames, which takes well under a
+minute instead of the level's sixteen. Throughput and the slowest frames
+are printed with the memory report.
+
+Run from the repository root:
+
+    python -m tools.soak [--frames 5400] [--start menu] [--dt 16] [--seed N] [--record PATH]
+    python -m tools.soak --level --render-every 4 --autopilot hunter
+
+--record saves the run for tools/replay.py. --spikes MS samples the main
+thread's stack and reports every frame slower than MS with its hottest
+functions and GC pauses; --flamegraph PATH writes those frames' stacks
+for flamegraph.pl or speedscope. --alloc N diffs tracemalloc snapshots
+every N frames and reports Python allocations per subsystem; --auto-gc
+runs with Python's default collector instead of the game's GC policy,
+for comparison.
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+
+def tap(key, unicode):
+    return [pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=unicode),
+            pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode=unicode)]
+
+
+def scripted_keys(game, frame):
+    """Key presses that move the game along: Enter in the menu, Space elsewhere."""
+    if game.states.current == "menu" and frame % 50 == 0:
+        return tap(pygame.K_RETURN, "\r")
+    if frame % 15 == 0:
+        return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=" ")]
+    if frame % 15 == 5:
+        return [pygame.event.Event(pygame.KEYUP, key=pygame.K_SPACE, mod=0, unicode=" ")]
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, help="frames to run (default 5400, or no limit with --level)")
+    parser.add_argument("--start", default="menu", help="state to start in")
+    parser.add_argument("--dt", type=float, default=16, help="milliseconds per simulated frame")
+    parser.add_argument("--render-every", type=int, default=1, metavar="N", help="draw one frame in N")
+    parser.add_argument("--level", action="store_true", help="play until the level is complete")
+    parser.add_argument("--after", type=int, default=300, help="frames to keep running once the level is complete")
+    parser.add_argument("--seed", type=int, help="seed for every random stream")
+    parser.add_argument("--record", metavar="PATH", help="save the run as a replayable recording")
+    parser.add_argument("--autopilot", help="fly the witch with an autopilot (hunter, weave, sweep, loop)")
+    parser.add_argument("--spikes", type=float, metavar="MS", help="catch stack samples of frames over MS")
+    parser.add_argument("--flamegraph", metavar="PATH", help="with --spikes, write their folded stacks here")
+    parser.add_argument("--alloc", type=int, metavar="N", help="trace Python allocations, diffing every N frames")
+    parser.add_argument("--auto-gc", action="store_true", help="leave garbage collection to Python's defaults")
+    args = parser.parse_args()
+
+    from main import Game, turbo_report
+    from core.memory import memory
+    from core.effects import effects
+    from core.rng import streams
+    from core.profiler import profiler
+    from core.input_handler import inputs
+    from core.spikes import spikes
+    from core.allocations import allocations
+    from core.gc_policy import gc_policy
+
+    limit = args.frames or (float("inf") if args.level else 5400)
+    render_every = max(1, args.render_every)
+    if args.level:
+        memory.sample_every = 600  # Spread the leak samples over the whole level
+
+    if args.spikes:
+        spikes.start(args.spikes)  # Before Game() so loading spikes are caught too
+    gc_policy.enabled = not args.auto_gc
+    if args.alloc:
+        allocations.start(args.alloc)
+    game = Game(start=args.start, seed=args.seed, record=bool(args.record), autopilot=args.autopilot)
+    frame_ms, completed_at = [], None
+    started = time.perf_counter()
+    frame = 0
+    while frame < limit and game.running:
+        frame += 1
+        start = time.perf_counter()
+        game.step(args.dt, inputs.poll() + scripted_keys(game, frame), render=frame % render_every == 0)
+        frame_ms.append(((time.perf_counter() - start) * 1000, frame, game.states.current))
+
+        if args.level and completed_at is None:
+            scene = game.resources.loaded.get("gameplay")
+            if scene is not None and scene.background.show_completion:
+                completed_at = frame
+        if completed_at is not None and frame - completed_at >= args.after:
+            break
+    wall = time.perf_counter() - started
+
+    print(f"{frame} frames (seed {streams.seed}), ended in '{game.states.current}'")
+    if args.level:
+        print(f"level complete at frame {completed_at}" if completed_at else "[WARN] level never completed")
+    print(turbo_report(frame, args.dt, wall))
+    slowest = sorted(frame_ms, reverse=True)
+    ordered = sorted(ms for ms, _, _ in frame_ms)
+    print(f"frame ms: mean {sum(ordered) / len(ordered):.2f}, p99 {ordered[int(len(ordered) * 0.99)]:.2f}, "
+          f"slowest " + ", ".join(f"{ms:.1f} (#{n} {state})" for ms, n, state in slowest[:5]) + "\n")
+    if args.record:
+        game.recording.digest = game.final_digest()
+        game.recording.save(args.record)
+    print(memory.report())
+    print(effects.report())
+    print()
+    print(game.resources.report())
+    print()
+    print(profiler.report())
+    print()
+    print(gc_policy.report())
+    if args.alloc:
+        print()
+        print(allocations.report())
+    if args.spikes:
+        spikes.stop()
+        print()
+        print(spikes.report())
+        if args.flamegraph:
+            print(f"spike stacks written to {spikes.dump(args.flamegraph)}")
+    game.close()
+    pygame.quit()
+    if memory.growing():
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,34 @@
 import pygame
-import random
 from core.settings import *
+from core.assets import AssetScope
+from core.asset_pack import image_size
+from core.memory import memory
+from core.effects import effects
+from core.clock import clock
+from core.rng import streams
+
+rng = streams.stream("cutscene")
+
+CITY_IMAGE = "assets/cutscenes/zethia_city.png"
+CITY_CORRUPTED_IMAGE = "assets/cutscenes/zethia_city_corrupted.png"
+WITCH_IMAGE = "assets/cutscenes/witch_cutscene.png"
+
+
+def cover_size(size):
+    """Size that covers the entire screen while keeping the aspect ratio (no black bars)."""
+    width, height = size
+    if width / height > SCREEN_WIDTH / SCREEN_HEIGHT:
+        return SCREEN_WIDTH, int(height * SCREEN_WIDTH / width)
+    return int(width * SCREEN_HEIGHT / height), SCREEN_HEIGHT
+
+
+def image_recipes():
+    """(path, scale, pixelate, smooth) for the scaled cutscene backgrounds."""
+    city = cover_size(image_size(CITY_IMAGE))
+    witch = cover_size(image_size(WITCH_IMAGE))
+    return {(CITY_IMAGE, city, False, False), (CITY_CORRUPTED_IMAGE, city, False, False),
+            (WITCH_IMAGE, witch, False, False)}
+
 
 class Cutscene:
     def __init__(self, screen):
@@ -9,41 +37,14 @@ class Cutscene:
         # ----- Cutscene state -----
         self.current_scene = "opening"  # "opening", "witch_dialogue", "complete"
         
-        # ----- Load backgrounds and SCALE THEM -----
-        self.bg_normal = pygame.image.load("assets/cutscenes/zethia_city.png").convert_alpha()
-        self.bg_corrupted = pygame.image.load("assets/cutscenes/zethia_city_corrupted.png").convert_alpha()
-        self.bg_witch = pygame.image.load("assets/cutscenes/witch_cutscene.png").convert_alpha()
-
-        # --- SCALE to cover entire screen (maintains aspect ratio) ---
-        # Calculate scale ratio to cover entire screen (no black bars)
-        screen_ratio = SCREEN_WIDTH / SCREEN_HEIGHT
-        
-        # Scale opening backgrounds
-        bg_ratio = self.bg_normal.get_width() / self.bg_normal.get_height()
-        if bg_ratio > screen_ratio:
-            scale_ratio = SCREEN_WIDTH / self.bg_normal.get_width()
-            new_width = SCREEN_WIDTH
-            new_height = int(self.bg_normal.get_height() * scale_ratio)
-        else:
-            scale_ratio = SCREEN_HEIGHT / self.bg_normal.get_height()
-            new_width = int(self.bg_normal.get_width() * scale_ratio)
-            new_height = SCREEN_HEIGHT
-
-        self.bg_normal = pygame.transform.scale(self.bg_normal, (new_width, new_height))
-        self.bg_corrupted = pygame.transform.scale(self.bg_corrupted, (new_width, new_height))
-
-        # Scale witch background
-        witch_ratio = self.bg_witch.get_width() / self.bg_witch.get_height()
-        if witch_ratio > screen_ratio:
-            witch_scale = SCREEN_WIDTH / self.bg_witch.get_width()
-            witch_width = SCREEN_WIDTH
-            witch_height = int(self.bg_witch.get_height() * witch_scale)
-        else:
-            witch_scale = SCREEN_HEIGHT / self.bg_witch.get_height()
-            witch_width = int(self.bg_witch.get_width() * witch_scale)
-            witch_height = SCREEN_HEIGHT
-
-        self.bg_witch = pygame.transform.scale(self.bg_witch, (witch_width, witch_height))
+        # ----- Load backgrounds scaled to cover the entire screen -----
+        # (baked ahead of time by tools/bake.py when available)
+        self.scope = AssetScope("cutscene")
+        new_width, new_height = cover_size(image_size(CITY_IMAGE))
+        witch_width, witch_height = cover_size(image_size(WITCH_IMAGE))
+        self.bg_normal = self.scope.image(CITY_IMAGE, scale=(new_width, new_height))
+        self.bg_corrupted = self.scope.image(CITY_CORRUPTED_IMAGE, scale=(new_width, new_height))
+        self.bg_witch = self.scope.image(WITCH_IMAGE, scale=(witch_width, witch_height))
 
         # Position to center the backgrounds (may crop edges)
         self.bg_x = (SCREEN_WIDTH - new_width) // 2
@@ -141,8 +142,8 @@ class Cutscene:
         self.continue_prompt_font = pygame.font.Font(None, 30)
 
         # Text display surfaces
-        self.text_surface = pygame.Surface((SCREEN_WIDTH - 160, 100), pygame.SRCALPHA)
-        self.dialogue_surface = pygame.Surface((SCREEN_WIDTH - 200, 120), pygame.SRCALPHA)
+        self.text_surface = memory.surface((SCREEN_WIDTH - 160, 100), pygame.SRCALPHA, owner="cutscene.ui")
+        self.dialogue_surface = memory.surface((SCREEN_WIDTH - 200, 120), pygame.SRCALPHA, owner="cutscene.ui")
 
         # Text box positions
         self.opening_text_rect = pygame.Rect(80, SCREEN_HEIGHT - 150, SCREEN_WIDTH - 160, 100)
@@ -151,20 +152,42 @@ class Cutscene:
         # Witch scene specific
         self.witch_scene_started = False
         self.name_tag_font = pygame.font.Font(None, 34)
-        self.name_tag_surface = pygame.Surface((200, 40), pygame.SRCALPHA)
+        self.name_tag_surface = self.render_name_tag("Mae")
+        self.dialogue_bg = memory.surface(self.dialogue_rect.size, pygame.SRCALPHA, owner="cutscene.ui")
+        self.dialogue_bg.fill((20, 15, 40, 220))  # Darker purple for witch dialogue
+        # Add a magical border
+        pygame.draw.rect(self.dialogue_bg, (180, 140, 255, 180), 
+                        (0, 0, self.dialogue_rect.width, self.dialogue_rect.height), 3)
+        self.fade_surface = memory.surface((SCREEN_WIDTH, SCREEN_HEIGHT), owner="cutscene.ui")
+        self.fade_surface.fill((0, 0, 0))
+
+    def render_name_tag(self, name):
+        """Speaker name on a decorative background, drawn once"""
+        tag = memory.surface((200, 40), pygame.SRCALPHA, owner="cutscene.ui")
+        name_surface = self.name_tag_font.render(name, True, (220, 180, 255))
+        
+        # Create a decorative name tag background
+        name_bg = memory.surface((name_surface.get_width() + 30, name_surface.get_height() + 15), pygame.SRCALPHA, owner="cutscene.ui")
+        name_bg.fill((30, 20, 50, 220))  # Dark purple background
+        # Add a border
+        pygame.draw.rect(name_bg, (180, 140, 255, 150), (0, 0, name_bg.get_width(), name_bg.get_height()), 2)
+        
+        tag.blit(name_bg, (0, 0))
+        tag.blit(name_surface, (15, 8))
+        return tag
 
     # ----------------------------------------------------
     # PARTICLES
     # ----------------------------------------------------
     def update_particles(self, dt):
         # Random chance to create new floating particles
-        if random.random() < 0.08:
+        if rng.random() < 0.08:
             self.particles.append({
-                "x": random.randint(0, SCREEN_WIDTH),
+                "x": rng.randint(0, SCREEN_WIDTH),
                 "y": SCREEN_HEIGHT + 20,
-                "speed": random.uniform(20, 50),
-                "alpha": random.randint(150, 230),
-                "size": random.randint(2, 5),
+                "speed": rng.uniform(20, 50),
+                "alpha": rng.randint(150, 230),
+                "size": rng.randint(2, 5),
                 "color": (255, 200, 130)  # Warm light
             })
 
@@ -181,25 +204,26 @@ class Cutscene:
     # ----------------------------------------------------
     def update_magic_particles(self, dt):
         # Create magical energy particles around Mae
-        if random.random() < 0.12 and self.current_scene == "witch_dialogue":
+        if rng.random() < 0.12 and self.current_scene == "witch_dialogue":
             # Particles emanate from center/bottom of screen
-            angle = random.uniform(0, 2 * 3.14159)
-            distance = random.uniform(100, 300)
-            speed = random.uniform(40, 100)
+            angle = rng.uniform(0, 2 * 3.14159)
+            distance = rng.uniform(100, 300)
+            speed = rng.uniform(40, 100)
             
             self.magic_particles.append({
-                "x": SCREEN_WIDTH // 2 + distance * random.uniform(-0.5, 0.5),
+                "x": SCREEN_WIDTH // 2 + distance * rng.uniform(-0.5, 0.5),
                 "y": SCREEN_HEIGHT - 100,
-                "speed_x": random.uniform(-30, 30),
-                "speed_y": random.uniform(-speed, -speed * 0.3),
-                "alpha": random.randint(180, 255),
-                "size": random.randint(3, 8),
+                "speed_x": rng.uniform(-30, 30),
+                "speed_y": rng.uniform(-speed, -speed * 0.3),
+                "alpha": rng.randint(180, 255),
+                "size": rng.randint(3, 8),
+                # Coarse steps so the particles share effect-cache surfaces
                 "color": (
-                    random.randint(150, 255),  # R
-                    random.randint(100, 200),  # G
-                    random.randint(200, 255)   # B (magical blue-purple)
+                    rng.randrange(150, 256, 15),  # R
+                    rng.randrange(100, 201, 10),  # G
+                    rng.randrange(200, 256, 11)   # B (magical blue-purple)
                 ),
-                "life": random.uniform(1.0, 2.0)
+                "life": rng.uniform(1.0, 2.0)
             })
 
         # Update magic particles
@@ -264,19 +288,13 @@ class Cutscene:
     # ----------------------------------------------------
     # UPDATE CUTSCENE LOGIC
     # ----------------------------------------------------
-    def update(self, dt, events=None):
+    def advance(self):
+        """Spacebar: finish the current line or move to the next one"""
+        self.space_pressed = True
+
+    def update(self, dt):
         # Reset space handled flag at start of update
         self.space_handled = False
-        
-        # Check for spacebar input using events (more reliable)
-        if events is None:
-            events = pygame.event.get()
-            
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    self.space_pressed = True
-                    self.space_handled = False  # Reset for new press
 
         # Fade in cutscene at start
         if self.cutscene_fade_alpha > 0:
@@ -333,13 +351,12 @@ class Cutscene:
 
         # DRAW CORRUPTED VERSION OVER IT
         if self.use_corrupted:
-            corrupted = self.bg_corrupted.copy()
-            corrupted.set_alpha(self.fade_alpha)
-            self.screen.blit(corrupted, (self.bg_x - self.cam_x, self.bg_y))
+            # Only this scene uses the image, so fade it in place rather than copying it
+            self.bg_corrupted.set_alpha(self.fade_alpha)
+            self.screen.blit(self.bg_corrupted, (self.bg_x - self.cam_x, self.bg_y))
 
         # DRAW PARTICLES
         for p in self.particles:
-            s = pygame.Surface((p["size"], p["size"]), pygame.SRCALPHA)
             # Get color values and ensure they are valid integers in 0-255 range
             try:
                 r = int(p["color"][0])
@@ -353,17 +370,14 @@ class Cutscene:
                 b = max(0, min(255, b))
                 a = max(0, min(255, a))
                 
-                rgba_color = (r, g, b, a)
-                s.fill(rgba_color)
+                s = effects.get("rect", (p["size"], p["size"]), (r, g, b), a)
                 self.screen.blit(s, (p["x"], p["y"]))
             except (ValueError, TypeError, KeyError):
                 # Skip this particle if there's an error
                 continue
 
         # DRAW TEXT BOX BACKGROUND
-        text_bg_surface = pygame.Surface((self.opening_text_rect.width, self.opening_text_rect.height), pygame.SRCALPHA)
-        text_bg_surface.fill((0, 0, 0, 200))
-        self.screen.blit(text_bg_surface, self.opening_text_rect)
+        self.screen.blit(effects.get("rect", self.opening_text_rect.size, (0, 0, 0), 200), self.opening_text_rect)
 
         # DRAW TEXT
         self.text_surface.fill((0, 0, 0, 0))
@@ -403,13 +417,11 @@ class Cutscene:
         self.screen.fill((0, 0, 0))
         
         # DRAW WITCH BACKGROUND WITH FADE IN
-        witch_bg = self.bg_witch.copy()
-        witch_bg.set_alpha(self.witch_scene_alpha)
-        self.screen.blit(witch_bg, (self.witch_bg_x, self.witch_bg_y))
+        self.bg_witch.set_alpha(self.witch_scene_alpha)
+        self.screen.blit(self.bg_witch, (self.witch_bg_x, self.witch_bg_y))
 
         # DRAW MAGIC PARTICLES
         for p in self.magic_particles:
-            s = pygame.Surface((p["size"], p["size"]), pygame.SRCALPHA)
             # Get color values and ensure they are valid integers in 0-255 range
             try:
                 r = int(p["color"][0])
@@ -423,38 +435,19 @@ class Cutscene:
                 b = max(0, min(255, b))
                 a = max(0, min(255, a))
                 
-                rgba_color = (r, g, b, a)
-                s.fill(rgba_color)
+                s = effects.get("rect", (p["size"], p["size"]), (r, g, b), a)
                 self.screen.blit(s, (p["x"], p["y"]))
             except (ValueError, TypeError, KeyError):
                 # Skip this particle if there's an error
                 continue
 
         # DRAW NAME TAG (Mae:)
-        self.name_tag_surface.fill((0, 0, 0, 0))
-        name_text = "Mae"
-        name_surface = self.name_tag_font.render(name_text, True, (220, 180, 255))
-        
-        # Create a decorative name tag background
-        name_bg = pygame.Surface((name_surface.get_width() + 30, name_surface.get_height() + 15), pygame.SRCALPHA)
-        name_bg.fill((30, 20, 50, 220))  # Dark purple background
-        # Add a border
-        pygame.draw.rect(name_bg, (180, 140, 255, 150), (0, 0, name_bg.get_width(), name_bg.get_height()), 2)
-        
-        self.name_tag_surface.blit(name_bg, (0, 0))
-        self.name_tag_surface.blit(name_surface, (15, 8))
-        
         # Position name tag above dialogue box
         self.screen.blit(self.name_tag_surface, 
                         (self.dialogue_rect.x + 20, self.dialogue_rect.y - 50))
 
         # DRAW DIALOGUE BOX BACKGROUND
-        dialogue_bg = pygame.Surface((self.dialogue_rect.width, self.dialogue_rect.height), pygame.SRCALPHA)
-        dialogue_bg.fill((20, 15, 40, 220))  # Darker purple for witch dialogue
-        # Add a magical border
-        pygame.draw.rect(dialogue_bg, (180, 140, 255, 180), 
-                        (0, 0, self.dialogue_rect.width, self.dialogue_rect.height), 3)
-        self.screen.blit(dialogue_bg, self.dialogue_rect)
+        self.screen.blit(self.dialogue_bg, self.dialogue_rect)
 
         # DRAW DIALOGUE TEXT
         self.dialogue_surface.fill((0, 0, 0, 0))
@@ -502,7 +495,7 @@ class Cutscene:
 
         # DRAW CONTINUE PROMPT (blinking)
         if self.current_line_complete and not self.finished:
-            blink = (pygame.time.get_ticks() // 500) % 2 == 0
+            blink = (clock.ticks() // 500) % 2 == 0
             if blink:
                 prompt_text = "Press SPACE to continue"
                 prompt_surface = self.continue_prompt_font.render(prompt_text, True, 
@@ -514,10 +507,8 @@ class Cutscene:
 
         # DRAW CUTSCENE FADE (fades in at start)
         if self.cutscene_fade_alpha > 0:
-            fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(self.cutscene_fade_alpha)
-            self.screen.blit(fade_surface, (0, 0))
+            self.fade_surface.set_alpha(self.cutscene_fade_alpha)
+            self.screen.blit(self.fade_surface, (0, 0))
 
     # ----------------------------------------------------
     # CHECK IF CUTSCENE IS COMPLETE
@@ -525,6 +516,13 @@ class Cutscene:
     def is_complete(self):
         return self.finished
 
+    # ----------------------------------------------------
+    # RELEASE BACKGROUNDS (when the cutscene unloads)
+    # ----------------------------------------------------
+    def release(self):
+        self.bg_normal = self.bg_corrupted = self.bg_witch = None
+        self.scope.release()
+
     # ----------------------------------------------------
     # RESET CUTSCENE (for replayability)
     # ----------------------------------------------------
@@ -1,7 +1,15 @@
 import pygame
-import math, random
+import math
 from core import settings, utils
-from core.background_manager import BackgroundManager
+from core.parallax import ParallaxEngine
+from world.scenes import MENU_SKY
+from core.memory import memory
+from core.effects import effects
+from core.clock import clock
+from core.input_handler import inputs
+from core.rng import streams
+
+rng = streams.stream("menu")
 
 class StartMenu:
     def __init__(self, screen):
@@ -26,13 +34,13 @@ class StartMenu:
         self.button_rects = []
 
         # --- Background & HUD ---
-        self.bg = BackgroundManager(screen)
+        self.bg = ParallaxEngine(MENU_SKY, screen.get_size())
         self.version_text = self.hud_font.render("ZETHIA v1.0.0", True, (220, 220, 220))
 
         # --- Intro Animation ---
         self.intro_stage = 0
         self.intro_timer = 0
-        self.fade_surface = pygame.Surface(screen.get_size())
+        self.fade_surface = memory.surface(screen.get_size(), owner="menu.ui")
         self.fade_surface.fill((0, 0, 0))
         self.fade_alpha = 255
 
@@ -46,7 +54,6 @@ class StartMenu:
 
         # --- 8-bit Particle System ---
         self.particles = []
-        self.particle_cache = {}
         # Limited 8-bit color palette
         self.particle_colors = [
             (255, 200, 80, 160),   # Gold
@@ -75,53 +82,43 @@ class StartMenu:
         """Pre-render 8-bit style elements"""
         # Version text with simple shadow
         version_shadow = self.hud_font.render("ZETHIA v1.0.0", True, (0, 0, 0, 150))
-        self.version_text_cached = pygame.Surface(
+        self.version_text_cached = memory.surface(
             (version_shadow.get_width() + 2, version_shadow.get_height() + 2), 
-            pygame.SRCALPHA
+            pygame.SRCALPHA, owner="menu.ui"
         )
         self.version_text_cached.blit(version_shadow, (1, 1))
         self.version_text_cached.blit(self.version_text, (0, 0))
-        
-        # Cache simple particle shapes (squares for 8-bit)
-        for size in range(2, 5):
-            for color in self.particle_colors:
-                key = (size, color[:3])
-                if key not in self.particle_cache:
-                    surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                    # Square particles for 8-bit
-                    pygame.draw.rect(surface, color, (0, 0, size * 2, size * 2))
-                    self.particle_cache[key] = surface
 
     # -------------------------------------------------------------------------
     def button_hovered(self, index):
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = inputs.mouse
         return len(self.button_rects) > index and self.button_rects[index].collidepoint(mouse_pos)
 
     # -------------------------------------------------------------------------
     def spawn_particle(self):
         """Spawn 8-bit style particles"""
-        current_time = pygame.time.get_ticks()
+        current_time = clock.ticks()
         if current_time - self.last_particle_spawn < 80:  # Slower spawn
             return
             
         self.last_particle_spawn = current_time
         
         # Simple spawn patterns
-        side = random.choice(["top", "right"])
+        side = rng.choice(["top", "right"])
         if side == "top":
-            x = random.randint(-20, self.screen.get_width() + 20)
+            x = rng.randint(-20, self.screen.get_width() + 20)
             y = -10
-            speed_x = random.uniform(-0.1, 0.1)
-            speed_y = random.uniform(0.05, 0.15)
+            speed_x = rng.uniform(-0.1, 0.1)
+            speed_y = rng.uniform(0.05, 0.15)
         else:  # right
             x = self.screen.get_width() + 10
-            y = random.randint(0, self.screen.get_height())
-            speed_x = random.uniform(-0.3, -0.05)
-            speed_y = random.uniform(-0.05, 0.05)
+            y = rng.randint(0, self.screen.get_height())
+            speed_x = rng.uniform(-0.3, -0.05)
+            speed_y = rng.uniform(-0.05, 0.05)
         
-        color = random.choice(self.particle_colors)
-        size = random.randint(2, 4)  # Smaller
-        lifetime = random.randint(300, 500)
+        color = rng.choice(self.particle_colors)
+        size = rng.randint(2, 4)  # Smaller
+        lifetime = rng.randint(300, 500)
         
         self.particles.append({
             "pos": [x, y], 
@@ -157,20 +154,16 @@ class StartMenu:
         """Draw 8-bit style particles"""
         for particle in self.particles:
             life_ratio = particle["life"] / particle["max_life"]
-            alpha = int(255 * life_ratio)
-            
-            # Get cached square particle
-            key = (particle["size"], particle["color"][:3])
-            if key in self.particle_cache:
-                surface = self.particle_cache[key].copy()
-                surface.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
-                
-                self.screen.blit(surface, 
-                               (particle["pos"][0] - particle["size"],
-                                particle["pos"][1] - particle["size"]))
+            color, size = particle["color"], particle["size"]
+
+            # Square particles for 8-bit, faded from the shared effect cache
+            surface = effects.get("rect", (size * 2, size * 2), color[:3], color[3] * life_ratio)
+            self.screen.blit(surface, 
+                           (particle["pos"][0] - size,
+                            particle["pos"][1] - size))
 
     # -------------------------------------------------------------------------
-    def update(self, events, dt):
+    def update(self, dt):
         # Update FPS
         self.frame_times.append(dt)
         if len(self.frame_times) > 30:
@@ -195,31 +188,40 @@ class StartMenu:
         self.selection_pulse += dt * 0.002
         self.menu_glow_timer += dt * 0.001
 
-        # Menu controls
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    self.selected_index = (self.selected_index - 1) % len(self.buttons)
-                elif event.key == pygame.K_DOWN:
-                    self.selected_index = (self.selected_index + 1) % len(self.buttons)
-                elif event.key == pygame.K_RETURN:
-                    if self.selected_index == 0:
-                        return "Start Game"
-                    elif self.selected_index == 1:
-                        return "Quit"
-
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                mx, my = event.pos
-                for i, rect in enumerate(self.button_rects):
-                    if rect.collidepoint(mx, my):
-                        return "Start Game" if i == 0 else "Quit"
+    # -------------------------------------------------------------------------
+    # Menu controls (called by the menu state's input handlers)
+    @property
+    def ready(self):
+        """Whether the intro is over and the buttons take input"""
+        return self.intro_stage >= 2
+
+    def select(self, step):
+        if self.ready:
+            self.selected_index = (self.selected_index + step) % len(self.buttons)
+
+    def activate(self):
+        """"Start Game" or "Quit" for the selected button; None during the intro"""
+        if self.ready:
+            return "Start Game" if self.selected_index == 0 else "Quit"
+        return None
 
+    def click(self, pos):
+        """"Start Game" or "Quit" for the button under ``pos``, if any"""
+        if self.ready:
+            for i, rect in enumerate(self.button_rects):
+                if rect.collidepoint(pos):
+                    return "Start Game" if i == 0 else "Quit"
         return None
 
+    # -------------------------------------------------------------------------
+    def release(self):
+        """Free the menu sky once the menu is no longer needed"""
+        self.bg.release()
+
     # -------------------------------------------------------------------------
     def draw(self, dt):
         # --- Background ---
-        self.bg.update_and_draw(dt)
+        self.bg.update_and_draw(self.screen, dt)
 
         # --- Update Particles ---
         self.update_particles(dt)
@@ -231,7 +233,7 @@ class StartMenu:
                 logo_text = "ZETHIAN PRODUCTION"  # Uppercase
                 
                 # Simple 8-bit intro
-                intro_surface = pygame.Surface((self.screen.get_width(), 100), pygame.SRCALPHA)
+                intro_surface = memory.surface((self.screen.get_width(), 100), pygame.SRCALPHA, owner="menu.ui")
                 
                 # Main text with simple shadow
                 main_font = pygame.font.Font("assets/fonts/8-bitanco.ttf", 32)
@@ -276,7 +278,7 @@ class StartMenu:
         container_height = 120
         
         # Create pixelated container
-        container = pygame.Surface((container_width, container_height), pygame.SRCALPHA)
+        container = memory.surface((container_width, container_height), pygame.SRCALPHA, owner="menu.ui")
         
         # Pixel border
         border_color = (255, 200, 150, self.container_alpha)
@@ -300,11 +302,11 @@ class StartMenu:
                                    (x, y, 4, 4))
         
         # Scale and position
-        scaled_container = pygame.transform.scale(
+        scaled_container = memory.track(pygame.transform.scale(
             container, 
             (int(container_width * self.container_scale), 
              int(container_height * self.container_scale))
-        )
+        ), "menu.ui")
         c_rect = scaled_container.get_rect(center=(self.screen.get_width() // 2, 140))
         self.screen.blit(scaled_container, c_rect)
 
@@ -357,9 +359,9 @@ class StartMenu:
                 border_color = (255, 200, 100)
                 
                 # Draw button background
-                button_bg = pygame.Surface((self.button_rects[i].width + 40,
+                button_bg = memory.surface((self.button_rects[i].width + 40,
                                           self.button_rects[i].height + 20),
-                                          pygame.SRCALPHA)
+                                          pygame.SRCALPHA, owner="menu.ui")
                 
                 # Solid fill
                 pygame.draw.rect(button_bg, bg_color, (0, 0, button_bg.get_width(), button_bg.get_height()))
@@ -415,7 +417,7 @@ class StartMenu:
         self.screen.blit(fps_render, (settings.WIDTH - 71, 10))
         
         # Control hints (simple)
-        if self.intro_stage == 2 and pygame.time.get_ticks() % 6000 < 3000:
+        if self.intro_stage == 2 and clock.ticks() % 6000 < 3000:
             hint_text = "ARROWS/CLICK - ENTER TO SELECT"
             hint_render = self.hud_font.render(hint_text, True, (180, 180, 200, 120))
             hint_rect = hint_render.get_rect(center=(self.screen.get_width() // 2, 
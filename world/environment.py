@@ -1,27 +1,29 @@
-import pygame
-import random
 import math
 from core.settings import *
+from core.effects import effects
+from core.clock import clock
+from core.rng import streams
+
+rng = streams.stream("environment")
 
 class WindParticle:
     def __init__(self):
-        self.x = random.uniform(0, WIDTH)
-        self.y = random.uniform(0, HEIGHT)
-        self.speed = random.uniform(40, 80)
-        self.alpha = random.randint(80, 150)
-        self.size = random.randint(2, 5)
+        self.x = rng.uniform(0, WIDTH)
+        self.y = rng.uniform(0, HEIGHT)
+        self.speed = rng.uniform(40, 80)
+        self.alpha = rng.randint(80, 150)
+        self.size = rng.randint(2, 5)
+        self.image = effects.get("circle", (self.size, self.size), (255, 255, 255), self.alpha)
 
     def update(self, dt):
         self.x += self.speed * dt / 1000
-        self.y += math.sin(pygame.time.get_ticks() * 0.002) * 0.2
+        self.y += math.sin(clock.ticks() * 0.002) * 0.2
         if self.x > WIDTH:
             self.x = -10
-            self.y = random.uniform(0, HEIGHT)
+            self.y = rng.uniform(0, HEIGHT)
 
     def draw(self, surface):
-        particle_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        pygame.draw.circle(particle_surface, (255, 255, 255, self.alpha), (self.size // 2, self.size // 2), self.size // 2)
-        surface.blit(particle_surface, (self.x, self.y))
+        surface.blit(self.image, (self.x, self.y))
 
 class Environment:
     def __init__(self, count=30):
@@ -0,0 +1,48 @@
+from core.settings import *
+from core.parallax import GradientLayer, SunLayer, StripLayer, ParticleLayer
+from core.background_manager import MountainRange, FloatingIslands, WindParticle, GlowParticle
+from world.sky_layers import StarField, LightRays, BirdFlock, ButterflySwarm, TerrainLayer, GroundFade
+
+# -------------------------------------------------------------
+# Scene definitions for the ParallaxEngine, drawn back to front
+# -------------------------------------------------------------
+
+# 8-bit sky behind the start menu
+MENU_SKY = {
+    "name": "menu_sky",
+    "layers": [
+        {"type": GradientLayer, "stops": [(70, 110, 180), (180, 200, 240)], "steps": 8, "quantize": 32},
+        {"type": SunLayer, "pos": (180, 150), "radius": 60, "style": "pixel"},
+        {"type": StripLayer, "image": "assets/backgrounds/clouds_far.png", "speed": 6, "pixelate": True},
+        {"type": StripLayer, "image": "assets/backgrounds/fl_island1.png", "speed": 10, "pixelate": True},
+        {"type": MountainRange, "name": "hills", "num_hills": 4},
+        {"type": FloatingIslands, "count": 2, "image": "assets/backgrounds/fl_island1.png"},
+        {"type": ParticleLayer, "particle": WindParticle, "count": 8},
+        {"type": ParticleLayer, "particle": GlowParticle, "count": 6},
+    ],
+}
+
+SUN_POS = (WIDTH * 0.8, HEIGHT * 0.3)
+
+# Sunset sky behind gameplay
+GAMEPLAY_SKY = {
+    "name": "gameplay_sky",
+    "layers": [
+        {"type": GradientLayer, "stops": [(90, 160, 240), (180, 200, 255), (255, 180, 100)]},
+        {"type": StarField, "count": 40},
+        {"type": SunLayer, "pos": SUN_POS, "radius": 80, "style": "glow", "glow_radius": 180},
+        {"type": LightRays, "origin": SUN_POS, "count": 8},
+        {"type": StripLayer, "image": "assets/backgrounds/parallax_layers/clouds_far.png",
+         "speed": 10, "period": WIDTH},
+        {"type": StripLayer, "image": "assets/backgrounds/parallax_layers/clouds_mid.png",
+         "speed": 20, "period": WIDTH, "y": 80},
+        {"type": BirdFlock, "count": 4},
+        {"type": TerrainLayer, "name": "terrain", "speed": 15, "scale": 2.6, "y_offset": 160,
+         "images": ["assets/backgrounds/parallax_layers/mountain1.png",
+                    "assets/backgrounds/parallax_layers/mountain2.png"]},
+        {"type": ButterflySwarm, "count": 5},
+        {"type": StripLayer, "image": "assets/backgrounds/parallax_layers/trees_close.png",
+         "speed": 40, "period": WIDTH, "scale": 2.3, "smooth": True, "y": 50, "align_bottom": True},
+        {"type": GroundFade, "height": 200},
+    ],
+}
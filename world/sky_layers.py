@@ -0,0 +1,234 @@
+import pygame
+import math
+import numpy as np
+from world.terrain import TerrainStrip
+from core.memory import memory
+from core.rng import streams
+
+rng = streams.stream("sky")
+np_rng = streams.numpy("sky")
+
+
+class StarField:
+    """Twinkling stars in the upper sky, one entity per star"""
+
+    uses_world = True
+
+    def __init__(self, scope, view_size, world, count=40):
+        width, height = view_size
+        self.world = world
+        mask = world.mask_of("transform", "sprite", "animation")
+        self.ids = np.array([world.create(mask) for _ in range(count)], dtype=int)
+        ids = self.ids
+        world.transform.x[ids] = np_rng.randint(0, width + 1, count)
+        world.transform.y[ids] = np_rng.randint(0, height // 3 + 1, count)
+        world.sprite.scale[ids] = np_rng.uniform(1.0, 2.5, count)  # Smaller size range
+        world.animation.speed[ids] = np_rng.uniform(0.5, 1.5, count)  # Slower twinkle
+        world.animation.phase[ids] = np_rng.uniform(0.0, 6.28, count)
+
+    def update(self, dt):
+        pass
+
+    def draw(self, surface):
+        world = self.world
+        ids = self.ids
+        brightness = 0.5 + 0.5 * np.sin(world.animation.phase[ids])
+        visible = brightness > 0.1  # Only draw if visible
+        ids = ids[visible]
+        radii = (world.sprite.scale[ids] * brightness[visible]).astype(int).tolist()
+        xs = world.transform.x[ids].astype(int).tolist()
+        ys = world.transform.y[ids].astype(int).tolist()
+        for x, y, r in zip(xs, ys, radii):
+            pygame.draw.circle(surface, (255, 255, 255), (x, y), r)
+
+
+class LightRays:
+    """Magical light rays pulsing out of the sun; half are drawn each half second"""
+
+    def __init__(self, scope, view_size, origin, count=8):
+        self.origin = origin
+        self.timer = 0.0
+        self.elapsed_ms = 0
+        self.rays = []
+        for i in range(count):
+            self.rays.append({
+                "angle": math.radians(rng.uniform(0, 360)),
+                "length": rng.uniform(80, 200),  # Shorter rays
+                "alpha": rng.randint(30, 80),  # Less opaque
+                "pulse_speed": rng.uniform(0.3, 1.0),  # Slower pulse
+                "pulse_offset": rng.uniform(0.0, 6.28),
+                "width": rng.uniform(2, 6),  # Thinner
+                "group": i % 2
+            })
+
+    def update(self, dt):
+        self.timer += dt * 0.001
+        self.elapsed_ms += dt
+
+    def draw(self, surface):
+        ox, oy = self.origin
+        group = self.elapsed_ms % 1000 // 500
+        for ray in self.rays:
+            if ray["group"] != group:
+                continue
+            pulse = 0.5 + 0.5 * math.sin(self.timer * ray["pulse_speed"] + ray["pulse_offset"])
+            ray_length = ray["length"] * pulse
+            end_x = ox + math.cos(ray["angle"]) * ray_length
+            end_y = oy + math.sin(ray["angle"]) * ray_length
+
+            # Draw simple line instead of polygon
+            pygame.draw.line(surface, (255, 230, 180),
+                           (ox, oy), (end_x, end_y), int(ray["width"]))
+
+
+class BirdFlock:
+    """Small birds crossing the upper sky"""
+
+    uses_world = True
+
+    def __init__(self, scope, view_size, world, count=4):
+        self.width, self.height = view_size
+        self.world = world
+        mask = world.mask_of("transform", "velocity", "sprite", "animation")
+        self.ids = np.array([world.create(mask) for _ in range(count)], dtype=int)
+        ids = self.ids
+        world.transform.x[ids] = np_rng.randint(-100, self.width + 1, count)
+        world.transform.y[ids] = np_rng.randint(50, self.height // 4 + 1, count)
+        world.velocity.vx[ids] = np_rng.uniform(40, 80, count)  # Faster to reduce screen time
+        world.velocity.vy[ids] = 0
+        world.sprite.scale[ids] = np_rng.uniform(0.8, 1.2, count)
+        world.animation.phase[ids] = np_rng.uniform(0.0, 6.28, count)
+        world.animation.speed[ids] = np_rng.uniform(2.0, 3.0, count)  # Slower flapping
+
+    def update(self, dt):
+        world = self.world
+        gone = self.ids[world.transform.x[self.ids] > self.width + 100]
+        if len(gone):
+            world.transform.x[gone] = -100
+            world.transform.y[gone] = np_rng.randint(50, self.height // 4 + 1, len(gone))
+
+    def draw(self, surface):
+        world = self.world
+        ids = self.ids
+        xs = world.transform.x[ids].tolist()
+        ys = world.transform.y[ids].tolist()
+        sizes = (8 * world.sprite.scale[ids]).tolist()
+        flaps = (3 * np.sin(world.animation.phase[ids])).tolist()
+        for x, y, size, flap in zip(xs, ys, sizes, flaps):
+            # Simple triangle instead of V shape
+            points = [(x, y), (x - size, y + size + flap), (x + size, y + size + flap)]
+            pygame.draw.polygon(surface, (50, 50, 70), points, 0)
+
+
+class ButterflySwarm:
+    """Butterflies fluttering over the lower half of the view"""
+
+    uses_world = True
+
+    def __init__(self, scope, view_size, world, count=5):
+        self.width, self.height = view_size
+        self.world = world
+        mask = world.mask_of("transform", "velocity", "sprite", "animation")
+        self.ids = np.array([world.create(mask) for _ in range(count)], dtype=int)
+        ids = self.ids
+        world.transform.x[ids] = np_rng.randint(0, self.width + 1, count)
+        world.transform.y[ids] = np_rng.randint(self.height // 2, self.height - 200 + 1, count)
+        world.velocity.vx[ids] = np_rng.uniform(-15, 15, count)  # Slower movement
+        world.velocity.vy[ids] = np_rng.uniform(-10, 10, count)
+        world.sprite.scale[ids] = np_rng.uniform(0.6, 0.9, count)  # Smaller
+        world.sprite.r[ids] = np_rng.randint(200, 256, count)
+        world.sprite.g[ids] = np_rng.randint(150, 221, count)
+        world.sprite.b[ids] = np_rng.randint(100, 181, count)
+        world.animation.phase[ids] = np_rng.uniform(0.0, 6.28, count)
+        world.animation.speed[ids] = np_rng.uniform(2.0, 4.0, count)  # Slower flapping
+
+    def update(self, dt):
+        world = self.world
+        ids = self.ids
+        x = world.transform.x[ids]
+        y = world.transform.y[ids]
+
+        # Bounce off edges
+        flip_x = ids[(x < 0) | (x > self.width)]
+        flip_y = ids[(y < self.height // 2) | (y > self.height - 100)]
+        world.velocity.vx[flip_x] *= -1
+        world.velocity.vy[flip_y] *= -1
+
+    def draw(self, surface):
+        world = self.world
+        ids = self.ids
+        xs = world.transform.x[ids].tolist()
+        ys = world.transform.y[ids].tolist()
+        sizes = world.sprite.scale[ids].tolist()
+        flaps = (3 * np.sin(world.animation.phase[ids])).tolist()
+        colors = zip(world.sprite.r[ids].tolist(), world.sprite.g[ids].tolist(), world.sprite.b[ids].tolist())
+        for x, y, size, flap, color in zip(xs, ys, sizes, flaps, colors):
+            wing = int(8 * size)
+            wing_y = int(y + flap)
+            # Draw simple circles for wings
+            pygame.draw.circle(surface, color, (int(x - 8 * size), wing_y), wing)
+            pygame.draw.circle(surface, color, (int(x + 8 * size), wing_y), wing)
+
+            # Butterfly body
+            pygame.draw.circle(surface, (80, 60, 40), (int(x), int(y)), int(3 * size))
+
+
+class TerrainLayer:
+    """Streamed mountain strip resting on the bottom of the view"""
+
+    image_options = {"smooth": True}
+
+    def __init__(self, scope, view_size, images, speed, scale=1.0, y_offset=0, chunk_width=512):
+        surfaces = [scope.image(path, scale=scale, **self.image_options) for path in images]
+        self.speed = speed
+        self.y = view_size[1] - surfaces[0].get_height() + y_offset
+        self.terrain = TerrainStrip(surfaces, chunk_width=chunk_width)
+
+    def update(self, dt):
+        self.terrain.scroll(self.speed * dt / 1000)
+
+    def draw(self, surface):
+        self.terrain.draw(surface, self.y)
+
+
+class GroundFade:
+    """Warm fade over the ground with a few sparkles.
+
+    The gradient is baked once into a handful of variants with different
+    sparkle scatters, and the layer cycles through them every
+    ``interval_ms`` instead of re-drawing the gradient.
+    """
+
+    def __init__(self, scope, view_size, height=200, variants=4, interval_ms=1000):
+        width, view_h = view_size
+        self.y = view_h - height
+        self.interval_ms = interval_ms
+        self.elapsed_ms = 0
+
+        base = memory.surface((width, height), pygame.SRCALPHA, owner="ground_fade")
+        for i in range(height):
+            t = i / height
+            alpha = int(100 * t)
+            r = 245 * (1 - t) + 180 * t
+            g = 200 * (1 - t) + 140 * t
+            b = 150 * (1 - t) + 220 * t
+            pygame.draw.line(base, (int(r), int(g), int(b), alpha), (0, i), (width, i))
+
+        self.variants = []
+        for _ in range(variants):
+            fade = memory.track(base.copy(), "ground_fade")
+            # Add a few magical sparkles
+            for _ in range(10):
+                x = rng.randint(0, width)
+                y = rng.randint(0, height)
+                size = rng.uniform(1.0, 2.0)  # Smaller
+                brightness = rng.uniform(0.5, 0.8)  # Dimmer
+                pygame.draw.circle(fade, (255, 255, 200, int(100 * brightness)), (x, y), int(size))
+            self.variants.append(fade)
+
+    def update(self, dt):
+        self.elapsed_ms += dt
+
+    def draw(self, surface):
+        index = int(self.elapsed_ms // self.interval_ms) % len(self.variants)
+        surface.blit(self.variants[index], (0, self.y))
@@ -0,0 +1,71 @@
+import random
+from core.settings import *
+from core.rng import streams
+
+
+class TerrainStrip:
+    """Infinite mountain strip streamed in fixed-width chunks.
+
+    Each chunk is generated from its own seeded RNG, so a chunk that falls
+    out of the ring cache regenerates identically when it is needed again.
+    The visible chunks are found by index arithmetic on the scroll position
+    instead of scanning the whole pattern.
+    """
+
+    def __init__(self, images, chunk_width=512, seed=None, cache_size=8, overlap=300, gap_range=(60, 100)):
+        self.images = images
+        self.chunk_width = chunk_width
+        self.seed = seed if seed is not None else streams.stream("terrain").randrange(1 << 30)
+        self.overlap = overlap
+        self.gap_range = gap_range
+
+        # Widest image decides how far back a chunk can still reach on screen
+        self.max_width = max(img.get_width() for img in images)
+
+        # --- Ring cache: slot = chunk index % cache_size ---
+        self.cache_size = cache_size
+        self.cache_index = [None] * cache_size
+        self.cache_chunks = [None] * cache_size
+
+        self.scroll_x = 0.0  # camera position in world pixels
+
+    def _generate_chunk(self, index):
+        """Place mountains whose left edge falls inside this chunk."""
+        rng = random.Random(self.seed * 1000003 + index)
+        chunk = []
+        x = rng.randint(0, self.gap_range[0] // 2)
+        while x < self.chunk_width:
+            img = rng.choice(self.images)
+            chunk.append((x, img))
+            # Overlap slightly to blend smoothly
+            x += img.get_width() - self.overlap + rng.randint(*self.gap_range)
+        return chunk
+
+    def get_chunk(self, index):
+        slot = index % self.cache_size
+        if self.cache_index[slot] != index:
+            self.cache_chunks[slot] = self._generate_chunk(index)
+            self.cache_index[slot] = index
+        return self.cache_chunks[slot]
+
+    def visible_range(self, view_width=WIDTH):
+        """First and last chunk index that can touch the viewport."""
+        first = int((self.scroll_x - self.max_width) // self.chunk_width)
+        last = int((self.scroll_x + view_width) // self.chunk_width)
+        return first, last
+
+    def scroll(self, dx):
+        self.scroll_x += dx
+        # Generate one chunk ahead of the camera so it is ready before it shows
+        self.get_chunk(self.visible_range()[1] + 1)
+
+    def draw(self, surface, y):
+        view_width = surface.get_width()
+        first, last = self.visible_range(view_width)
+        camera_x = int(self.scroll_x)
+        for index in range(first, last + 1):
+            base_x = index * self.chunk_width - camera_x
+            for (x, img) in self.get_chunk(index):
+                draw_x = base_x + x
+                if draw_x + img.get_width() > 0 and draw_x < view_width:
+                    surface.blit(img, (draw_x, y))